@@ -0,0 +1,186 @@
+"""
+Config classes as they were before the immutable, interned value objects.
+
+Kept only as a baseline for bench_configs.py.
+"""
+
+from typing import List, Optional, Union
+
+from flet.core.animation import AnimationCurve
+from flet.core.transform import Offset
+from flet.core.types import Duration, DurationValue
+
+from flet_tilt import LightDirection, ShadowDirection, TiltDirection
+
+
+class LegacyTiltConfig:
+    def __init__(
+        self,
+        disable: Optional[bool] = None,
+        initial: Optional[Offset] = None,
+        angle: Optional[float] = None,
+        direction: Optional[List[Union[TiltDirection, str]]] = None,
+        enable_revert: Optional[bool] = None,
+        filter_quality: Optional[str] = None,
+        enable_gesture_sensors: Optional[bool] = None,
+        sensor_factor: Optional[float] = None,
+        enable_sensor_revert: Optional[bool] = None,
+        sensor_revert_factor: Optional[float] = None,
+        sensor_move_duration: Optional[DurationValue] = None,
+        enable_gesture_hover: Optional[bool] = None,
+        enable_gesture_touch: Optional[bool] = None,
+        enable_outside_area_move: Optional[bool] = None,
+        move_duration: Optional[DurationValue] = None,
+        leave_duration: Optional[DurationValue] = None,
+        move_curve: Optional[Union[AnimationCurve, str]] = None,
+        leave_curve: Optional[Union[AnimationCurve, str]] = None,
+        controller_move_duration: Optional[DurationValue] = None,
+        controller_leave_duration: Optional[DurationValue] = None,
+    ):
+        self.disable = disable
+        self.initial = initial
+        self.angle = angle
+        self.direction = direction
+        self.enable_revert = enable_revert
+        self.filter_quality = filter_quality
+        self.enable_gesture_sensors = enable_gesture_sensors
+        self.sensor_factor = sensor_factor
+        self.enable_sensor_revert = enable_sensor_revert
+        self.sensor_revert_factor = sensor_revert_factor
+        self.sensor_move_duration = sensor_move_duration
+        self.enable_gesture_hover = enable_gesture_hover
+        self.enable_gesture_touch = enable_gesture_touch
+        self.enable_outside_area_move = enable_outside_area_move
+        self.move_duration = move_duration
+        self.leave_duration = leave_duration
+        self.move_curve = move_curve
+        self.leave_curve = leave_curve
+        self.controller_move_duration = controller_move_duration
+        self.controller_leave_duration = controller_leave_duration
+
+    def to_dict(self) -> dict:
+
+        def duration_to_dict(duration):
+            if isinstance(duration, Duration):
+                return {
+                    "milliseconds": duration.milliseconds,
+                    "seconds": duration.seconds,
+                    "minutes": duration.minutes,
+                    "hours": duration.hours,
+                    "days": duration.days,
+                    "microseconds": duration.microseconds,
+                }
+            return duration
+
+        # Convert Offset to dx/dy format for Dart
+        initial_dict = None
+        if self.initial is not None:
+            if isinstance(self.initial, Offset):
+                initial_dict = {"dx": self.initial.x, "dy": self.initial.y}
+            else:
+                initial_dict = self.initial
+
+        return {
+            "disable": self.disable,
+            "initial": initial_dict,
+            "angle": self.angle,
+            "direction": [d.value if hasattr(d, "value") else d for d in self.direction]
+            if isinstance(self.direction, list)
+            else (
+                self.direction.value
+                if hasattr(self.direction, "value")
+                else self.direction
+            ),
+            "enable_revert": self.enable_revert,
+            "filter_quality": self.filter_quality,
+            "enable_gesture_sensors": self.enable_gesture_sensors,
+            "sensor_factor": self.sensor_factor,
+            "enable_sensor_revert": self.enable_sensor_revert,
+            "sensor_revert_factor": self.sensor_revert_factor,
+            "sensor_move_duration": duration_to_dict(self.sensor_move_duration),
+            "enable_gesture_hover": self.enable_gesture_hover,
+            "enable_gesture_touch": self.enable_gesture_touch,
+            "enable_outside_area_move": self.enable_outside_area_move,
+            "move_duration": duration_to_dict(self.move_duration),
+            "leave_duration": duration_to_dict(self.leave_duration),
+            "move_curve": self.move_curve.value
+            if hasattr(self.move_curve, "value")
+            else self.move_curve,
+            "leave_curve": self.leave_curve.value
+            if hasattr(self.leave_curve, "value")
+            else self.leave_curve,
+            "controller_move_duration": duration_to_dict(self.controller_move_duration),
+            "controller_leave_duration": duration_to_dict(
+                self.controller_leave_duration
+            ),
+        }
+
+
+class LegacyLightConfig:
+    def __init__(
+        self,
+        disable: Optional[bool] = None,
+        color: Optional[str] = None,
+        min_intensity: Optional[float] = None,
+        max_intensity: Optional[float] = None,
+        spread_factor: Optional[float] = None,
+        direction: Optional[Union[LightDirection, str]] = None,
+        enable_reverse: Optional[bool] = None,
+    ):
+        self.disable = disable
+        self.color = color
+        self.min_intensity = min_intensity
+        self.max_intensity = max_intensity
+        self.spread_factor = spread_factor
+        self.direction = direction
+        self.enable_reverse = enable_reverse
+
+    def to_dict(self) -> dict:
+        result = {}
+        for key, value in self.__dict__.items():
+            if value is not None:
+                if hasattr(value, "value"):
+                    result[key] = value.value
+                else:
+                    result[key] = value
+        return result
+
+
+class LegacyShadowConfig:
+    def __init__(
+        self,
+        disable: Optional[bool] = None,
+        color: Optional[str] = None,
+        min_intensity: Optional[float] = None,
+        max_intensity: Optional[float] = None,
+        offset_initial: Optional[float] = None,
+        offset_factor: Optional[float] = None,
+        spread_initial: Optional[float] = None,
+        spread_factor: Optional[float] = None,
+        min_blur_radius: Optional[float] = None,
+        max_blur_radius: Optional[float] = None,
+        direction: Optional[Union[ShadowDirection, str]] = None,
+        enable_reverse: Optional[bool] = None,
+    ):
+        self.disable = disable
+        self.color = color
+        self.min_intensity = min_intensity
+        self.max_intensity = max_intensity
+        self.offset_initial = offset_initial
+        self.offset_factor = offset_factor
+        self.spread_initial = spread_initial
+        self.spread_factor = spread_factor
+        self.min_blur_radius = min_blur_radius
+        self.max_blur_radius = max_blur_radius
+        self.direction = direction
+        self.enable_reverse = enable_reverse
+
+    def to_dict(self) -> dict:
+        result = {}
+        for key, value in self.__dict__.items():
+            if value is not None:
+                if hasattr(value, "value"):
+                    result[key] = value.value
+                else:
+                    result[key] = value
+        return result
@@ -0,0 +1,77 @@
+"""
+Benchmark `FletTilt.before_update` for many controls.
+
+Compares re-encoding every config on each update (the previous behavior)
+with the cached config JSON, for an update that only toggles `visible`.
+
+Run from the repository root:
+
+    python benchmarks/bench_before_update.py [controls] [rounds]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from flet_tilt import (  # noqa: E402
+    FletTilt,
+    LightConfig,
+    ParallaxConfig,
+    ShadowConfig,
+    TiltConfig,
+    TiltDirection,
+)
+
+
+def make_controls(count: int):
+    return [
+        FletTilt(
+            border_radius=30,
+            tilt_config=TiltConfig(
+                angle=15.0,
+                direction=[TiltDirection.TOP, TiltDirection.BOTTOM],
+                move_duration=100,
+                leave_duration=300,
+            ),
+            light_config=LightConfig(color="#ffffff", max_intensity=0.6),
+            shadow_config=ShadowConfig(color="#000000", max_blur_radius=20.0),
+            parallax_config=ParallaxConfig(factor=0.5),
+        )
+        for _ in range(count)
+    ]
+
+
+def encode_all(control: FletTilt):
+    # Previous behavior: build and encode every config on each update.
+    super(FletTilt, control).before_update()
+    for name in ("tilt_config", "light_config", "shadow_config", "parallax_config"):
+        config = getattr(control, name)
+        control._set_attr_json(name, config.to_dict())
+
+
+def run(count: int = 1000, rounds: int = 20):
+    controls = make_controls(count)
+    for c in controls:
+        c.before_update()
+
+    def measure(fn):
+        start = time.perf_counter()
+        for i in range(rounds):
+            for c in controls:
+                c.visible = i % 2 == 0
+                fn(c)
+        return (time.perf_counter() - start) / rounds
+
+    encode_time = measure(encode_all)
+    cached_time = measure(FletTilt.before_update)
+
+    print(f"before_update for {count} controls (avg of {rounds} rounds)")
+    print(f"  encode every update: {encode_time * 1000:8.2f} ms")
+    print(f"  cached config JSON:  {cached_time * 1000:8.2f} ms")
+    print(f"  speedup:             {encode_time / cached_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    run(*(int(a) for a in sys.argv[1:3]))
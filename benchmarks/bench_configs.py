@@ -0,0 +1,100 @@
+"""
+Memory and serialization benchmark for config objects.
+
+Compares the immutable, interned config classes with the previous mutable
+ones (see _legacy_configs.py) for N cards that each build their own configs.
+
+Run from the repository root:
+
+    python benchmarks/bench_configs.py [cards]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from flet.core.embed_json_encoder import EmbedJsonEncoder  # noqa: E402
+
+from _legacy_configs import (  # noqa: E402
+    LegacyLightConfig,
+    LegacyShadowConfig,
+    LegacyTiltConfig,
+)
+from flet_tilt import (  # noqa: E402
+    LightConfig,
+    LightDirection,
+    ShadowConfig,
+    TiltConfig,
+    TiltDirection,
+)
+
+
+def build(tilt_cls, light_cls, shadow_cls, count: int):
+    return [
+        (
+            tilt_cls(
+                angle=15.0,
+                direction=[TiltDirection.TOP, TiltDirection.BOTTOM],
+                move_duration=100,
+                leave_duration=300,
+            ),
+            light_cls(
+                color="#ffffff",
+                max_intensity=0.6,
+                direction=LightDirection.AROUND,
+            ),
+            shadow_cls(color="#000000", max_blur_radius=20.0),
+        )
+        for _ in range(count)
+    ]
+
+
+def measure_build(tilt_cls, light_cls, shadow_cls, count: int):
+    tracemalloc.start()
+    configs = build(tilt_cls, light_cls, shadow_cls, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del configs
+
+    start = time.perf_counter()
+    configs = build(tilt_cls, light_cls, shadow_cls, count)
+    return configs, time.perf_counter() - start, size
+
+
+def legacy_json(config) -> str:
+    return json.dumps(config.to_dict(), cls=EmbedJsonEncoder, separators=(",", ":"))
+
+
+def measure_serialize(configs, encode):
+    start = time.perf_counter()
+    for group in configs:
+        for config in group:
+            encode(config)
+    return time.perf_counter() - start
+
+
+def run(count: int = 10000):
+    legacy, legacy_build, legacy_size = measure_build(
+        LegacyTiltConfig, LegacyLightConfig, LegacyShadowConfig, count
+    )
+    interned, interned_build, interned_size = measure_build(
+        TiltConfig, LightConfig, ShadowConfig, count
+    )
+    legacy_ser = measure_serialize(legacy, legacy_json)
+    interned_ser = measure_serialize(interned, lambda c: c.to_json())
+    distinct = len({id(c) for group in interned for c in group})
+
+    print(f"{count} cards x 3 configs")
+    print(f"{'':22}{'legacy':>12}{'interned':>12}")
+    print(f"{'memory (KiB)':22}{legacy_size / 1024:12.1f}{interned_size / 1024:12.1f}")
+    print(f"{'build (ms)':22}{legacy_build * 1000:12.2f}{interned_build * 1000:12.2f}")
+    print(f"{'serialize (ms)':22}{legacy_ser * 1000:12.2f}{interned_ser * 1000:12.2f}")
+    print(f"distinct interned config objects: {distinct}")
+
+
+if __name__ == "__main__":
+    run(*(int(a) for a in sys.argv[1:2]))
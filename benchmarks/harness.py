@@ -0,0 +1,142 @@
+"""
+Headless page for benchmarks: a real `flet.Page` on a stub connection.
+
+`StubConnection` processes commands exactly like the socket server (control
+ids, add/set/remove batches) and serializes every outgoing message the same
+way, but counts the bytes instead of sending them. No Flutter client is
+needed.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import flet as ft  # noqa: E402
+from flet.core.event import Event  # noqa: E402
+from flet.core.local_connection import LocalConnection  # noqa: E402
+from flet.core.protocol import (  # noqa: E402
+    ClientActions,
+    ClientMessage,
+    Command,
+    CommandEncoder,
+    PageCommandResponsePayload,
+    PageCommandsBatchResponsePayload,
+)
+
+
+class StubConnection(LocalConnection):
+    def __init__(self):
+        super().__init__()
+        self.bytes_sent = 0
+        self.messages_sent = 0
+
+    def send_command(self, session_id: str, command: Command):
+        result, message = self._process_command(command)
+        if message:
+            self._send(message)
+        return PageCommandResponsePayload(result=result, error="")
+
+    def send_commands(self, session_id: str, commands: List[Command]):
+        results = []
+        messages = []
+        for command in commands:
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if message:
+                messages.append(message)
+        if len(messages) > 0:
+            self._send(ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def _send(self, message: ClientMessage):
+        j = json.dumps(message, cls=CommandEncoder, separators=(",", ":"))
+        self.bytes_sent += len(j.encode("utf-8"))
+        self.messages_sent += 1
+
+
+class HeadlessPage:
+    """
+    A page plus its event loop, executor and byte counters.
+
+    Client events are delivered through `Page.on_event_async` as the socket
+    server does: each one in its own task, so handlers overlap.
+    """
+
+    def __init__(self):
+        self.conn = StubConnection()
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor()
+        self.page = ft.Page(self.conn, "bench", loop=self.loop, executor=self.executor)
+
+    @property
+    def bytes_sent(self) -> int:
+        return self.conn.bytes_sent
+
+    def event(self, control: ft.Control, name: str, data: str) -> Event:
+        return Event(control.uid, name, data)
+
+    def dispatch(self, events: List[Event]):
+        """Deliver a burst of client events, each as its own task like the server."""
+
+        async def run():
+            await asyncio.gather(
+                *[asyncio.create_task(self.page.on_event_async(e)) for e in events]
+            )
+
+        self.loop.run_until_complete(run())
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.loop.close()
+
+
+class Result:
+    __slots__ = ("name", "ops", "seconds", "bytes")
+
+    def __init__(self, name: str, ops: int, seconds: float, bytes: int = 0):
+        self.name = name
+        self.ops = ops
+        self.seconds = seconds
+        self.bytes = bytes
+
+    @property
+    def us_per_op(self) -> float:
+        return self.seconds * 1e6 / self.ops
+
+    @property
+    def bytes_per_op(self) -> float:
+        return self.bytes / self.ops
+
+    def to_dict(self):
+        return {
+            "ops": self.ops,
+            "us_per_op": self.us_per_op,
+            "bytes_per_op": self.bytes_per_op,
+        }
+
+
+def measure(
+    name: str,
+    fn: Callable[[], None],
+    ops: int,
+    repeat: int = 5,
+    bytes_fn: Optional[Callable[[], int]] = None,
+) -> Result:
+    """Best of `repeat` runs of `fn`, which performs `ops` operations."""
+    best = None
+    sent = 0
+    for _ in range(repeat):
+        before = bytes_fn() if bytes_fn else 0
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        sent = (bytes_fn() if bytes_fn else 0) - before
+        best = elapsed if best is None else min(best, elapsed)
+    return Result(name, ops, best, sent)
@@ -0,0 +1,93 @@
+"""
+Replay a recorded gesture stream against a headless page.
+
+Builds one `FletTilt` per recorded control on a stub-connection page (see
+harness.py), attaches a handler and replays the recording through the page
+event pipeline, then prints the throughput. Use it to load-test handler
+code and to compare releases on the same recorded traffic.
+
+Run from the repository root:
+
+    python benchmarks/replay.py session.ftgr [--speed 10] [--dispatch latest]
+
+Without a recording file a synthetic one (N cards x M moves) is generated.
+"""
+
+import argparse
+import math
+
+from harness import HeadlessPage
+
+from flet_tilt import (
+    FletTilt,
+    GestureDispatch,
+    GestureRecord,
+    GestureReplayer,
+    GesturesType,
+)
+
+
+def synthetic(cards: int, moves: int):
+    records = []
+    for i in range(cards):
+        for j in range(moves):
+            records.append(
+                GestureRecord(
+                    j * 16,
+                    f"card{i}",
+                    "gesture_move",
+                    100 + 80 * math.cos(j / 10),
+                    100 + 80 * math.sin(j / 10),
+                    (j % 30) / 2,
+                    GesturesType.TOUCH,
+                )
+            )
+        records.append(
+            GestureRecord(
+                moves * 16, f"card{i}", "gesture_leave", 0, 0, 0, GesturesType.TOUCH
+            )
+        )
+    records.sort(key=lambda r: r.timestamp_ms)
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("recording", nargs="?", help="recording file")
+    parser.add_argument("--speed", type=float, default=0, help="0: max speed")
+    parser.add_argument(
+        "--dispatch", choices=[d.value for d in GestureDispatch], default="all"
+    )
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--moves", type=int, default=500)
+    args = parser.parse_args()
+
+    replayer = GestureReplayer(
+        args.recording or synthetic(args.cards, args.moves)
+    )
+    hp = HeadlessPage()
+    handled = 0
+
+    async def on_gesture(e):
+        nonlocal handled
+        handled += 1
+
+    cards = [
+        FletTilt(
+            on_gesture_move=on_gesture,
+            on_gesture_leave=on_gesture,
+            gesture_dispatch=args.dispatch,
+        )
+        for _ in replayer.names
+    ]
+    hp.page.add(*cards)
+
+    stats = replayer.replay(hp.page, cards, speed=args.speed or None)
+    hp.close()
+
+    print(f"{len(cards)} controls, {stats.events} events in {stats.seconds:.3f} s")
+    print(f"  {stats.events_per_second:,.0f} events/s, {handled} handled")
+
+
+if __name__ == "__main__":
+    main()
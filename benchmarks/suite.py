@@ -0,0 +1,264 @@
+"""
+Headless benchmark suite for the Python side of flet_tilt.
+
+Runs the hot paths on a real page backed by a stub connection (see
+harness.py), so no Flutter client is needed, and reports the time and the
+wire bytes per operation:
+
+- config_build / config_to_dict: TiltConfig construction and encoding
+- page_add: adding N cards to the page (bytes sent to the client)
+- before_update: `FletTilt.before_update` for N cards
+- page_update: `page.update()` after changing one attribute of N cards
+- get_children: `_get_children` of a card with many layer controls
+- gesture_move_*: a burst of client gesture events through
+  `Page.on_event_async` to `on_gesture_move` (bytes received from the
+  client); with `_latest` pending moves collapse while the handler yields
+- gesture_move_quantized: grid-delta moves (`gesture_precision`)
+- gesture_move_batch: batch event decoding
+- gesture_move_heatmap: moves binned by an attached `TiltHeatmap`
+
+Run from the repository root:
+
+    python benchmarks/suite.py [--controls N] [--save results.json]
+    python benchmarks/suite.py --baseline results.json [--tolerance 0.25]
+
+With --baseline the run exits with status 1 when any benchmark got slower
+or sends more bytes than the baseline allows.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict, List
+
+from harness import HeadlessPage, Result, measure
+
+import flet as ft
+from flet_tilt import (
+    FletTilt,
+    GestureDispatch,
+    LightConfig,
+    ParallaxConfig,
+    ShadowConfig,
+    TiltConfig,
+    TiltDirection,
+    TiltHeatmap,
+)
+
+
+def tilt_config(angle: float = 15.0) -> TiltConfig:
+    return TiltConfig(
+        angle=angle,
+        direction=[TiltDirection.TOP, TiltDirection.BOTTOM],
+        move_duration=100,
+        leave_duration=300,
+    )
+
+
+def make_card(**kwargs) -> FletTilt:
+    return FletTilt(
+        child=ft.Text("card"),
+        border_radius=30,
+        tilt_config=tilt_config(),
+        light_config=LightConfig(color="#ffffff", max_intensity=0.6),
+        shadow_config=ShadowConfig(color="#000000", max_blur_radius=20.0),
+        parallax_config=ParallaxConfig(factor=0.5),
+        **kwargs,
+    )
+
+
+def bench_configs(ops: int) -> List[Result]:
+    angles = [10.0 + i % 20 for i in range(ops)]
+    config = tilt_config()
+    return [
+        measure("config_build", lambda: [tilt_config(a) for a in angles], ops),
+        measure(
+            "config_to_dict", lambda: [config.to_dict() for _ in range(ops)], ops
+        ),
+    ]
+
+
+def bench_page(controls: int) -> List[Result]:
+    results = []
+
+    def add():
+        hp = HeadlessPage()
+        hp.page.add(*[make_card() for _ in range(controls)])
+        add.bytes = hp.bytes_sent
+        hp.close()
+
+    add.bytes = 0
+    result = measure("page_add", add, controls)
+    # every run sends to a new page: count the bytes of one of them
+    result.bytes = add.bytes
+    results.append(result)
+
+    hp = HeadlessPage()
+    cards = [make_card() for _ in range(controls)]
+    hp.page.add(*cards)
+
+    def before_update():
+        for c in cards:
+            c.before_update()
+
+    results.append(measure("before_update", before_update, controls))
+
+    def page_update():
+        for c in cards:
+            c.border_radius = 30 if c.border_radius != 30 else 20
+        hp.page.update()
+
+    results.append(
+        measure("page_update", page_update, controls, bytes_fn=lambda: hp.bytes_sent)
+    )
+    hp.close()
+    return results
+
+
+def bench_get_children(layers: int, calls: int) -> Result:
+    card = FletTilt(
+        child=ft.Text("card"),
+        child_layout_outer=[ft.Text(f"o{i}") for i in range(layers)],
+        child_layout_inner=[ft.Text(f"i{i}") for i in range(layers)],
+        child_layout_behind=[ft.Text(f"b{i}") for i in range(layers)],
+    )
+    card._get_children()
+
+    def get_children():
+        for _ in range(calls):
+            card._get_children()
+
+    return measure(f"get_children[{3 * layers} layers]", get_children, calls)
+
+
+def bench_gestures(events: int) -> List[Result]:
+    results = []
+    hp = HeadlessPage()
+    received = []
+
+    async def on_move(e):
+        received.append(e.x)
+        # a handler that yields (I/O, page updates): lets "latest" collapse
+        await asyncio.sleep(0)
+
+    for name, dispatch in (
+        ("gesture_move_all", GestureDispatch.ALL),
+        ("gesture_move_latest", GestureDispatch.LATEST),
+    ):
+        card = make_card(on_gesture_move=on_move, gesture_dispatch=dispatch)
+        hp.page.add(card)
+        batch = [
+            hp.event(card, "gesture_move", f"[{i % 300},{i % 200},{i % 15},\"touch\"]")
+            for i in range(events)
+        ]
+        inbound = sum(len(e.data) for e in batch)
+        result = measure(name, lambda: hp.dispatch(batch), events)
+        result.bytes = inbound
+        results.append(result)
+
+    # gesture_precision: one absolute cell, then small grid deltas
+    card = make_card(on_gesture_move=on_move, gesture_precision=3)
+    hp.page.add(card)
+    batch = [hp.event(card, "gesture_move", '[33,20,45,"hover",3,0.1]')] + [
+        hp.event(card, "gesture_move", f"[{i % 3 - 1},{i % 2},{i % 5 - 2}]")
+        for i in range(events - 1)
+    ]
+    inbound = sum(len(e.data) for e in batch)
+    result = measure("gesture_move_quantized", lambda: hp.dispatch(batch), events)
+    result.bytes = inbound
+    results.append(result)
+
+    card = make_card(width=300, height=200)
+    hp.page.add(card)
+    TiltHeatmap(bins=32).attach(card)
+    batch = [
+        hp.event(card, "gesture_move", f"[{i % 300},{i % 200},{i % 15},\"touch\"]")
+        for i in range(events)
+    ]
+    results.append(
+        measure("gesture_move_heatmap", lambda: hp.dispatch(batch), events)
+    )
+
+    samples = 50
+    card = make_card(on_gesture_move_batch=on_move, gesture_batch_window_ms=100)
+    hp.page.add(card)
+    data = json.dumps(
+        {
+            "t": "touch",
+            "ts": list(range(0, samples * 2, 2)),
+            "x": [float(i) for i in range(samples)],
+            "y": [float(i) for i in range(samples)],
+            "a": [i / 10 for i in range(samples)],
+        },
+        separators=(",", ":"),
+    )
+    batch = [
+        hp.event(card, "gesture_move_batch", data) for _ in range(events // samples)
+    ]
+    result = measure(
+        f"gesture_move_batch[{samples}]", lambda: hp.dispatch(batch), len(batch)
+    )
+    result.bytes = len(data) * len(batch)
+    results.append(result)
+
+    hp.close()
+    return results
+
+
+def run(args) -> List[Result]:
+    results = []
+    results.extend(bench_configs(args.ops))
+    results.extend(bench_page(args.controls))
+    results.append(bench_get_children(args.layers, args.ops))
+    results.extend(bench_gestures(args.events))
+    return results
+
+
+def report(results: List[Result]):
+    print(f"{'benchmark':32}{'ops':>8}{'us/op':>12}{'bytes/op':>12}")
+    for r in results:
+        print(f"{r.name:32}{r.ops:8}{r.us_per_op:12.2f}{r.bytes_per_op:12.1f}")
+
+
+def compare(results: List[Result], baseline: Dict[str, dict], tolerance: float) -> bool:
+    ok = True
+    for r in results:
+        base = baseline.get(r.name)
+        if base is None:
+            continue
+        for key, value in r.to_dict().items():
+            if key == "ops" or base[key] <= 0:
+                continue
+            if value > base[key] * (1 + tolerance):
+                print(f"REGRESSION {r.name} {key}: {base[key]:.2f} -> {value:.2f}")
+                ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--controls", type=int, default=1000)
+    parser.add_argument("--layers", type=int, default=50)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--ops", type=int, default=10000)
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare with saved JSON results")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run(args)
+    report(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({r.name: r.to_dict() for r in results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,27 @@ from .flet_tilt import (
     LightDirection,
     ShadowDirection,
     LightShadowMode,
+    GestureDispatch,
+    SensorFilter,
+    TiltController,
+    TiltPreset,
+    TiltGestureEvent,
+    TiltGestureBatchEvent,
+    TiltGestureSessionEvent,
+    TiltVisibilityChangeEvent,
+    TiltFpsChangeEvent,
+    TiltState,
 )
+from .heatmap import HeatmapStats, TiltHeatmap
+from .metrics import TiltMetrics, TiltMetricsEvent, TiltMetricsAggregator
+from .recorder import (
+    GestureRecord,
+    GestureRecorder,
+    GestureReplayer,
+    ReplayStats,
+    read_recording,
+)
+from .tilt_grid import TiltGrid
 
 __all__ = [
     "FletTilt",
@@ -22,4 +42,25 @@ __all__ = [
     "LightDirection",
     "ShadowDirection",
     "LightShadowMode",
+    "GestureDispatch",
+    "SensorFilter",
+    "TiltController",
+    "TiltPreset",
+    "TiltGestureEvent",
+    "TiltGestureBatchEvent",
+    "TiltGestureSessionEvent",
+    "TiltVisibilityChangeEvent",
+    "TiltFpsChangeEvent",
+    "TiltState",
+    "TiltGrid",
+    "TiltHeatmap",
+    "HeatmapStats",
+    "TiltMetrics",
+    "TiltMetricsEvent",
+    "TiltMetricsAggregator",
+    "GestureRecord",
+    "GestureRecorder",
+    "GestureReplayer",
+    "ReplayStats",
+    "read_recording",
 ]
\ No newline at end of file
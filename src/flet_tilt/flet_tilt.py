@@ -1,12 +1,51 @@
+import asyncio
+import contextvars
+import json
+import logging
+import math
+import time
+import weakref
+from types import MappingProxyType
+from array import array
+from collections import deque
+from concurrent.futures import Executor
 from enum import Enum
-from typing import Any, Optional, Union, List
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from flet.core.constrained_control import ConstrainedControl
 from flet.core.control import OptionalNumber, Control
+from flet.core.control_event import ControlEvent
+from flet.core.event_handler import EventHandler
+from flet.core.page import _session_page
 from flet.core.ref import Ref
-from flet.core.types import OptionalControlEventCallable, Duration, DurationValue
+from flet.core.types import (
+    OptionalControlEventCallable,
+    OptionalEventCallable,
+    Duration,
+    DurationValue,
+)
 from flet.core.animation import AnimationCurve
 from flet.core.transform import Offset
+from flet.utils import is_pyodide
+
+from .metrics import TiltMetrics, TiltMetricsEvent
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
 
 
 class TiltDirection(Enum):
@@ -43,17 +82,267 @@ class ShadowDirection(Enum):
 
 
 class LightShadowMode(Enum):
+    # light and shadow are projected from a blurred copy of the child
     PROJECTOR = "projector"
+    # flutter_tilt's base mode: plain gradient and box shadow, the default
     PERFORMANCE = "performance"
 
 
-class TiltConfig:
+class GestureDispatch(Enum):
+    """
+    How gesture events are delivered to Python handlers.
+
+    `ALL` runs a handler for every event as it arrives. `LATEST` runs handlers
+    one at a time, collapsing pending moves to the newest one. With both, sync
+    handlers run like `Page.run_thread` ones and handler errors are logged.
+    """
+
+    ALL = "all"
+    LATEST = "latest"
+
+
+class SensorFilter(Enum):
+    """
+    Smoothing applied on the device to `GesturesType.SENSORS` moves before
+    they are sent to Python.
+
+    `LOW_PASS` is a first-order low-pass filter at `sensor_filter_cutoff` Hz.
+    `ONE_EURO` adapts its cutoff to the speed of the movement: steady hands
+    are smoothed heavily, fast tilts stay responsive.
+    """
+
+    NONE = "none"
+    LOW_PASS = "lowPass"
+    ONE_EURO = "oneEuro"
+
+
+class _ConfigMeta(type):
+    """
+    Interns config instances: configs built from the same values are the same
+    shared object. The key holds the values with their types, so values with
+    the same wire JSON but different Python types (an enum and its string, an
+    `Offset` and a dict) stay separate objects and keep their own types.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._interned = weakref.WeakValueDictionary()
+
+    def __call__(cls, *args, **kwargs):
+        config = super().__call__(*args, **kwargs)
+        return cls._interned.setdefault(config._key, config)
+
+
+class _Config(metaclass=_ConfigMeta):
+    """
+    Base class for immutable config value objects.
+
+    Lists and dicts are frozen into tuples and read-only mappings on
+    construction. Configs built from the same values are interned into a
+    single shared object, so they are hashable and cheap to compare, and each
+    distinct config is converted to its wire format and encoded to JSON once,
+    when first sent. Use `replace()` to derive a modified copy.
+
+    Freezing and interning make construction several times slower than for a
+    plain object (microseconds per config): build configs once and share them
+    rather than building new ones for every card or update.
+    """
+
+    __slots__ = ("_key", "_wire_cache", "_json_cache", "__weakref__")
+
+    def __init__(self, **fields: Any):
+        # Only set fields are stored, unset ones read as None (__getattr__)
+        key = []
+        for name, value in fields.items():
+            if value is not None:
+                value, value_key = _freeze(value)
+                key.append((name, value_key))
+                object.__setattr__(self, name, value)
+        object.__setattr__(self, "_key", tuple(key))
+        object.__setattr__(self, "_wire_cache", None)
+        object.__setattr__(self, "_json_cache", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self.__slots__:
+            return None
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    @property
+    def _wire(self) -> Dict[str, Any]:
+        wire = self._wire_cache
+        if wire is None:
+            wire = {name: _to_wire(getattr(self, name)) for name, _ in self._key}
+            object.__setattr__(self, "_wire_cache", wire)
+        return wire
+
+    @property
+    def _json(self) -> str:
+        encoded = self._json_cache
+        if encoded is None:
+            encoded = json.dumps(self._wire, separators=(",", ":"))
+            object.__setattr__(self, "_json_cache", encoded)
+        return encoded
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            f"{self.__class__.__name__} is immutable, use replace() instead"
+        )
+
+    __delattr__ = __setattr__
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._json == other._json
+
+    def __hash__(self) -> int:
+        return hash(self._json)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        fields = {name: _thaw(value) for name, value in self.__fields().items()}
+        return (_new_config, (self.__class__, fields))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self.__fields().items()
+            if value is not None
+        )
+        return f"{self.__class__.__name__}({fields})"
+
+    def __fields(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def replace(self, **changes: Any):
+        """Return a config with the given fields changed."""
+        return self.__class__(**{**self.__fields(), **changes})
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return _copy_wire(self._wire)
+
+    def to_json(self) -> str:
+        """Return the JSON sent to the client."""
+        return self._json
+
+
+def _new_config(cls, fields: Dict[str, Any]):
+    return cls(**fields)
+
+
+_SCALARS = (str, int, float, bool)
+
+
+def _freeze(value: Any) -> Tuple[Any, Any]:
+    """
+    Return `value` with lists and dicts frozen into tuples and read-only
+    mappings, and its interning key: hashable and typed, so 1, 1.0 and True,
+    or an enum and its value, differ.
+    """
+    cls = value.__class__
+    if cls in _SCALARS:
+        return value, (cls, value)
+    if isinstance(value, (list, tuple)):
+        frozen = []
+        key = []
+        for v in value:
+            v, k = _freeze(v)
+            frozen.append(v)
+            key.append(k)
+        return tuple(frozen), tuple(key)
+    if isinstance(value, (dict, MappingProxyType)):
+        frozen = {}
+        key = []
+        for name, v in value.items():
+            frozen[name], k = _freeze(v)
+            key.append((name, k))
+        return MappingProxyType(frozen), (dict, tuple(key))
+    if value.__hash__ is None:
+        return value, (cls, repr(value))
+    return value, (cls, value)
+
+
+def _copy_wire(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _copy_wire(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_wire(v) for v in value]
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+def _to_wire(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Duration):
+        return {
+            "milliseconds": value.milliseconds,
+            "seconds": value.seconds,
+            "minutes": value.minutes,
+            "hours": value.hours,
+            "days": value.days,
+            "microseconds": value.microseconds,
+        }
+    if isinstance(value, Offset):
+        return {"dx": value.x, "dy": value.y}
+    if isinstance(value, (list, tuple)):
+        return [_to_wire(v) for v in value]
+    if isinstance(value, MappingProxyType):
+        return {k: _to_wire(v) for k, v in value.items()}
+    return value
+
+
+class TiltConfig(_Config):
     """
     Configuration class for tilt behavior.
 
     Controls how the widget responds to gestures and the intensity of the tilt effect.
     """
 
+    __slots__ = (
+        "disable",
+        "initial",
+        "angle",
+        "direction",
+        "enable_revert",
+        "filter_quality",
+        "enable_gesture_sensors",
+        "sensor_factor",
+        "enable_sensor_revert",
+        "sensor_revert_factor",
+        "sensor_move_duration",
+        "sensor_sampling_period",
+        "sensor_filter",
+        "sensor_filter_cutoff",
+        "sensor_filter_beta",
+        "enable_gesture_hover",
+        "enable_gesture_touch",
+        "enable_outside_area_move",
+        "move_duration",
+        "leave_duration",
+        "move_curve",
+        "leave_curve",
+        "controller_move_duration",
+        "controller_leave_duration",
+    )
+
     def __init__(
         self,
         disable: Optional[bool] = None,
@@ -67,6 +356,10 @@ class TiltConfig:
         enable_sensor_revert: Optional[bool] = None,
         sensor_revert_factor: Optional[float] = None,
         sensor_move_duration: Optional[DurationValue] = None,
+        sensor_sampling_period: Optional[DurationValue] = None,
+        sensor_filter: Optional[Union[SensorFilter, str]] = None,
+        sensor_filter_cutoff: Optional[float] = None,
+        sensor_filter_beta: Optional[float] = None,
         enable_gesture_hover: Optional[bool] = None,
         enable_gesture_touch: Optional[bool] = None,
         enable_outside_area_move: Optional[bool] = None,
@@ -92,6 +385,12 @@ class TiltConfig:
             enable_sensor_revert: Enable sensor revert
             sensor_revert_factor: Sensor revert factor (0.0 to 1.0)
             sensor_move_duration: Sensor move duration (Duration or milliseconds)
+            sensor_sampling_period: Minimum time between sensor samples sent
+                to Python (Duration or milliseconds)
+            sensor_filter: On-device smoothing of sensor moves (SensorFilter)
+            sensor_filter_cutoff: Filter cutoff in Hz, the minimum cutoff
+                for ONE_EURO (default 1.0)
+            sensor_filter_beta: ONE_EURO speed coefficient (default 0.007)
             enable_gesture_hover: Enable hover gestures
             enable_gesture_touch: Enable touch gestures
             enable_outside_area_move: Enable outside area move
@@ -102,93 +401,52 @@ class TiltConfig:
             controller_move_duration: Controller move duration (Duration or milliseconds)
             controller_leave_duration: Controller leave duration (Duration or milliseconds)
         """
-        self.disable = disable
-        self.initial = initial
-        self.angle = angle
-        self.direction = direction
-        self.enable_revert = enable_revert
-        self.filter_quality = filter_quality
-        self.enable_gesture_sensors = enable_gesture_sensors
-        self.sensor_factor = sensor_factor
-        self.enable_sensor_revert = enable_sensor_revert
-        self.sensor_revert_factor = sensor_revert_factor
-        self.sensor_move_duration = sensor_move_duration
-        self.enable_gesture_hover = enable_gesture_hover
-        self.enable_gesture_touch = enable_gesture_touch
-        self.enable_outside_area_move = enable_outside_area_move
-        self.move_duration = move_duration
-        self.leave_duration = leave_duration
-        self.move_curve = move_curve
-        self.leave_curve = leave_curve
-        self.controller_move_duration = controller_move_duration
-        self.controller_leave_duration = controller_leave_duration
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-
-        def duration_to_dict(duration):
-            if isinstance(duration, Duration):
-                return {
-                    "milliseconds": duration.milliseconds,
-                    "seconds": duration.seconds,
-                    "minutes": duration.minutes,
-                    "hours": duration.hours,
-                    "days": duration.days,
-                    "microseconds": duration.microseconds,
-                }
-            return duration
-
-        # Convert Offset to dx/dy format for Dart
-        initial_dict = None
-        if self.initial is not None:
-            if isinstance(self.initial, Offset):
-                initial_dict = {"dx": self.initial.x, "dy": self.initial.y}
-            else:
-                initial_dict = self.initial
-
-        return {
-            "disable": self.disable,
-            "initial": initial_dict,
-            "angle": self.angle,
-            "direction": [d.value if hasattr(d, "value") else d for d in self.direction]
-            if isinstance(self.direction, list)
-            else (
-                self.direction.value
-                if hasattr(self.direction, "value")
-                else self.direction
-            ),
-            "enable_revert": self.enable_revert,
-            "filter_quality": self.filter_quality,
-            "enable_gesture_sensors": self.enable_gesture_sensors,
-            "sensor_factor": self.sensor_factor,
-            "enable_sensor_revert": self.enable_sensor_revert,
-            "sensor_revert_factor": self.sensor_revert_factor,
-            "sensor_move_duration": duration_to_dict(self.sensor_move_duration),
-            "enable_gesture_hover": self.enable_gesture_hover,
-            "enable_gesture_touch": self.enable_gesture_touch,
-            "enable_outside_area_move": self.enable_outside_area_move,
-            "move_duration": duration_to_dict(self.move_duration),
-            "leave_duration": duration_to_dict(self.leave_duration),
-            "move_curve": self.move_curve.value
-            if hasattr(self.move_curve, "value")
-            else self.move_curve,
-            "leave_curve": self.leave_curve.value
-            if hasattr(self.leave_curve, "value")
-            else self.leave_curve,
-            "controller_move_duration": duration_to_dict(self.controller_move_duration),
-            "controller_leave_duration": duration_to_dict(
-                self.controller_leave_duration
-            ),
-        }
+        _Config.__init__(
+            self,
+            disable=disable,
+            initial=initial,
+            angle=angle,
+            direction=direction,
+            enable_revert=enable_revert,
+            filter_quality=filter_quality,
+            enable_gesture_sensors=enable_gesture_sensors,
+            sensor_factor=sensor_factor,
+            enable_sensor_revert=enable_sensor_revert,
+            sensor_revert_factor=sensor_revert_factor,
+            sensor_move_duration=sensor_move_duration,
+            sensor_sampling_period=sensor_sampling_period,
+            sensor_filter=sensor_filter,
+            sensor_filter_cutoff=sensor_filter_cutoff,
+            sensor_filter_beta=sensor_filter_beta,
+            enable_gesture_hover=enable_gesture_hover,
+            enable_gesture_touch=enable_gesture_touch,
+            enable_outside_area_move=enable_outside_area_move,
+            move_duration=move_duration,
+            leave_duration=leave_duration,
+            move_curve=move_curve,
+            leave_curve=leave_curve,
+            controller_move_duration=controller_move_duration,
+            controller_leave_duration=controller_leave_duration,
+        )
 
 
-class LightConfig:
+class LightConfig(_Config):
     """
     Configuration class for light effects.
 
     Controls the appearance and behavior of light effects during tilt.
     """
 
+    __slots__ = (
+        "disable",
+        "color",
+        "min_intensity",
+        "max_intensity",
+        "spread_factor",
+        "direction",
+        "enable_reverse",
+    )
+
     def __init__(
         self,
         disable: Optional[bool] = None,
@@ -211,33 +469,40 @@ class LightConfig:
             direction: Light direction
             enable_reverse: Enable reverse light direction
         """
-        self.disable = disable
-        self.color = color
-        self.min_intensity = min_intensity
-        self.max_intensity = max_intensity
-        self.spread_factor = spread_factor
-        self.direction = direction
-        self.enable_reverse = enable_reverse
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if value is not None:
-                if hasattr(value, "value"):
-                    result[key] = value.value
-                else:
-                    result[key] = value
-        return result
+        _Config.__init__(
+            self,
+            disable=disable,
+            color=color,
+            min_intensity=min_intensity,
+            max_intensity=max_intensity,
+            spread_factor=spread_factor,
+            direction=direction,
+            enable_reverse=enable_reverse,
+        )
 
 
-class ShadowConfig:
+class ShadowConfig(_Config):
     """
     Configuration class for shadow effects.
 
     Controls the appearance and behavior of shadow effects during tilt.
     """
 
+    __slots__ = (
+        "disable",
+        "color",
+        "min_intensity",
+        "max_intensity",
+        "offset_initial",
+        "offset_factor",
+        "spread_initial",
+        "spread_factor",
+        "min_blur_radius",
+        "max_blur_radius",
+        "direction",
+        "enable_reverse",
+    )
+
     def __init__(
         self,
         disable: Optional[bool] = None,
@@ -270,38 +535,32 @@ class ShadowConfig:
             direction: Shadow direction
             enable_reverse: Enable reverse shadow direction
         """
-        self.disable = disable
-        self.color = color
-        self.min_intensity = min_intensity
-        self.max_intensity = max_intensity
-        self.offset_initial = offset_initial
-        self.offset_factor = offset_factor
-        self.spread_initial = spread_initial
-        self.spread_factor = spread_factor
-        self.min_blur_radius = min_blur_radius
-        self.max_blur_radius = max_blur_radius
-        self.direction = direction
-        self.enable_reverse = enable_reverse
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if value is not None:
-                if hasattr(value, "value"):
-                    result[key] = value.value
-                else:
-                    result[key] = value
-        return result
+        _Config.__init__(
+            self,
+            disable=disable,
+            color=color,
+            min_intensity=min_intensity,
+            max_intensity=max_intensity,
+            offset_initial=offset_initial,
+            offset_factor=offset_factor,
+            spread_initial=spread_initial,
+            spread_factor=spread_factor,
+            min_blur_radius=min_blur_radius,
+            max_blur_radius=max_blur_radius,
+            direction=direction,
+            enable_reverse=enable_reverse,
+        )
 
 
-class ParallaxConfig:
+class ParallaxConfig(_Config):
     """
     Configuration class for parallax effects.
 
     Controls the parallax movement of child elements during tilt.
     """
 
+    __slots__ = ("disable", "factor")
+
     def __init__(
         self,
         disable: Optional[bool] = None,
@@ -314,16 +573,77 @@ class ParallaxConfig:
             disable: Disable parallax effect
             factor: Parallax movement factor (0.0 to 1.0)
         """
-        self.disable = disable
-        self.factor = factor
+        _Config.__init__(self, disable=disable, factor=factor)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if value is not None:
-                result[key] = value
-        return result
+
+# A patch is only sent while it is at most this share of the full config JSON
+_PATCH_MAX_RATIO = 0.5
+
+
+def _config_patch(base: _Config, config: _Config) -> str:
+    old = base._wire
+    new = config._wire
+    patch = {k: v for k, v in new.items() if old.get(k, None) != v}
+    patch.update((k, None) for k in old if k not in new)
+    return json.dumps(patch, separators=(",", ":"))
+
+
+def _set_config_attr(
+    control: Control,
+    name: str,
+    config: Optional[Union[_Config, dict]],
+    bases: Dict[str, _Config],
+):
+    """
+    Send a config as its full JSON in `name`, or as a patch in `<name>_patch`.
+
+    `bases` holds, per name, the last full config sent and, under
+    `<name>_patch`, the last config sent as a patch. A changed config of the
+    same class is sent as the fields that differ from the full one (removed
+    ones as null), which the client merges into the config it already
+    decoded. Once the patch grows past half the full JSON the full config is
+    re-sent.
+    """
+    patch_name = name + "_patch"
+    if not isinstance(config, _Config):
+        bases.pop(name, None)
+        bases.pop(patch_name, None)
+        control._set_attr_json(name, config)
+        control._set_attr(patch_name, None)
+        return
+
+    # Config objects carry their encoded JSON; unchanged configs cost a compare.
+    base = bases.get(name)
+    patched = bases.get(patch_name)
+    if config is (patched if patched is not None else base):
+        return
+    if config is base:
+        # Reverted to the full config: drop the patch
+        del bases[patch_name]
+        control._set_attr(patch_name, None)
+        return
+    if base is not None and type(base) is type(config):
+        patch = _config_patch(base, config)
+        if len(patch) <= len(config.to_json()) * _PATCH_MAX_RATIO:
+            bases[patch_name] = config
+            control._set_attr(patch_name, patch)
+            return
+    bases[name] = config
+    bases.pop(patch_name, None)
+    control._set_attr(name, config.to_json())
+    control._set_attr(patch_name, None)
+
+
+# animate_config() fields: keyword -> (config, config field)
+_ANIMATABLE_FIELDS = {
+    "angle": ("tilt_config", "angle"),
+    "light_min_intensity": ("light_config", "min_intensity"),
+    "light_max_intensity": ("light_config", "max_intensity"),
+    "shadow_min_intensity": ("shadow_config", "min_intensity"),
+    "shadow_max_intensity": ("shadow_config", "max_intensity"),
+    "shadow_min_blur_radius": ("shadow_config", "min_blur_radius"),
+    "shadow_max_blur_radius": ("shadow_config", "max_blur_radius"),
+}
 
 
 class FletTilt(ConstrainedControl):
@@ -367,9 +687,37 @@ class FletTilt(ConstrainedControl):
         parallax_config: Optional[Union[ParallaxConfig, dict]] = None,
         light_shadow_mode: Optional[Union[LightShadowMode, str]] = None,
         disable: Optional[bool] = None,
-        fps: Optional[int] = None,
-        on_gesture_move: OptionalControlEventCallable = None,
-        on_gesture_leave: OptionalControlEventCallable = None,
+        fps: Optional[Union[int, str]] = None,
+        fps_min: Optional[int] = None,
+        fps_max: Optional[int] = None,
+        auto_reduce_effects: Optional[bool] = None,
+        on_fps_change: OptionalEventCallable["TiltFpsChangeEvent"] = None,
+        metrics_interval_ms: Optional[int] = None,
+        on_metrics: OptionalEventCallable[TiltMetricsEvent] = None,
+        gesture_event_interval_ms: Optional[int] = None,
+        gesture_event_min_delta: OptionalNumber = None,
+        sensor_event_interval_ms: Optional[int] = None,
+        sensor_event_min_delta: OptionalNumber = None,
+        gesture_batch_window_ms: Optional[int] = None,
+        on_gesture_move: OptionalEventCallable["TiltGestureEvent"] = None,
+        on_gesture_leave: OptionalEventCallable["TiltGestureEvent"] = None,
+        on_gesture_move_batch: OptionalEventCallable["TiltGestureBatchEvent"] = None,
+        on_gesture_session: OptionalEventCallable["TiltGestureSessionEvent"] = None,
+        gesture_dispatch: Optional[Union[GestureDispatch, str]] = None,
+        gesture_executor: Optional[Executor] = None,
+        controller: Optional["TiltController"] = None,
+        preset: Optional[Union["TiltPreset", str]] = None,
+        on_trajectory_start: OptionalControlEventCallable = None,
+        on_trajectory_finish: OptionalControlEventCallable = None,
+        pause_when_offscreen: Optional[bool] = None,
+        on_visibility_change: OptionalEventCallable[
+            "TiltVisibilityChangeEvent"
+        ] = None,
+        track_state: Optional[bool] = None,
+        state_interval_ms: Optional[int] = None,
+        gesture_precision: OptionalNumber = None,
+        gesture_angle_precision: OptionalNumber = None,
+        cache_child: Optional[bool] = None,
     ):
         ConstrainedControl.__init__(
             self,
@@ -386,6 +734,10 @@ class FletTilt(ConstrainedControl):
             height=height,
         )
 
+        self.__layer_names: Dict[Control, str] = {}
+        self.__config_bases: Dict[str, _Config] = {}
+        self.__controller: Optional[TiltController] = None
+
         self.child = child
         self.border_radius = border_radius
         self.tilt_config = tilt_config
@@ -396,10 +748,69 @@ class FletTilt(ConstrainedControl):
         self.child_layout_behind = child_layout_behind
         self.parallax_config = parallax_config
         self.light_shadow_mode = light_shadow_mode
+        self.cache_child = cache_child
         self.disable = disable
         self.fps = fps
+        self.fps_min = fps_min
+        self.fps_max = fps_max
+        self.auto_reduce_effects = auto_reduce_effects
+        self.gesture_event_interval_ms = gesture_event_interval_ms
+        self.gesture_event_min_delta = gesture_event_min_delta
+        self.sensor_event_interval_ms = sensor_event_interval_ms
+        self.sensor_event_min_delta = sensor_event_min_delta
+        self.gesture_batch_window_ms = gesture_batch_window_ms
+        self.gesture_precision = gesture_precision
+        self.gesture_angle_precision = gesture_angle_precision
+
+        self.__gesture_dispatcher = _GestureDispatcher()
+        self._add_event_handler("gesture_move", self.__gesture_dispatcher.dispatch)
+        self._add_event_handler("gesture_leave", self.__gesture_dispatcher.dispatch)
+        self.__on_gesture_move_batch = EventHandler(
+            lambda e: self.__gesture_dispatcher.mirror_batch(TiltGestureBatchEvent(e))
+        )
+        self._add_event_handler(
+            "gesture_move_batch", self.__on_gesture_move_batch.get_handler()
+        )
+
         self.on_gesture_move = on_gesture_move
         self.on_gesture_leave = on_gesture_leave
+        self.on_gesture_move_batch = on_gesture_move_batch
+
+        self.__on_gesture_session = EventHandler(
+            lambda e: TiltGestureSessionEvent(e)
+        )
+        self._add_event_handler(
+            "gesture_session", self.__on_gesture_session.get_handler()
+        )
+        self.on_gesture_session = on_gesture_session
+        self.gesture_dispatch = gesture_dispatch
+        self.gesture_executor = gesture_executor
+        self.controller = controller
+        self.preset = preset
+        self.on_trajectory_start = on_trajectory_start
+        self.on_trajectory_finish = on_trajectory_finish
+        self.pause_when_offscreen = pause_when_offscreen
+
+        self.__on_visibility_change = EventHandler(
+            lambda e: TiltVisibilityChangeEvent(e)
+        )
+        self._add_event_handler(
+            "visibility_change", self.__on_visibility_change.get_handler()
+        )
+        self.on_visibility_change = on_visibility_change
+
+        self.__on_fps_change = EventHandler(lambda e: TiltFpsChangeEvent(e))
+        self._add_event_handler("fps_change", self.__on_fps_change.get_handler())
+        self.on_fps_change = on_fps_change
+
+        self.metrics_interval_ms = metrics_interval_ms
+        self.__on_metrics = EventHandler(lambda e: TiltMetricsEvent(e))
+        self._add_event_handler("metrics", self.__on_metrics.get_handler())
+        self.on_metrics = on_metrics
+
+        self.track_state = track_state
+        self.state_interval_ms = state_interval_ms
+        self._add_event_handler("state", self.__gesture_dispatcher.mirror_state)
 
     def _get_control_name(self):
         return "flet_tilt"
@@ -408,48 +819,94 @@ class FletTilt(ConstrainedControl):
         children = []
         if self.child:
             children.append(self.child)
-        if self.child_layout_outer:
-            for control in self.child_layout_outer:
-                control._set_attr_internal("n", "child_layout_outer")
-                children.append(control)
-        if self.child_layout_inner:
-            for control in self.child_layout_inner:
-                control._set_attr_internal("n", "child_layout_inner")
-                children.append(control)
-        if self.child_layout_behind:
-            for control in self.child_layout_behind:
-                control._set_attr_internal("n", "child_layout_behind")
-                children.append(control)
+        # Layer controls are tagged once; later calls only tag new or moved ones
+        layer_names = {}
+        for name, controls in (
+            ("child_layout_outer", self.__child_layout_outer),
+            ("child_layout_inner", self.__child_layout_inner),
+            ("child_layout_behind", self.__child_layout_behind),
+        ):
+            if controls:
+                for control in controls:
+                    if self.__layer_names.get(control) != name:
+                        control._set_attr_internal("n", name)
+                    layer_names[control] = name
+                    children.append(control)
+        # Controls that left every layer lose their tag, e.g. when moved to `child`
+        for control in self.__layer_names:
+            if control not in layer_names:
+                control._set_attr_internal("n", None)
+        self.__layer_names = layer_names
         return children
 
     def before_update(self):
         super().before_update()
-        # Convert config objects to dictionaries if needed
-        tilt_dict = (
-            self.__tilt_config.to_dict()
-            if isinstance(self.__tilt_config, TiltConfig)
-            else self.__tilt_config
-        )
-        light_dict = (
-            self.__light_config.to_dict()
-            if isinstance(self.__light_config, LightConfig)
-            else self.__light_config
+        bases = self.__config_bases
+        _set_config_attr(self, "tilt_config", self.__tilt_config, bases)
+        _set_config_attr(self, "light_config", self.__light_config, bases)
+        _set_config_attr(self, "shadow_config", self.__shadow_config, bases)
+        _set_config_attr(self, "parallax_config", self.__parallax_config, bases)
+
+    def get_metrics(self, wait_timeout: Optional[float] = 5) -> TiltMetrics:
+        """Fetch the current runtime counters from the client."""
+        return TiltMetrics.from_json(
+            self.invoke_method(
+                "get_metrics", wait_for_result=True, wait_timeout=wait_timeout
+            )
         )
-        shadow_dict = (
-            self.__shadow_config.to_dict()
-            if isinstance(self.__shadow_config, ShadowConfig)
-            else self.__shadow_config
-        )
-        parallax_dict = (
-            self.__parallax_config.to_dict()
-            if isinstance(self.__parallax_config, ParallaxConfig)
-            else self.__parallax_config
+
+    async def get_metrics_async(
+        self, wait_timeout: Optional[float] = 5
+    ) -> TiltMetrics:
+        return TiltMetrics.from_json(
+            await self.invoke_method_async(
+                "get_metrics", wait_for_result=True, wait_timeout=wait_timeout
+            )
         )
 
-        self._set_attr_json("tilt_config", tilt_dict)
-        self._set_attr_json("light_config", light_dict)
-        self._set_attr_json("shadow_config", shadow_dict)
-        self._set_attr_json("parallax_config", parallax_dict)
+    def animate_config(
+        self,
+        duration: DurationValue = 300,
+        curve: Optional[Union[AnimationCurve, str]] = None,
+        **targets: float,
+    ):
+        """
+        Animate config fields to new values on the client.
+
+        The targets are sent once and interpolated locally, frame by frame,
+        instead of calling `update()` from Python on every step. Animatable
+        fields: `angle`, `light_min_intensity`, `light_max_intensity`,
+        `shadow_min_intensity`, `shadow_max_intensity`,
+        `shadow_min_blur_radius` and `shadow_max_blur_radius`.
+
+        Animated values override the configs until the config they belong to
+        is changed from Python. A new call starts from the current values.
+
+        Example:
+        ```python
+        card.animate_config(angle=25, light_max_intensity=0.8, duration=500)
+        ```
+        """
+        configs: Dict[str, Dict[str, float]] = {}
+        for field, value in targets.items():
+            if field not in _ANIMATABLE_FIELDS:
+                raise ValueError(f"{field} can't be animated")
+            if (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or not math.isfinite(value)
+            ):
+                raise ValueError(f"{field} target must be a finite number")
+            config, config_field = _ANIMATABLE_FIELDS[field]
+            configs.setdefault(config, {})[config_field] = value
+        self.invoke_method(
+            "animate_config",
+            {
+                "targets": json.dumps(configs, separators=(",", ":")),
+                "duration": json.dumps(_to_wire(duration)),
+                "curve": _to_wire(curve) if curve is not None else "",
+            },
+        )
 
     # child
     @property
@@ -543,13 +1000,155 @@ class FletTilt(ConstrainedControl):
 
     # fps
     @property
-    def fps(self) -> Optional[int]:
+    def fps(self) -> Optional[Union[int, str]]:
+        """Tilt update rate, or `"auto"` to adapt it to frame timings."""
         return self._get_attr("fps")
 
     @fps.setter
-    def fps(self, value: Optional[int]):
+    def fps(self, value: Optional[Union[int, str]]):
         self._set_attr("fps", value)
 
+    # fps_min
+    @property
+    def fps_min(self) -> Optional[int]:
+        """Lowest rate `fps="auto"` goes down to (15 by default)."""
+        return self._get_attr("fpsMin", data_type="int")
+
+    @fps_min.setter
+    def fps_min(self, value: Optional[int]):
+        self._set_attr("fpsMin", value)
+
+    # fps_max
+    @property
+    def fps_max(self) -> Optional[int]:
+        """Highest and initial rate of `fps="auto"` (60 by default)."""
+        return self._get_attr("fpsMax", data_type="int")
+
+    @fps_max.setter
+    def fps_max(self, value: Optional[int]):
+        self._set_attr("fpsMax", value)
+
+    # auto_reduce_effects
+    @property
+    def auto_reduce_effects(self) -> Optional[bool]:
+        """Let `fps="auto"` turn light and shadow off when `fps_min` is not enough."""
+        return self._get_attr("autoReduceEffects", data_type="bool", def_value=False)
+
+    @auto_reduce_effects.setter
+    def auto_reduce_effects(self, value: Optional[bool]):
+        self._set_attr("autoReduceEffects", value)
+
+    # metrics_interval_ms
+    @property
+    def metrics_interval_ms(self) -> Optional[int]:
+        """How often `on_metrics` fires, in ms; 0 or None turns it off."""
+        return self._get_attr("metricsIntervalMs", data_type="int")
+
+    @metrics_interval_ms.setter
+    def metrics_interval_ms(self, value: Optional[int]):
+        self._set_attr("metricsIntervalMs", value)
+
+    # on_metrics
+    @property
+    def on_metrics(self) -> OptionalEventCallable[TiltMetricsEvent]:
+        return self.__on_metrics.handler
+
+    @on_metrics.setter
+    def on_metrics(self, handler: OptionalEventCallable[TiltMetricsEvent]):
+        self.__on_metrics.handler = handler
+        self._set_attr("onMetrics", True if handler is not None else None)
+
+    # on_fps_change
+    @property
+    def on_fps_change(self) -> OptionalEventCallable["TiltFpsChangeEvent"]:
+        """Fires when `fps="auto"` changes the rate or turns effects off or on."""
+        return self.__on_fps_change.handler
+
+    @on_fps_change.setter
+    def on_fps_change(self, handler: OptionalEventCallable["TiltFpsChangeEvent"]):
+        self.__on_fps_change.handler = handler
+        self._set_attr("onFpsChange", True if handler is not None else None)
+
+    # gesture_event_interval_ms
+    @property
+    def gesture_event_interval_ms(self) -> Optional[int]:
+        """Minimum ms between `gesture_move` events; moves in between are merged."""
+        return self._get_attr("gestureEventIntervalMs", data_type="int")
+
+    @gesture_event_interval_ms.setter
+    def gesture_event_interval_ms(self, value: Optional[int]):
+        self._set_attr("gestureEventIntervalMs", value)
+
+    # gesture_event_min_delta
+    @property
+    def gesture_event_min_delta(self) -> OptionalNumber:
+        """Moves closer than this (in pixels) to the last sent one are dropped."""
+        return self._get_attr("gestureEventMinDelta", data_type="float")
+
+    @gesture_event_min_delta.setter
+    def gesture_event_min_delta(self, value: OptionalNumber):
+        self._set_attr("gestureEventMinDelta", value)
+
+    # sensor_event_interval_ms
+    @property
+    def sensor_event_interval_ms(self) -> Optional[int]:
+        """`gesture_event_interval_ms` for sensor moves; defaults to it."""
+        return self._get_attr("sensorEventIntervalMs", data_type="int")
+
+    @sensor_event_interval_ms.setter
+    def sensor_event_interval_ms(self, value: Optional[int]):
+        self._set_attr("sensorEventIntervalMs", value)
+
+    # sensor_event_min_delta
+    @property
+    def sensor_event_min_delta(self) -> OptionalNumber:
+        """`gesture_event_min_delta` for sensor moves; defaults to it."""
+        return self._get_attr("sensorEventMinDelta", data_type="float")
+
+    @sensor_event_min_delta.setter
+    def sensor_event_min_delta(self, value: OptionalNumber):
+        self._set_attr("sensorEventMinDelta", value)
+
+    # gesture_batch_window_ms
+    @property
+    def gesture_batch_window_ms(self) -> Optional[int]:
+        """
+        Collect moves for this many ms and send them as one `gesture_move_batch`.
+        Only applies with `on_gesture_move_batch`; without it moves are sent to
+        `on_gesture_move` one by one.
+        """
+        return self._get_attr("gestureBatchWindowMs", data_type="int")
+
+    @gesture_batch_window_ms.setter
+    def gesture_batch_window_ms(self, value: Optional[int]):
+        self._set_attr("gestureBatchWindowMs", value)
+
+    # gesture_precision
+    @property
+    def gesture_precision(self) -> OptionalNumber:
+        """
+        Grid step, in logical pixels, `gesture_move` positions are rounded to.
+
+        The client then only sends a move when its grid cell changes, as a
+        small delta from the previous one; events are decoded back to
+        absolute values. For ~1% resolution use 1% of the card size.
+        """
+        return self._get_attr("gesturePrecision", data_type="float")
+
+    @gesture_precision.setter
+    def gesture_precision(self, value: OptionalNumber):
+        self._set_attr("gesturePrecision", value)
+
+    # gesture_angle_precision
+    @property
+    def gesture_angle_precision(self) -> OptionalNumber:
+        """Grid step of the angle, in degrees, with `gesture_precision` (0.1)."""
+        return self._get_attr("gestureAnglePrecision", data_type="float")
+
+    @gesture_angle_precision.setter
+    def gesture_angle_precision(self, value: OptionalNumber):
+        self._set_attr("gestureAnglePrecision", value)
+
     # light_shadow_mode
     @property
     def light_shadow_mode(self) -> Optional[Union[LightShadowMode, str]]:
@@ -562,20 +1161,699 @@ class FletTilt(ConstrainedControl):
         else:
             self._set_attr("lightShadowMode", value)
 
+    # cache_child
+    @property
+    def cache_child(self) -> Optional[bool]:
+        """
+        Paint the child and layer controls in their own repaint boundary, so
+        tilting moves them without repainting heavy subtrees.
+        """
+        return self._get_attr("cacheChild", data_type="bool", def_value=False)
+
+    @cache_child.setter
+    def cache_child(self, value: Optional[bool]):
+        self._set_attr("cacheChild", value)
+
+    def _add_gesture_observer(self, observer: Callable[["TiltGestureEvent"], None]):
+        """
+        Call `observer` with every `gesture_move`/`gesture_leave` event, before
+        and independently of the handlers. Used by recorders and analytics.
+        """
+        self.__gesture_dispatcher.observers.append(observer)
+        self.__update_gesture_flags()
+
+    def _remove_gesture_observer(
+        self, observer: Callable[["TiltGestureEvent"], None]
+    ):
+        observers = self.__gesture_dispatcher.observers
+        if observer in observers:
+            observers.remove(observer)
+        self.__update_gesture_flags()
+
+    def __update_gesture_flags(self):
+        # the client only sends gesture events somebody listens to
+        dispatcher = self.__gesture_dispatcher
+        for name, flag in (
+            ("gesture_move", "onGestureMove"),
+            ("gesture_leave", "onGestureLeave"),
+        ):
+            listened = dispatcher.handlers.get(name) is not None or dispatcher.observers
+            self._set_attr(flag, True if listened else None)
+
+    # state
+    @property
+    def state(self) -> "TiltState":
+        """
+        Latest tilt state, mirrored from incoming gesture and `track_state`
+        events. Reading it needs no handler.
+        """
+        return self.__gesture_dispatcher.state
+
+    # track_state
+    @property
+    def track_state(self) -> Optional[bool]:
+        """Have the client send the tilt state every `state_interval_ms`."""
+        return self._get_attr("trackState", data_type="bool", def_value=False)
+
+    @track_state.setter
+    def track_state(self, value: Optional[bool]):
+        self._set_attr("trackState", value)
+
+    # state_interval_ms
+    @property
+    def state_interval_ms(self) -> Optional[int]:
+        """Minimum ms between `track_state` updates (100 by default)."""
+        return self._get_attr("stateIntervalMs", data_type="int")
+
+    @state_interval_ms.setter
+    def state_interval_ms(self, value: Optional[int]):
+        self._set_attr("stateIntervalMs", value)
+
     # on_gesture_move
     @property
-    def on_gesture_move(self) -> OptionalControlEventCallable:
-        return self._get_event_handler("gesture_move")
+    def on_gesture_move(self) -> OptionalEventCallable["TiltGestureEvent"]:
+        return self.__gesture_dispatcher.handlers.get("gesture_move")
 
     @on_gesture_move.setter
-    def on_gesture_move(self, handler: OptionalControlEventCallable):
-        self._add_event_handler("gesture_move", handler)
+    def on_gesture_move(self, handler: OptionalEventCallable["TiltGestureEvent"]):
+        self.__gesture_dispatcher.handlers["gesture_move"] = handler
+        self.__update_gesture_flags()
 
     # on_gesture_leave
     @property
-    def on_gesture_leave(self) -> OptionalControlEventCallable:
-        return self._get_event_handler("gesture_leave")
+    def on_gesture_leave(self) -> OptionalEventCallable["TiltGestureEvent"]:
+        return self.__gesture_dispatcher.handlers.get("gesture_leave")
 
     @on_gesture_leave.setter
-    def on_gesture_leave(self, handler: OptionalControlEventCallable):
-        self._add_event_handler("gesture_leave", handler)
+    def on_gesture_leave(self, handler: OptionalEventCallable["TiltGestureEvent"]):
+        self.__gesture_dispatcher.handlers["gesture_leave"] = handler
+        self.__update_gesture_flags()
+
+    # on_gesture_move_batch
+    @property
+    def on_gesture_move_batch(
+        self,
+    ) -> OptionalEventCallable["TiltGestureBatchEvent"]:
+        return self.__on_gesture_move_batch.handler
+
+    @on_gesture_move_batch.setter
+    def on_gesture_move_batch(
+        self, handler: OptionalEventCallable["TiltGestureBatchEvent"]
+    ):
+        self.__on_gesture_move_batch.handler = handler
+        self._set_attr("onGestureMoveBatch", True if handler is not None else None)
+
+    # on_gesture_session
+    @property
+    def on_gesture_session(
+        self,
+    ) -> OptionalEventCallable["TiltGestureSessionEvent"]:
+        """
+        Fires once per interaction, on leave, with a summary computed by the
+        client. Works without `on_gesture_move`, so no move is sent at all.
+        """
+        return self.__on_gesture_session.handler
+
+    @on_gesture_session.setter
+    def on_gesture_session(
+        self, handler: OptionalEventCallable["TiltGestureSessionEvent"]
+    ):
+        self.__on_gesture_session.handler = handler
+        self._set_attr("onGestureSession", True if handler is not None else None)
+
+    # gesture_dispatch
+    @property
+    def gesture_dispatch(self) -> GestureDispatch:
+        return self.__gesture_dispatcher.policy
+
+    @gesture_dispatch.setter
+    def gesture_dispatch(self, value: Optional[Union[GestureDispatch, str]]):
+        self.__gesture_dispatcher.policy = (
+            GestureDispatch(value) if value is not None else GestureDispatch.ALL
+        )
+
+    # gesture_executor
+    @property
+    def gesture_executor(self) -> Optional[Executor]:
+        """Executor (e.g. a bounded `ThreadPoolExecutor`) for sync gesture handlers."""
+        return self.__gesture_dispatcher.executor
+
+    @gesture_executor.setter
+    def gesture_executor(self, value: Optional[Executor]):
+        self.__gesture_dispatcher.executor = value
+
+    # controller
+    @property
+    def controller(self) -> Optional["TiltController"]:
+        return self.__controller
+
+    @controller.setter
+    def controller(self, value: Optional["TiltController"]):
+        previous = self.__controller
+        if previous is not None and previous._control is self:
+            previous._control = None
+        if value is not None:
+            value._control = self
+        self.__controller = value
+
+    # preset
+    @property
+    def preset(self) -> Optional[str]:
+        """Name of the `TiltPreset` whose configs this control uses by default."""
+        return self._get_attr("preset")
+
+    @preset.setter
+    def preset(self, value: Optional[Union["TiltPreset", str]]):
+        self._set_attr("preset", value.name if isinstance(value, TiltPreset) else value)
+
+    # on_trajectory_start
+    @property
+    def on_trajectory_start(self) -> OptionalControlEventCallable:
+        return self._get_event_handler("trajectory_start")
+
+    @on_trajectory_start.setter
+    def on_trajectory_start(self, handler: OptionalControlEventCallable):
+        self._add_event_handler("trajectory_start", handler)
+        self._set_attr("onTrajectoryStart", True if handler is not None else None)
+
+    # on_trajectory_finish
+    @property
+    def on_trajectory_finish(self) -> OptionalControlEventCallable:
+        return self._get_event_handler("trajectory_finish")
+
+    @on_trajectory_finish.setter
+    def on_trajectory_finish(self, handler: OptionalControlEventCallable):
+        self._add_event_handler("trajectory_finish", handler)
+        self._set_attr("onTrajectoryFinish", True if handler is not None else None)
+
+    # pause_when_offscreen
+    @property
+    def pause_when_offscreen(self) -> Optional[bool]:
+        """Suspend tilt, sensors and gesture events while the card is not visible."""
+        return self._get_attr("pauseWhenOffscreen", data_type="bool", def_value=False)
+
+    @pause_when_offscreen.setter
+    def pause_when_offscreen(self, value: Optional[bool]):
+        self._set_attr("pauseWhenOffscreen", value)
+
+    # on_visibility_change
+    @property
+    def on_visibility_change(
+        self,
+    ) -> OptionalEventCallable["TiltVisibilityChangeEvent"]:
+        """Fires when a `pause_when_offscreen` card scrolls in or out of view."""
+        return self.__on_visibility_change.handler
+
+    @on_visibility_change.setter
+    def on_visibility_change(
+        self, handler: OptionalEventCallable["TiltVisibilityChangeEvent"]
+    ):
+        self.__on_visibility_change.handler = handler
+        self._set_attr("onVisibilityChange", True if handler is not None else None)
+
+
+class TiltPreset(Control):
+    """
+    Configs shared by many `FletTilt` controls.
+
+    Add the preset to `page.overlay` and reference it from cards with
+    `FletTilt(preset=...)`. The configs are sent and decoded on the client
+    once, and updating the preset updates every card using it in one message.
+    A card's own configs take precedence over the preset's.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tilt_config: Optional[Union[TiltConfig, dict]] = None,
+        light_config: Optional[Union[LightConfig, dict]] = None,
+        shadow_config: Optional[Union[ShadowConfig, dict]] = None,
+        parallax_config: Optional[Union[ParallaxConfig, dict]] = None,
+        ref: Optional[Ref] = None,
+        data: Any = None,
+    ):
+        Control.__init__(self, ref=ref, data=data)
+        self.__config_bases: Dict[str, _Config] = {}
+
+        self.name = name
+        self.tilt_config = tilt_config
+        self.light_config = light_config
+        self.shadow_config = shadow_config
+        self.parallax_config = parallax_config
+
+    def _get_control_name(self):
+        return "flet_tilt_preset"
+
+    def before_update(self):
+        super().before_update()
+        bases = self.__config_bases
+        _set_config_attr(self, "tilt_config", self.__tilt_config, bases)
+        _set_config_attr(self, "light_config", self.__light_config, bases)
+        _set_config_attr(self, "shadow_config", self.__shadow_config, bases)
+        _set_config_attr(self, "parallax_config", self.__parallax_config, bases)
+
+    # name
+    @property
+    def name(self) -> str:
+        return self._get_attr("presetName")
+
+    @name.setter
+    def name(self, value: str):
+        self._set_attr("presetName", value)
+
+    # tilt_config
+    @property
+    def tilt_config(self) -> Optional[Union[TiltConfig, dict]]:
+        return self.__tilt_config
+
+    @tilt_config.setter
+    def tilt_config(self, value: Optional[Union[TiltConfig, dict]]):
+        self.__tilt_config = value
+
+    # light_config
+    @property
+    def light_config(self) -> Optional[Union[LightConfig, dict]]:
+        return self.__light_config
+
+    @light_config.setter
+    def light_config(self, value: Optional[Union[LightConfig, dict]]):
+        self.__light_config = value
+
+    # shadow_config
+    @property
+    def shadow_config(self) -> Optional[Union[ShadowConfig, dict]]:
+        return self.__shadow_config
+
+    @shadow_config.setter
+    def shadow_config(self, value: Optional[Union[ShadowConfig, dict]]):
+        self.__shadow_config = value
+
+    # parallax_config
+    @property
+    def parallax_config(self) -> Optional[Union[ParallaxConfig, dict]]:
+        return self.__parallax_config
+
+    @parallax_config.setter
+    def parallax_config(self, value: Optional[Union[ParallaxConfig, dict]]):
+        self.__parallax_config = value
+
+
+class TiltController:
+    """
+    Drives a `FletTilt` from Python with `GesturesType.CONTROLLER` gestures.
+
+    Attach it with `FletTilt(controller=...)`. Each call is a lightweight
+    method invocation on the client and does not re-send the control's
+    configs. Animation timing comes from `TiltConfig.controller_move_duration`
+    and `controller_leave_duration`.
+    """
+
+    def __init__(self):
+        self._control: Optional[FletTilt] = None
+
+    def move(self, x: float, y: float):
+        """Tilt towards the position (x, y), in logical pixels of the widget."""
+        self.__invoke("controller_move", {"x": x, "y": y})
+
+    def leave(self):
+        """Release the controller gesture and revert the tilt."""
+        self.__invoke("controller_leave")
+
+    def play(
+        self,
+        keyframes: Union[Sequence[Tuple[float, float, float]], Sequence[float]],
+        loop: bool = False,
+    ):
+        """
+        Upload a trajectory once and play it on the client at the widget's `fps`.
+
+        Args:
+            keyframes: `(t, x, y)` keyframes with `t` in milliseconds from the
+                start, in order, as a list of tuples, a flat `array("d")` or an
+                (N, 3) NumPy array. Positions are interpolated linearly between
+                them; keyframes with equal `t` jump to the later position.
+            loop: Restart from the first keyframe when the last one is reached.
+
+        `on_trajectory_start` fires when playback starts and
+        `on_trajectory_finish` when it ends (`e.data` is `"completed"`,
+        `"stopped"`, or `"offscreen"` when a `pause_when_offscreen` card
+        scrolls out of view).
+        """
+        flat = _flatten_keyframes(keyframes)
+        self.__invoke(
+            "trajectory_play",
+            {
+                "keyframes": json.dumps(flat, separators=(",", ":")),
+                "loop": "true" if loop else "false",
+            },
+        )
+
+    def stop(self):
+        """Stop trajectory playback and revert the tilt."""
+        self.__invoke("trajectory_stop")
+
+    def __invoke(self, method_name: str, arguments: Optional[Dict[str, Any]] = None):
+        assert self._control, "TiltController must be attached to a FletTilt first"
+        self._control.invoke_method(method_name, arguments)
+
+
+def _flatten_keyframes(keyframes) -> List[float]:
+    if np is not None and isinstance(keyframes, np.ndarray):
+        flat = keyframes.astype(np.float64).ravel().tolist()
+    elif isinstance(keyframes, array):
+        flat = keyframes.tolist()
+    elif keyframes and isinstance(keyframes[0], (int, float)):
+        flat = list(keyframes)
+    else:
+        flat = [v for keyframe in keyframes for v in keyframe]
+    if not flat or len(flat) % 3 != 0:
+        raise ValueError("keyframes must be a non-empty sequence of (t, x, y)")
+    times = flat[0::3]
+    if not all(0 <= t < float("inf") for t in times):
+        raise ValueError("keyframe times must be finite and not negative")
+    if any(b < a for a, b in zip(times, times[1:])):
+        raise ValueError("keyframe times must not decrease")
+    return flat
+
+
+class _GestureDispatcher:
+    """
+    Delivers `gesture_move`/`gesture_leave` events to their handlers.
+
+    With `GestureDispatch.LATEST` events for the control are run one at a time;
+    moves that arrive while a handler is running replace any pending move, and
+    leave events are always delivered in order.
+    """
+
+    def __init__(self):
+        self.policy = GestureDispatch.ALL
+        self.executor: Optional[Executor] = None
+        self.handlers: Dict[str, Any] = {}
+        self.observers: List[Callable[[TiltGestureEvent], None]] = []
+        self.state = TiltState()
+        # quantized moves: last grid cell and grid steps of the gesture
+        self.__cell: Optional[List[int]] = None
+        self.__grid: Tuple[float, float] = (1.0, 1.0)
+        self.__cell_type = GesturesType.NONE
+        self.__pending: Deque[TiltGestureEvent] = deque()
+        self.__running = False
+
+    async def dispatch(self, e: ControlEvent):
+        # always decoded: quantized deltas and the state mirror need every event
+        decoded = self.__decode(e)
+        if decoded is None:
+            return
+        event = TiltGestureEvent(e, decoded)
+        self.state = TiltState(
+            event.x,
+            event.y,
+            event.angle,
+            event.gestures_type,
+            event.name == "gesture_move",
+            time.time(),
+        )
+        for observer in self.observers:
+            try:
+                observer(event)
+            except Exception:
+                logger.exception("Error in %s observer", event.name)
+        if self.handlers.get(e.name) is None:
+            return
+        if self.policy is GestureDispatch.ALL:
+            await self.__run(event)
+            return
+
+        pending = self.__pending
+        if (
+            event.name == "gesture_move"
+            and pending
+            and pending[-1].name == "gesture_move"
+        ):
+            pending[-1] = event
+        else:
+            pending.append(event)
+        if self.__running:
+            return
+
+        self.__running = True
+        try:
+            while pending:
+                await self.__run(pending.popleft())
+        finally:
+            self.__running = False
+
+    def __decode(
+        self, e: ControlEvent
+    ) -> Optional[Tuple[float, float, float, GesturesType]]:
+        values = json.loads(e.data)
+        if len(values) == 3:
+            # quantized move: delta in grid units from the previous one
+            cell = self.__cell
+            if cell is None:
+                # no base to apply it to (e.g. the control was re-created):
+                # dropped, the client sends an absolute cell on the next gesture
+                logger.debug("Dropped gesture_move delta without a previous move")
+                return None
+            cell[0] += values[0]
+            cell[1] += values[1]
+            cell[2] += values[2]
+        elif len(values) == 6:
+            # first quantized move: absolute grid cell and grid steps
+            qx, qy, qa, gestures_type, precision, angle_precision = values
+            self.__cell = cell = [qx, qy, qa]
+            self.__grid = (precision, angle_precision)
+            self.__cell_type = _GESTURES_TYPES[gestures_type]
+        else:
+            x, y, angle, gestures_type = values
+            if e.name == "gesture_leave":
+                self.__cell = None
+            return x, y, angle, _GESTURES_TYPES[gestures_type]
+        precision, angle_precision = self.__grid
+        return (
+            cell[0] * precision,
+            cell[1] * precision,
+            cell[2] * angle_precision,
+            self.__cell_type,
+        )
+
+    def mirror_batch(self, e: "TiltGestureBatchEvent") -> "TiltGestureBatchEvent":
+        if len(e):
+            self.state = TiltState(
+                float(e.x[-1]),
+                float(e.y[-1]),
+                float(e.angle[-1]),
+                e.gestures_type,
+                True,
+                time.time(),
+            )
+        return e
+
+    async def mirror_state(self, e: ControlEvent):
+        # a coroutine so it runs on the loop without going through a thread
+        x, y, angle, gestures_type, active = json.loads(e.data)
+        self.state = TiltState(
+            x, y, angle, _GESTURES_TYPES[gestures_type], bool(active), time.time()
+        )
+
+    async def __run(self, e: "TiltGestureEvent"):
+        # Handler errors are logged, whichever way the handler runs
+        handler = self.handlers.get(e.name)
+        if handler is None:
+            return
+        if asyncio.iscoroutinefunction(handler):
+            try:
+                await handler(e)
+            except Exception:
+                logger.exception("Error in %s handler", e.name)
+        elif self.policy is GestureDispatch.ALL and self.executor is None:
+            e.page.run_thread(_call_handler, handler, e)
+        elif is_pyodide():
+            # no threads: run inline like Page.run_thread
+            _call_handler(handler, e)
+        else:
+            # wait for the handler so "latest" knows when it is done; the
+            # session page is set as Page.run_thread does
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor or e.page.executor,
+                contextvars.copy_context().run,
+                _call_handler,
+                handler,
+                e,
+            )
+
+
+def _call_handler(handler: Callable[[Any], Any], e: ControlEvent):
+    _session_page.set(e.page)
+    try:
+        handler(e)
+    except Exception:
+        logger.exception("Error in %s handler", e.name)
+
+
+_GESTURES_TYPES = {t.value: t for t in GesturesType}
+
+
+class TiltState:
+    """
+    Latest known tilt state of a `FletTilt`, see `FletTilt.state`.
+
+    `x`/`y` are the gesture position in logical pixels, `angle` the tilt angle
+    in degrees, `active` is False after the gesture left, and `updated_at` is
+    the `time.time()` of the update (None before the first one). A new object
+    is created for every update, so a state read once is never half-updated.
+    """
+
+    __slots__ = ("x", "y", "angle", "gestures_type", "active", "updated_at")
+
+    def __init__(
+        self,
+        x: float = 0.0,
+        y: float = 0.0,
+        angle: float = 0.0,
+        gestures_type: GesturesType = GesturesType.NONE,
+        active: bool = False,
+        updated_at: Optional[float] = None,
+    ):
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.gestures_type = gestures_type
+        self.active = active
+        self.updated_at = updated_at
+
+    def __repr__(self):
+        return (
+            f"TiltState(x={self.x!r}, y={self.y!r}, angle={self.angle!r}, "
+            f"gestures_type={self.gestures_type!r}, active={self.active!r}, "
+            f"updated_at={self.updated_at!r})"
+        )
+
+
+class TiltGestureEvent(ControlEvent):
+    """
+    Gesture event sent by `on_gesture_move` and `on_gesture_leave`.
+
+    The client sends a positional `[x, y, angle, gestures_type]` array which is
+    decoded once here, or quantized values already decoded by the control
+    (see `FletTilt.gesture_precision`). `x`/`y` are the gesture position in
+    logical pixels and `angle` the current tilt angle in degrees.
+    """
+
+    def __init__(
+        self,
+        e: ControlEvent,
+        decoded: Optional[Tuple[float, float, float, GesturesType]] = None,
+    ):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        if decoded is None:
+            x, y, angle, gestures_type = json.loads(e.data)
+            decoded = (x, y, angle, _GESTURES_TYPES[gestures_type])
+        self.x: float
+        self.y: float
+        self.angle: float
+        self.gestures_type: GesturesType
+        self.x, self.y, self.angle, self.gestures_type = decoded
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, x={self.x!r}, "
+            f"y={self.y!r}, angle={self.angle!r}, "
+            f"gestures_type={self.gestures_type!r})"
+        )
+
+    __str__ = __repr__
+
+
+def _packed(values: List[float]):
+    if np is not None:
+        return np.array(values, dtype=np.float64)
+    return array("d", values)
+
+
+class TiltGestureBatchEvent(ControlEvent):
+    """
+    Gesture move samples collected by the client over one batch window.
+
+    `timestamps` (ms since the first sample), `x`, `y` and `angle` are packed
+    float64 arrays: NumPy arrays when NumPy is installed, `array("d")`
+    otherwise.
+    """
+
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        d = json.loads(e.data)
+        self.gestures_type: GesturesType = _GESTURES_TYPES[d["t"]]
+        self.timestamps = _packed(d["ts"])
+        self.x = _packed(d["x"])
+        self.y = _packed(d["y"])
+        self.angle = _packed(d["a"])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+class TiltGestureSessionEvent(ControlEvent):
+    """
+    Summary of one gesture interaction, sent by `on_gesture_session` when it
+    ends (leave, or a change of gesture type).
+
+    `duration_ms` runs from the first move to the end, `path_length` is the
+    distance travelled in logical pixels, `max_angle`/`mean_angle` are over
+    the moves in degrees, and `entry_*`/`exit_*` are the first and last
+    positions.
+    """
+
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        # Positional: [gestures_type, duration_ms, moves, path_length,
+        # max_angle, mean_angle, entry_x, entry_y, exit_x, exit_y]
+        values = json.loads(e.data)
+        self.gestures_type: GesturesType = _GESTURES_TYPES[values[0]]
+        self.duration_ms: int = values[1]
+        self.moves: int = values[2]
+        self.path_length: float = values[3]
+        self.max_angle: float = values[4]
+        self.mean_angle: float = values[5]
+        self.entry_x: float = values[6]
+        self.entry_y: float = values[7]
+        self.exit_x: float = values[8]
+        self.exit_y: float = values[9]
+
+    def __repr__(self):
+        return (
+            f"TiltGestureSessionEvent(gestures_type={self.gestures_type!r}, "
+            f"duration_ms={self.duration_ms!r}, moves={self.moves!r}, "
+            f"path_length={self.path_length!r}, max_angle={self.max_angle!r}, "
+            f"mean_angle={self.mean_angle!r}, "
+            f"entry=({self.entry_x!r}, {self.entry_y!r}), "
+            f"exit=({self.exit_x!r}, {self.exit_y!r}))"
+        )
+
+
+class TiltVisibilityChangeEvent(ControlEvent):
+    """
+    Visibility change of a `pause_when_offscreen` card.
+
+    `visible_fraction` is the visible part of the card (0.0 to 1.0); the card
+    is paused while it is 0.
+    """
+
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        self.visible_fraction: float = float(e.data)
+        self.visible: bool = self.visible_fraction > 0
+
+
+class TiltFpsChangeEvent(ControlEvent):
+    """
+    Tilt update rate chosen by `fps="auto"`.
+
+    `fps` is the new rate and `effects_reduced` tells whether light and shadow
+    are currently turned off to keep up.
+    """
+
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        fps, effects_reduced = json.loads(e.data)
+        self.fps: int = fps
+        self.effects_reduced: bool = bool(effects_reduced)
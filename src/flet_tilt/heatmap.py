@@ -0,0 +1,235 @@
+import time
+from array import array
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .flet_tilt import FletTilt, TiltGestureEvent
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Decay weights are rescaled before they overflow a float (2 ** 1024)
+_MAX_HALF_LIVES = 300
+
+
+class HeatmapStats(NamedTuple):
+    events: int
+    sessions: int
+    dwell_seconds: float
+    max_angle: float
+    mean_angle: float
+
+
+class TiltHeatmap:
+    """
+    Bins the gesture positions of `FletTilt` controls into a fixed-size 2D
+    histogram, so memory stays O(bins) however many events arrive.
+
+    Positions are in logical pixels of the widget, binned over
+    `width` x `height` (the control's `width`/`height` by default); positions
+    outside the widget fall into the edge bins. With `half_life` (seconds)
+    older moves fade out exponentially. The histogram is a NumPy array when
+    NumPy is installed, else a flat `array("d")`.
+
+    Alongside the histogram it keeps session stats: a session runs from the
+    first move to `gesture_leave`, its dwell time is the time between them.
+    Batched moves (`gesture_batch_window_ms`) are not observed.
+
+    Example:
+    ```python
+    heatmap = TiltHeatmap(bins=(24, 32))
+    heatmap.attach(card)
+    page.update()
+    ...
+    counts = heatmap.histogram()
+    print(heatmap.stats.dwell_seconds)
+    ```
+    """
+
+    def __init__(
+        self,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+        bins: Union[int, Tuple[int, int]] = 32,
+        half_life: Optional[float] = None,
+        use_numpy: Optional[bool] = None,
+    ):
+        self.width = width
+        self.height = height
+        self.bins_x, self.bins_y = (bins, bins) if isinstance(bins, int) else bins
+        assert self.bins_x > 0 and self.bins_y > 0, "bins must be positive"
+        self.half_life = half_life
+        self.__numpy = np is not None if use_numpy is None else use_numpy
+        if self.__numpy and np is None:
+            raise ImportError("use_numpy requires numpy")
+        self.__observers: Dict[FletTilt, Any] = {}
+        self.reset()
+
+    def reset(self):
+        """Clear the histogram and the stats."""
+        size = self.bins_x * self.bins_y
+        self.__counts = (
+            np.zeros(size, dtype=np.float64)
+            if self.__numpy
+            else array("d", [0.0]) * size
+        )
+        # Decay: a move at time t is added with weight 2 ** ((t - t0) / half_life)
+        # and the histogram is read divided by the current weight, so older
+        # moves fade without touching every bin on each event.
+        self.__t0: Optional[float] = None
+        self.__events = 0
+        self.__sessions = 0
+        self.__dwell = 0.0
+        self.__max_angle = 0.0
+        self.__angle_sum = 0.0
+        self.__session_start: Dict[FletTilt, float] = {}
+
+    def attach(
+        self,
+        control: FletTilt,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+    ):
+        """
+        Start binning the gestures of `control`. Its size is `width` and
+        `height`, else the control's, else the heatmap's; all controls of a
+        heatmap share one extent, so a control of another size is rejected.
+        Call `page.update()` afterwards so the client starts sending the
+        events.
+        """
+        width = width or control.width or self.width
+        height = height or control.height or self.height
+        if not width or not height:
+            raise ValueError("heatmap needs a width and height to bin positions")
+        if self.width and self.height and (width, height) != (self.width, self.height):
+            raise ValueError(
+                f"control size {width}x{height} differs from the heatmap's "
+                f"{self.width}x{self.height}"
+            )
+        self.width = width
+        self.height = height
+
+        def observer(e: TiltGestureEvent):
+            if e.name == "gesture_move":
+                self.add(e.x, e.y, e.angle, control=control)
+            else:
+                self.end_session(control)
+
+        self.detach(control)
+        self.__observers[control] = observer
+        control._add_gesture_observer(observer)
+
+    def detach(self, control: FletTilt):
+        observer = self.__observers.pop(control, None)
+        if observer is not None:
+            control._remove_gesture_observer(observer)
+        self.__session_start.pop(control, None)
+
+    def close(self):
+        for control in list(self.__observers):
+            self.detach(control)
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        angle: float = 0.0,
+        t: Optional[float] = None,
+        control: Optional[FletTilt] = None,
+    ):
+        """Bin one move at `t` (`time.monotonic()` by default)."""
+        t = time.monotonic() if t is None else t
+        if control not in self.__session_start:
+            self.__session_start[control] = t
+            self.__sessions += 1
+        # before indexing: the weight may rescale the stored counts
+        weight = self.__weight(t)
+        ix = min(max(int(x / self.width * self.bins_x), 0), self.bins_x - 1)
+        iy = min(max(int(y / self.height * self.bins_y), 0), self.bins_y - 1)
+        self.__counts[iy * self.bins_x + ix] += weight
+        self.__events += 1
+        self.__angle_sum += angle
+        if angle > self.__max_angle:
+            self.__max_angle = angle
+
+    def end_session(
+        self, control: Optional[FletTilt] = None, t: Optional[float] = None
+    ):
+        """End the session of `control` (on `gesture_leave`) and add its dwell."""
+        start = self.__session_start.pop(control, None)
+        if start is not None:
+            self.__dwell += (time.monotonic() if t is None else t) - start
+
+    def histogram(self, normalize: bool = False, t: Optional[float] = None):
+        """
+        Bin values as rows of y: a (bins_y, bins_x) NumPy array, or a list of
+        rows without NumPy. With decay a bin holds the moves' weight decayed
+        to `t` (now by default); `normalize` scales the values to sum to 1.
+        """
+        scale = self.__scale(time.monotonic() if t is None else t)
+        if normalize:
+            total = (
+                self.__counts.sum() if self.__numpy else sum(self.__counts)
+            ) * scale
+            scale = scale / total if total > 0 else 0.0
+        if self.__numpy:
+            return (self.__counts * scale).reshape(self.bins_y, self.bins_x)
+        counts = [v * scale for v in self.__counts]
+        return [
+            counts[row * self.bins_x : (row + 1) * self.bins_x]
+            for row in range(self.bins_y)
+        ]
+
+    def edges(self) -> Tuple[List[float], List[float]]:
+        """Bin edges in pixels along x and y."""
+        return (
+            [self.width * i / self.bins_x for i in range(self.bins_x + 1)],
+            [self.height * i / self.bins_y for i in range(self.bins_y + 1)],
+        )
+
+    @property
+    def stats(self) -> HeatmapStats:
+        """Summary stats; open sessions count towards dwell up to now."""
+        now = time.monotonic()
+        dwell = self.__dwell + sum(now - s for s in self.__session_start.values())
+        return HeatmapStats(
+            self.__events,
+            self.__sessions,
+            dwell,
+            self.__max_angle,
+            self.__angle_sum / self.__events if self.__events else 0.0,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Histogram, bin edges and stats, e.g. for storage or charting."""
+        x_edges, y_edges = self.edges()
+        return {
+            "histogram": self.histogram(),
+            "x_edges": x_edges,
+            "y_edges": y_edges,
+            **self.stats._asdict(),
+        }
+
+    def __weight(self, t: float) -> float:
+        if not self.half_life:
+            return 1.0
+        if self.__t0 is None:
+            self.__t0 = t
+        half_lives = (t - self.__t0) / self.half_life
+        if half_lives > _MAX_HALF_LIVES:
+            # Move the origin to t: decay the stored values to it once
+            scale = 2.0**-half_lives
+            if self.__numpy:
+                self.__counts *= scale
+            else:
+                for i, value in enumerate(self.__counts):
+                    self.__counts[i] = value * scale
+            self.__t0 = t
+            return 1.0
+        return 2.0**half_lives
+
+    def __scale(self, t: float) -> float:
+        if not self.half_life or self.__t0 is None:
+            return 1.0
+        return 2.0 ** (-(t - self.__t0) / self.half_life)
@@ -0,0 +1,147 @@
+import json
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from flet.core.control import Control
+from flet.core.control_event import ControlEvent
+
+
+class TiltMetrics:
+    """
+    Runtime counters of one `FletTilt` control, as measured by the client.
+
+    Counters are cumulative since the control was mounted. `fps` is the tilt
+    update rate over the last second, 0 while the card is idle.
+    """
+
+    __slots__ = (
+        "rebuilds",
+        "config_decodes",
+        "config_decode_ms",
+        "events_emitted",
+        "events_dropped",
+        "bytes_sent",
+        "fps",
+        "uptime_ms",
+    )
+
+    def __init__(
+        self,
+        rebuilds: int = 0,
+        config_decodes: int = 0,
+        config_decode_ms: float = 0.0,
+        events_emitted: int = 0,
+        events_dropped: int = 0,
+        bytes_sent: int = 0,
+        fps: float = 0.0,
+        uptime_ms: int = 0,
+    ):
+        self.rebuilds = rebuilds
+        self.config_decodes = config_decodes
+        self.config_decode_ms = config_decode_ms
+        self.events_emitted = events_emitted
+        self.events_dropped = events_dropped
+        self.bytes_sent = bytes_sent
+        self.fps = fps
+        self.uptime_ms = uptime_ms
+
+    @classmethod
+    def from_json(cls, data: str) -> "TiltMetrics":
+        d = json.loads(data)
+        return cls(
+            rebuilds=d["rebuilds"],
+            config_decodes=d["config_decodes"],
+            config_decode_ms=d["config_decode_us"] / 1000,
+            events_emitted=d["events_emitted"],
+            events_dropped=d["events_dropped"],
+            bytes_sent=d["bytes_sent"],
+            fps=float(d["fps"]),
+            uptime_ms=d["uptime_ms"],
+        )
+
+    def __add__(self, other: "TiltMetrics") -> "TiltMetrics":
+        # fps of a sum is the total tilt update rate, uptime the longest one
+        return TiltMetrics(
+            rebuilds=self.rebuilds + other.rebuilds,
+            config_decodes=self.config_decodes + other.config_decodes,
+            config_decode_ms=self.config_decode_ms + other.config_decode_ms,
+            events_emitted=self.events_emitted + other.events_emitted,
+            events_dropped=self.events_dropped + other.events_dropped,
+            bytes_sent=self.bytes_sent + other.bytes_sent,
+            fps=self.fps + other.fps,
+            uptime_ms=max(self.uptime_ms, other.uptime_ms),
+        )
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TiltMetrics({fields})"
+
+
+class TiltMetricsEvent(ControlEvent):
+    """Periodic `on_metrics` event; `metrics` holds the decoded counters."""
+
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        self.metrics: TiltMetrics = TiltMetrics.from_json(e.data)
+
+
+class TiltMetricsAggregator:
+    """
+    Keeps the latest metrics of many `FletTilt` controls.
+
+    Use `update` as the `on_metrics` handler of every card, or feed it with
+    `add(control, metrics)` after `get_metrics()`. Controls are held weakly,
+    so cards removed and garbage collected drop out by themselves.
+
+    Example:
+    ```python
+    agg = TiltMetricsAggregator()
+    cards = [FletTilt(metrics_interval_ms=5000, on_metrics=agg.update) ...]
+    print(agg.by_page()[page])
+    print(agg.top(5, key="bytes_sent"))
+    ```
+    """
+
+    def __init__(self):
+        self.__latest: "weakref.WeakKeyDictionary[Control, TiltMetrics]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def update(self, e: TiltMetricsEvent):
+        self.add(e.control, e.metrics)
+
+    def add(self, control: Control, metrics: TiltMetrics):
+        self.__latest[control] = metrics
+
+    def remove(self, control: Control):
+        self.__latest.pop(control, None)
+
+    def __len__(self) -> int:
+        return len(self.__latest)
+
+    def items(self) -> List[Tuple[Control, TiltMetrics]]:
+        return list(self.__latest.items())
+
+    def total(self, controls: Optional[Iterable[Control]] = None) -> TiltMetrics:
+        """Sum of the latest metrics of `controls`, or of all known controls."""
+        if controls is None:
+            values = list(self.__latest.values())
+        else:
+            values = [self.__latest[c] for c in controls if c in self.__latest]
+        return sum(values, TiltMetrics())
+
+    def by_page(self) -> Dict[Any, TiltMetrics]:
+        """Totals per page, for charting."""
+        totals: Dict[Any, TiltMetrics] = {}
+        for control, metrics in self.__latest.items():
+            page = control.page
+            totals[page] = totals.get(page, TiltMetrics()) + metrics
+        return totals
+
+    def top(
+        self, n: int = 10, key: str = "bytes_sent"
+    ) -> List[Tuple[Control, TiltMetrics]]:
+        """The `n` most expensive controls by the given metric."""
+        return sorted(
+            self.__latest.items(), key=lambda item: getattr(item[1], key), reverse=True
+        )[:n]
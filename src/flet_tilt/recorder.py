@@ -0,0 +1,247 @@
+import asyncio
+import struct
+import time
+from typing import BinaryIO, Dict, List, Mapping, NamedTuple, Optional, Sequence, Union
+
+from flet.core.control import Control
+from flet.core.event import Event
+
+from .flet_tilt import FletTilt, GesturesType, TiltGestureEvent
+
+# File layout (little endian):
+#   header:  b"FTGR", u8 version
+#   records: u8 kind, then
+#     kind 0 (control): u16 control index, u16 name length, name (utf-8)
+#     kind 1 (move) / 2 (leave): u32 ms since start, u16 control index,
+#       f32 x, f32 y, f32 angle, u8 gestures type
+_MAGIC = b"FTGR"
+_VERSION = 1
+_CONTROL = 0
+_MOVE = 1
+_LEAVE = 2
+_HEADER = struct.Struct("<4sB")
+_KIND = struct.Struct("<B")
+_CONTROL_HEAD = struct.Struct("<HH")
+_GESTURE = struct.Struct("<IHfffB")
+
+_KINDS = {"gesture_move": _MOVE, "gesture_leave": _LEAVE}
+_EVENT_NAMES = {_MOVE: "gesture_move", _LEAVE: "gesture_leave"}
+_GESTURES_TYPES = list(GesturesType)
+_GESTURES_TYPE_CODES = {t: i for i, t in enumerate(_GESTURES_TYPES)}
+
+
+class GestureRecord(NamedTuple):
+    timestamp_ms: int
+    control: str
+    name: str
+    x: float
+    y: float
+    angle: float
+    gestures_type: GesturesType
+
+
+class GestureRecorder:
+    """
+    Records the `gesture_move`/`gesture_leave` streams of `FletTilt` controls
+    into a compact binary file (20 bytes per event).
+
+    Events are captured as Python receives them, whatever the controls'
+    handlers are; batched moves (`gesture_batch_window_ms`) are not recorded.
+    Each attached control is stored under a name (its `key` by default) so
+    the recording can be replayed against other controls.
+
+    Example:
+    ```python
+    with GestureRecorder("session.ftgr") as recorder:
+        for i, card in enumerate(cards):
+            recorder.attach(card, f"card{i}")
+        ...
+    ```
+    """
+
+    def __init__(self, file: Union[str, BinaryIO]):
+        self.__file: BinaryIO = open(file, "wb") if isinstance(file, str) else file
+        self.__owns_file = isinstance(file, str)
+        self.__file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self.__start = time.monotonic()
+        self.__indexes: Dict[str, int] = {}
+        self.__observers: Dict[FletTilt, object] = {}
+        self.count = 0
+
+    def attach(self, control: FletTilt, name: Optional[str] = None):
+        """Start recording `control` under `name` (default: `key`, then `uid`)."""
+        name = name or control.key or control.uid
+        assert name, "control must have a name, a key or be added to a page"
+        index = self.__indexes.get(name)
+        if index is None:
+            index = self.__indexes[name] = len(self.__indexes)
+            encoded = name.encode("utf-8")
+            self.__file.write(
+                _KIND.pack(_CONTROL)
+                + _CONTROL_HEAD.pack(index, len(encoded))
+                + encoded
+            )
+
+        def observer(e: TiltGestureEvent):
+            self.__write(index, e)
+
+        self.detach(control)
+        self.__observers[control] = observer
+        control._add_gesture_observer(observer)
+
+    def detach(self, control: FletTilt):
+        observer = self.__observers.pop(control, None)
+        if observer is not None:
+            control._remove_gesture_observer(observer)
+
+    def close(self):
+        for control in list(self.__observers):
+            self.detach(control)
+        if self.__owns_file:
+            self.__file.close()
+        else:
+            self.__file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __write(self, index: int, e: TiltGestureEvent):
+        self.__file.write(
+            _KIND.pack(_KINDS[e.name])
+            + _GESTURE.pack(
+                int((time.monotonic() - self.__start) * 1000),
+                index,
+                e.x,
+                e.y,
+                e.angle,
+                _GESTURES_TYPE_CODES[e.gestures_type],
+            )
+        )
+        self.count += 1
+
+
+def read_recording(file: Union[str, BinaryIO]) -> List[GestureRecord]:
+    """Read all events of a recording."""
+    if isinstance(file, str):
+        with open(file, "rb") as f:
+            return read_recording(f)
+
+    data = file.read()
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("not a flet_tilt gesture recording")
+
+    names: Dict[int, str] = {}
+    records = []
+    offset = _HEADER.size
+    while offset < len(data):
+        (kind,) = _KIND.unpack_from(data, offset)
+        offset += _KIND.size
+        if kind == _CONTROL:
+            index, length = _CONTROL_HEAD.unpack_from(data, offset)
+            offset += _CONTROL_HEAD.size
+            names[index] = data[offset : offset + length].decode("utf-8")
+            offset += length
+        elif kind in _EVENT_NAMES:
+            t, index, x, y, angle, type_code = _GESTURE.unpack_from(data, offset)
+            offset += _GESTURE.size
+            records.append(
+                GestureRecord(
+                    t,
+                    names[index],
+                    _EVENT_NAMES[kind],
+                    x,
+                    y,
+                    angle,
+                    _GESTURES_TYPES[type_code],
+                )
+            )
+        else:
+            raise ValueError(f"unknown record kind {kind} at offset {offset - 1}")
+    return records
+
+
+class ReplayStats(NamedTuple):
+    events: int
+    seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds > 0 else float("inf")
+
+
+class GestureReplayer:
+    """
+    Replays a recording through a page's event pipeline
+    (`Page.on_event_async`) the way the socket server delivers client events:
+    each event runs as its own task, started at its recorded time, so
+    handlers overlap and `GestureDispatch.LATEST` collapses moves as it would
+    with a live client.
+
+    `speed` is the playback rate: 1 for real time, 10 for ten times faster,
+    or None to deliver events as fast as possible.
+    """
+
+    def __init__(self, file: Union[str, BinaryIO, Sequence[GestureRecord]]):
+        self.records: Sequence[GestureRecord] = (
+            file if isinstance(file, (list, tuple)) else read_recording(file)
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """Recorded control names, in order of first appearance."""
+        return list(dict.fromkeys(r.control for r in self.records))
+
+    async def replay_async(
+        self,
+        page,
+        controls: Union[Mapping[str, Control], Sequence[Control]],
+        speed: Optional[float] = 1.0,
+    ) -> ReplayStats:
+        """
+        Replay against `controls`: a mapping of recorded name to control, or a
+        sequence matched to `names` in order. Events of unmapped names are
+        skipped.
+        """
+        if not isinstance(controls, Mapping):
+            controls = dict(zip(self.names, controls))
+        events = [
+            (
+                r.timestamp_ms,
+                Event(
+                    controls[r.control].uid,
+                    r.name,
+                    f'[{r.x},{r.y},{r.angle},"{r.gestures_type.value}"]',
+                ),
+            )
+            for r in self.records
+            if r.control in controls
+        ]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        first = events[0][0] if events else 0
+        tasks = []
+        for t, event in events:
+            if speed:
+                delay = (t - first) / 1000 / speed - (loop.time() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(page.on_event_async(event)))
+        await asyncio.gather(*tasks)
+        return ReplayStats(len(events), loop.time() - start)
+
+    def replay(
+        self,
+        page,
+        controls: Union[Mapping[str, Control], Sequence[Control]],
+        speed: Optional[float] = 1.0,
+    ) -> ReplayStats:
+        """Blocking `replay_async`, for pages whose loop is not running here."""
+        coro = self.replay_async(page, controls, speed)
+        if page.loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coro, page.loop).result()
+        return page.loop.run_until_complete(coro)
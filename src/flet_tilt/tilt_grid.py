@@ -0,0 +1,348 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from flet.core.constrained_control import ConstrainedControl
+from flet.core.control import OptionalNumber, Control
+from flet.core.control_event import ControlEvent
+from flet.core.ref import Ref
+from flet.core.types import PaddingValue
+
+from .flet_tilt import (
+    FletTilt,
+    LightConfig,
+    ParallaxConfig,
+    ShadowConfig,
+    TiltConfig,
+    TiltPreset,
+)
+
+
+class TiltGrid(ConstrainedControl):
+    """
+    Virtualized grid of `FletTilt` cards.
+
+    Only the cards in or near the viewport exist: the client reports its
+    visible index range while scrolling, and the grid builds the card content
+    for that range with `item_builder(index)`. `FletTilt` instances of cards
+    that scroll away are kept and reused for new ones, so the number of
+    controls depends on the viewport, not on `item_count`. Until the first
+    range arrives the first `initial_count` cards are built, so the first
+    frame already has content.
+
+    All cards share the grid's `border_radius`, configs and `preset`.
+    """
+
+    def __init__(
+        self,
+        item_count: int = 0,
+        item_builder: Optional[Callable[[int], Control]] = None,
+        #
+        # Control
+        #
+        ref: Optional[Ref] = None,
+        opacity: OptionalNumber = None,
+        tooltip: Optional[str] = None,
+        visible: Optional[bool] = None,
+        data: Any = None,
+        #
+        # ConstrainedControl
+        #
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+        expand: Union[None, bool, int] = None,
+        #
+        # TiltGrid specific
+        #
+        runs_count: Optional[int] = None,
+        max_extent: OptionalNumber = None,
+        child_aspect_ratio: OptionalNumber = None,
+        spacing: OptionalNumber = None,
+        run_spacing: OptionalNumber = None,
+        padding: PaddingValue = None,
+        horizontal: Optional[bool] = None,
+        overscan: int = 12,
+        initial_count: int = 24,
+        border_radius: OptionalNumber = None,
+        tilt_config: Optional[Union[TiltConfig, dict]] = None,
+        light_config: Optional[Union[LightConfig, dict]] = None,
+        shadow_config: Optional[Union[ShadowConfig, dict]] = None,
+        parallax_config: Optional[Union[ParallaxConfig, dict]] = None,
+        preset: Optional[Union[TiltPreset, str]] = None,
+        fps: Optional[Union[int, str]] = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            ref=ref,
+            tooltip=tooltip,
+            opacity=opacity,
+            visible=visible,
+            data=data,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            width=width,
+            height=height,
+            expand=expand,
+        )
+
+        self.__lock = threading.Lock()
+        self.__cards: Dict[int, FletTilt] = {}
+        self.__pool: List[FletTilt] = []
+        # None until the client reports its viewport
+        self.__first = 0
+        self.__last: Optional[int] = None
+
+        self.item_count = item_count
+        self.item_builder = item_builder
+        self.runs_count = runs_count
+        self.max_extent = max_extent
+        self.child_aspect_ratio = child_aspect_ratio
+        self.spacing = spacing
+        self.run_spacing = run_spacing
+        self.padding = padding
+        self.horizontal = horizontal
+        self.overscan = overscan
+        self.initial_count = initial_count
+        self.border_radius = border_radius
+        self.tilt_config = tilt_config
+        self.light_config = light_config
+        self.shadow_config = shadow_config
+        self.parallax_config = parallax_config
+        self.preset = preset
+        self.fps = fps
+
+        self._add_event_handler("range_change", self.__on_range_change)
+
+    def _get_control_name(self):
+        return "flet_tilt_grid"
+
+    def _get_children(self):
+        return [self.__cards[i] for i in sorted(self.__cards)]
+
+    def before_update(self):
+        super().before_update()
+        self._set_attr_json("padding", self.__padding)
+        with self.__lock:
+            self.__materialize()
+            for card in self.__cards.values():
+                self.__configure(card)
+
+    def refresh(self):
+        """Build the content of every materialized card again and update."""
+        with self.__lock:
+            for index, card in self.__cards.items():
+                card.child = self.__build_item(index)
+        self.update()
+
+    def __on_range_change(self, e: ControlEvent):
+        first, last = (int(v) for v in e.data.split(","))
+        with self.__lock:
+            if (first, last) == (self.__first, self.__last):
+                return
+            self.__first, self.__last = first, last
+        self.update()
+
+    def __materialize(self):
+        if self.__last is None:
+            start = 0
+            end = min(self.__item_count, self.__initial_count)
+        else:
+            start = max(0, self.__first - self.__overscan)
+            end = min(self.__item_count, self.__last + self.__overscan + 1)
+
+        # cards that left the window go back to the pool
+        for index in [i for i in self.__cards if not start <= i < end]:
+            card = self.__cards.pop(index)
+            card.child = None
+            self.__pool.append(card)
+
+        for index in range(start, end):
+            if index in self.__cards:
+                continue
+            card = self.__pool.pop() if self.__pool else FletTilt()
+            card._set_attr("gridIndex", index)
+            card.child = self.__build_item(index)
+            self.__cards[index] = card
+
+    def __build_item(self, index: int) -> Optional[Control]:
+        return self.__item_builder(index) if self.__item_builder else None
+
+    def __configure(self, card: FletTilt):
+        card.border_radius = self.border_radius
+        card.tilt_config = self.__tilt_config
+        card.light_config = self.__light_config
+        card.shadow_config = self.__shadow_config
+        card.parallax_config = self.__parallax_config
+        card.preset = self.preset
+        card.fps = self.fps
+
+    # item_count
+    @property
+    def item_count(self) -> int:
+        return self.__item_count
+
+    @item_count.setter
+    def item_count(self, value: int):
+        self.__item_count = max(0, value)
+        self._set_attr("itemCount", self.__item_count)
+
+    # item_builder
+    @property
+    def item_builder(self) -> Optional[Callable[[int], Control]]:
+        """Builds the content of the card at the given index."""
+        return self.__item_builder
+
+    @item_builder.setter
+    def item_builder(self, value: Optional[Callable[[int], Control]]):
+        self.__item_builder = value
+
+    # runs_count
+    @property
+    def runs_count(self) -> Optional[int]:
+        return self._get_attr("runsCount", data_type="int")
+
+    @runs_count.setter
+    def runs_count(self, value: Optional[int]):
+        self._set_attr("runsCount", value)
+
+    # max_extent
+    @property
+    def max_extent(self) -> OptionalNumber:
+        return self._get_attr("maxExtent", data_type="float")
+
+    @max_extent.setter
+    def max_extent(self, value: OptionalNumber):
+        self._set_attr("maxExtent", value)
+
+    # child_aspect_ratio
+    @property
+    def child_aspect_ratio(self) -> OptionalNumber:
+        return self._get_attr("childAspectRatio", data_type="float")
+
+    @child_aspect_ratio.setter
+    def child_aspect_ratio(self, value: OptionalNumber):
+        self._set_attr("childAspectRatio", value)
+
+    # spacing
+    @property
+    def spacing(self) -> OptionalNumber:
+        return self._get_attr("spacing", data_type="float")
+
+    @spacing.setter
+    def spacing(self, value: OptionalNumber):
+        self._set_attr("spacing", value)
+
+    # run_spacing
+    @property
+    def run_spacing(self) -> OptionalNumber:
+        return self._get_attr("runSpacing", data_type="float")
+
+    @run_spacing.setter
+    def run_spacing(self, value: OptionalNumber):
+        self._set_attr("runSpacing", value)
+
+    # padding
+    @property
+    def padding(self) -> PaddingValue:
+        return self.__padding
+
+    @padding.setter
+    def padding(self, value: PaddingValue):
+        self.__padding = value
+
+    # horizontal
+    @property
+    def horizontal(self) -> Optional[bool]:
+        return self._get_attr("horizontal", data_type="bool", def_value=False)
+
+    @horizontal.setter
+    def horizontal(self, value: Optional[bool]):
+        self._set_attr("horizontal", value)
+
+    # overscan
+    @property
+    def overscan(self) -> int:
+        """Cards built before and after the visible range."""
+        return self.__overscan
+
+    @overscan.setter
+    def overscan(self, value: int):
+        self.__overscan = max(0, value)
+
+    # initial_count
+    @property
+    def initial_count(self) -> int:
+        """Cards built before the client reports its visible range."""
+        return self.__initial_count
+
+    @initial_count.setter
+    def initial_count(self, value: int):
+        self.__initial_count = max(0, value)
+
+    # border_radius
+    @property
+    def border_radius(self) -> OptionalNumber:
+        return self.__border_radius
+
+    @border_radius.setter
+    def border_radius(self, value: OptionalNumber):
+        self.__border_radius = value
+
+    # tilt_config
+    @property
+    def tilt_config(self) -> Optional[Union[TiltConfig, dict]]:
+        return self.__tilt_config
+
+    @tilt_config.setter
+    def tilt_config(self, value: Optional[Union[TiltConfig, dict]]):
+        self.__tilt_config = value
+
+    # light_config
+    @property
+    def light_config(self) -> Optional[Union[LightConfig, dict]]:
+        return self.__light_config
+
+    @light_config.setter
+    def light_config(self, value: Optional[Union[LightConfig, dict]]):
+        self.__light_config = value
+
+    # shadow_config
+    @property
+    def shadow_config(self) -> Optional[Union[ShadowConfig, dict]]:
+        return self.__shadow_config
+
+    @shadow_config.setter
+    def shadow_config(self, value: Optional[Union[ShadowConfig, dict]]):
+        self.__shadow_config = value
+
+    # parallax_config
+    @property
+    def parallax_config(self) -> Optional[Union[ParallaxConfig, dict]]:
+        return self.__parallax_config
+
+    @parallax_config.setter
+    def parallax_config(self, value: Optional[Union[ParallaxConfig, dict]]):
+        self.__parallax_config = value
+
+    # preset
+    @property
+    def preset(self) -> Optional[Union[TiltPreset, str]]:
+        return self.__preset
+
+    @preset.setter
+    def preset(self, value: Optional[Union[TiltPreset, str]]):
+        self.__preset = value
+
+    # fps
+    @property
+    def fps(self) -> Optional[Union[int, str]]:
+        return self.__fps
+
+    @fps.setter
+    def fps(self, value: Optional[Union[int, str]]):
+        self.__fps = value
@@ -1,6 +1,8 @@
 import 'package:flet/flet.dart';
 
 import 'flet_tilt.dart';
+import 'tilt_grid.dart';
+import 'tilt_preset.dart';
 
 CreateControlFactory createControl = (CreateControlArgs args) {
   switch (args.control.type) {
@@ -13,6 +15,19 @@ CreateControlFactory createControl = (CreateControlArgs args) {
         parentAdaptive: args.parentAdaptive,
         backend: args.backend,
       );
+    case "flet_tilt_preset":
+      return FletTiltPresetControl(
+        parent: args.parent,
+        control: args.control,
+      );
+    case "flet_tilt_grid":
+      return FletTiltGridControl(
+        parent: args.parent,
+        control: args.control,
+        children: args.children,
+        parentDisabled: args.parentDisabled,
+        backend: args.backend,
+      );
     default:
       return null;
   }
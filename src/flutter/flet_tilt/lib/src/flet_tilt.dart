@@ -1,9 +1,18 @@
 import 'package:flet/flet.dart';
 import 'package:flutter/material.dart';
+import 'package:flutter/scheduler.dart';
 import 'package:flutter_tilt/flutter_tilt.dart';
+import 'dart:async';
+import 'dart:math';
 import 'dart:convert';
 import 'dart:io' show Platform;
 import 'package:flutter/foundation.dart' show kIsWeb;
+import 'package:visibility_detector/visibility_detector.dart';
+
+import 'fps_governor.dart';
+import 'sensor_filter.dart';
+import 'tilt_metrics.dart';
+import 'tilt_preset.dart';
 
 class FletTiltControl extends StatefulWidget {
   final Control? parent;
@@ -26,65 +35,583 @@ class FletTiltControl extends StatefulWidget {
   State<FletTiltControl> createState() => _FletTiltControlState();
 }
 
-class _FletTiltControlState extends State<FletTiltControl> {
+/// Parsed config cached by its source: the raw JSON attribute string or the
+/// preset's decoded map, its JSON patch, plus anything else parsing depends
+/// on (e.g. the theme). Parsing only runs again when one of them changes, and
+/// a new patch is merged into the already decoded source.
+class _ConfigCache<T> {
+  Object? _source;
+  Map<String, dynamic>? _decoded;
+  String? _patch;
+  Object? _dependency;
+  T? _value;
+
+  /// The decoded config with its patch merged; the same map until the
+  /// source or the patch changes.
+  Map<String, dynamic>? config;
+
+  T? resolve(Object? source, String? patch, Object? dependency,
+      T? Function(Map<String, dynamic> config) parse, TiltMetrics metrics) {
+    if (source == _source &&
+        patch == _patch &&
+        identical(dependency, _dependency)) {
+      return _value;
+    }
+    final Stopwatch watch = Stopwatch()..start();
+    try {
+      if (source != _source || _decoded == null) {
+        _decoded = source is String
+            ? jsonDecode(source)
+            : source as Map<String, dynamic>?;
+        config = mergeConfigPatch(_decoded, patch);
+      } else if (patch != _patch) {
+        config = mergeConfigPatch(_decoded, patch);
+      }
+      _source = source;
+      _patch = patch;
+      _dependency = dependency;
+      _value = config != null ? parse(config!) : null;
+    } catch (e) {
+      debugPrint("Error parsing $T: $e");
+      _value = null;
+    }
+    metrics.addConfigDecode(watch.elapsedMicroseconds);
+    return _value;
+  }
+}
+
+class _LayerWidget {
+  final String signature;
+  final Widget widget;
+
+  const _LayerWidget(this.signature, this.widget);
+}
+
+class _FletTiltControlState extends State<FletTiltControl>
+    with TickerProviderStateMixin {
+  static final bool _isMobilePlatform =
+      !kIsWeb && (Platform.isAndroid || Platform.isIOS);
+
+  final _ConfigCache<TiltConfig> _tiltConfig = _ConfigCache();
+  final _ConfigCache<LightConfig> _lightConfig = _ConfigCache();
+  final _ConfigCache<ShadowConfig> _shadowConfig = _ConfigCache();
+  late final Map<String, _ConfigCache> _configCaches = {
+    "tilt_config": _tiltConfig,
+    "light_config": _lightConfig,
+    "shadow_config": _shadowConfig,
+  };
+  Map<String, _LayerWidget> _layerWidgets = {};
+  final TiltMetrics _metrics = TiltMetrics();
+
+  // pause_when_offscreen: tilt, sensors and events are suspended while hidden
+  bool _offscreen = false;
+
+  // gesture_move throttling: the tilt animation runs at full fps, only the
+  // events sent to Python are dropped (dead band) or merged (interval).
+  final Stopwatch _gestureClock = Stopwatch()..start();
+  int _lastGestureMoveAt = -1;
+  Offset? _lastGestureMovePosition;
+  Timer? _gestureMoveTimer;
+  GestureSample? _pendingGestureMove;
+  GesturesType? _pendingGestureMoveType;
+
+  // on_gesture_session: summary of the current interaction, sent on leave
+  GesturesType? _sessionType;
+  int _sessionStart = 0;
+  int _sessionMoves = 0;
+  Offset _sessionEntry = Offset.zero;
+  Offset _sessionLast = Offset.zero;
+  double _sessionPath = 0;
+  double _sessionMaxAngle = 0;
+  double _sessionAngleSum = 0;
+
+  // Sensor moves: sampled at most every sensor_sampling_period, then filtered
+  int _lastSensorSampleAt = -1;
+  SensorFilter? _sensorFilter;
+
+  // gesture_precision: grid cell [x, y, angle] of the last move sent
+  // and the grid steps it was computed with: deltas are only sent on the
+  // same grid, so a precision change mid-gesture sends an absolute cell
+  List<int>? _lastGestureCell;
+  GesturesType? _lastGestureCellType;
+  double _lastGesturePrecision = 0;
+  double _lastGestureAnglePrecision = 0;
+
+  // track_state: latest state, sent at most every stateIntervalMs
+  int _lastStateAt = -1;
+  Timer? _stateTimer;
+  String? _pendingState;
+
+  // gesture_move_batch: samples collected over one window, column-major
+  Timer? _gestureBatchTimer;
+  int _gestureBatchStart = 0;
+  GesturesType? _gestureBatchType;
+  final List<int> _batchTimestamps = [];
+  final List<double> _batchX = [];
+  final List<double> _batchY = [];
+  final List<double> _batchAngle = [];
+
+  // Driven from Python by TiltController (GesturesType.controller)
+  final StreamController<TiltStreamModel> _tiltStreamController =
+      StreamController<TiltStreamModel>.broadcast();
+  Offset _controllerPosition = Offset.zero;
+
+  // Trajectory playback: flat [t, x, y, ...] keyframes, t in ms, stepped on
+  // vsync at most at the effective fps. _trajectoryGestures stays set until
+  // the last stream model is delivered, so its moves are not sent to Python.
+  Ticker? _trajectoryTicker;
+  List<double> _trajectory = const [];
+  bool _trajectoryLoop = false;
+  bool _trajectoryGestures = false;
+  Duration _trajectoryLastStep = Duration.zero;
+
+  // Shared configs registered by a FletTiltPreset control
+  ValueNotifier<TiltPresetConfigs>? _preset;
+
+  // animate_config: field overrides per config, e.g. {"tilt_config":
+  // {"angle": 25.0}}, interpolated from _animatedFrom to _animatedTo. They
+  // are dropped once their config changes from Python (_animatedBase).
+  AnimationController? _configAnimation;
+  Curve _configAnimationCurve = Curves.linear;
+  Map<String, Map<String, double>> _animatedFrom = {};
+  Map<String, Map<String, double>> _animatedTo = {};
+  final Map<String, Map<String, dynamic>?> _animatedBase = {};
+  // Configs parsed with the final values once the animation has finished,
+  // reused while the cached config they override is the same object
+  final Map<String, Object?> _animatedParsed = {};
+  final Map<String, Object?> _animatedParsedOver = {};
+
+  // Values of animatable fields missing from a config (flutter_tilt defaults)
+  static const Map<String, Map<String, double>> _animatableDefaults = {
+    "tilt_config": {"angle": 10.0},
+    "light_config": {"min_intensity": 0.0, "max_intensity": 0.5},
+    "shadow_config": {
+      "min_intensity": 0.0,
+      "max_intensity": 0.5,
+      "min_blur_radius": 0.0,
+      "max_blur_radius": 10.0,
+    },
+  };
+
+  // fps="auto": lowered under frame pressure, raised again with headroom
+  bool _autoFpsEnabled = false;
+  int _autoFps = 60;
+  bool _effectsReduced = false;
+
+  @override
+  void initState() {
+    super.initState();
+    widget.backend.subscribeMethods(widget.control.id, _onMethodCall);
+    _listenPreset();
+    _listenFpsGovernor();
+    _scheduleMetrics();
+  }
+
+  @override
+  void didUpdateWidget(FletTiltControl oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    _listenPreset();
+    _listenFpsGovernor();
+    _scheduleMetrics();
+  }
+
+  @override
+  void dispose() {
+    _preset?.removeListener(_onPresetChanged);
+    FpsGovernor.instance.removeListener(_onFramePressure);
+    _metrics.dispose();
+    widget.backend.unsubscribeMethods(widget.control.id);
+    _trajectoryTicker?.dispose();
+    _tiltStreamController.close();
+    _gestureMoveTimer?.cancel();
+    _gestureBatchTimer?.cancel();
+    _stateTimer?.cancel();
+    _configAnimation?.dispose();
+    super.dispose();
+  }
+
+  void _listenPreset() {
+    final String? name = widget.control.attrString("preset");
+    final ValueNotifier<TiltPresetConfigs>? preset =
+        name != null ? TiltPresets.notifier(name) : null;
+    if (preset == _preset) return;
+    _preset?.removeListener(_onPresetChanged);
+    _preset = preset?..addListener(_onPresetChanged);
+  }
+
+  void _scheduleMetrics() {
+    // Metrics are not counted as sent events
+    _metrics.schedule(
+        widget.control.attrBool("onMetrics", false)!
+            ? widget.control.attrInt("metricsIntervalMs", 0)!
+            : 0,
+        (snapshot) => widget.backend
+            .triggerControlEvent(widget.control.id, "metrics", snapshot));
+  }
+
+  void _sendEvent(String eventName, String data) {
+    _metrics.addEvent(data);
+    widget.backend.triggerControlEvent(widget.control.id, eventName, data);
+  }
+
+  int get _fpsMin => widget.control.attrInt("fpsMin", 15)!;
+  int get _fpsMax => widget.control.attrInt("fpsMax", 60)!;
+
+  void _listenFpsGovernor() {
+    final bool enabled = widget.control.attrString("fps") == "auto";
+    if (enabled == _autoFpsEnabled) {
+      if (enabled) _autoFps = max(_fpsMin, min(_autoFps, _fpsMax));
+      return;
+    }
+    _autoFpsEnabled = enabled;
+    if (enabled) {
+      _autoFps = _fpsMax;
+      _effectsReduced = false;
+      FpsGovernor.instance.addListener(_onFramePressure);
+    } else {
+      _effectsReduced = false;
+      FpsGovernor.instance.removeListener(_onFramePressure);
+    }
+  }
+
+  void _onFramePressure(int pressure) {
+    if (!mounted || _offscreen) return;
+    int fps = _autoFps;
+    bool effectsReduced = _effectsReduced;
+    if (pressure == framePressureHigh) {
+      // Lower fps first; shadow and light go only once fps is at its minimum
+      if (fps > _fpsMin) {
+        fps = max(_fpsMin, fps * 3 ~/ 4);
+      } else if (widget.control.attrBool("autoReduceEffects", false)!) {
+        effectsReduced = true;
+      }
+    } else if (effectsReduced) {
+      effectsReduced = false;
+    } else if (fps < _fpsMax) {
+      fps = min(_fpsMax, fps + 5);
+    }
+    if (fps == _autoFps && effectsReduced == _effectsReduced) return;
+    setState(() {
+      _autoFps = fps;
+      _effectsReduced = effectsReduced;
+    });
+    _triggerFlaggedEvent("onFpsChange", "fps_change",
+        jsonEncode([fps, effectsReduced ? 1 : 0]));
+  }
+
+  void _onVisibilityChanged(VisibilityInfo info) {
+    final bool offscreen = info.visibleFraction == 0;
+    if (!mounted || offscreen == _offscreen) return;
+    if (offscreen) {
+      // Nothing is sent while hidden: flush what was collected, drop the rest
+      _flushGestureBatch();
+      _resetGestureThrottle();
+      _resetSensorSampling();
+      _sessionType = null;
+      _stopTrajectory("offscreen");
+    }
+    setState(() {
+      _offscreen = offscreen;
+    });
+    _triggerFlaggedEvent("onVisibilityChange", "visibility_change",
+        info.visibleFraction.toString());
+  }
+
+  void _onPresetChanged() {
+    if (mounted) setState(() {});
+  }
+
+  /// Config source: the control's own JSON attribute, or else its preset's
+  /// decoded map.
+  Object? _configSource(String name) {
+    return widget.control.attrString(name) ?? _preset?.value[name];
+  }
+
+  String? _configPatch(String name) {
+    return widget.control.attrString("${name}_patch");
+  }
+
+  Map<String, dynamic>? _configMap(String name) {
+    final Object? source = _configSource(name);
+    return mergeConfigPatch(
+        source is String ? jsonDecode(source) : source as Map<String, dynamic>?,
+        _configPatch(name));
+  }
+
+  Future<String?> _onMethodCall(
+      String methodName, Map<String, String> args) async {
+    switch (methodName) {
+      case "controller_move":
+        _stopTrajectory("stopped", release: false);
+        _controllerPosition = Offset(
+          double.tryParse(args["x"] ?? "") ?? 0,
+          double.tryParse(args["y"] ?? "") ?? 0,
+        );
+        _tiltStreamController
+            .add(TiltStreamModel(position: _controllerPosition));
+        break;
+      case "controller_leave":
+        _stopTrajectory("stopped", release: false);
+        _tiltStreamController.add(TiltStreamModel(
+            position: _controllerPosition, gestureUse: false));
+        break;
+      case "trajectory_play":
+        _playTrajectory(
+          (jsonDecode(args["keyframes"] ?? "[]") as List)
+              .map((v) => (v as num).toDouble())
+              .toList(),
+          args["loop"] == "true",
+        );
+        break;
+      case "trajectory_stop":
+        _stopTrajectory("stopped");
+        break;
+      case "get_metrics":
+        return _metrics.toJson();
+      case "animate_config":
+        _animateConfig(
+          jsonDecode(args["targets"] ?? "{}") as Map<String, dynamic>,
+          _parseDuration(jsonDecode(args["duration"] ?? "null")) ??
+              Duration.zero,
+          parseCurve(args["curve"]) ?? Curves.linear,
+        );
+        break;
+    }
+    return null;
+  }
+
+  void _animateConfig(
+      Map<String, dynamic> targets, Duration duration, Curve curve) {
+    // Start from the current values, running animations included
+    final Map<String, Map<String, double>> current = _animatedValues();
+    final Map<String, Map<String, double>> from = {};
+    final Map<String, Map<String, double>> to = {};
+    current.forEach((configName, fields) {
+      from[configName] = Map.of(fields);
+      to[configName] = Map.of(fields);
+    });
+    targets.forEach((configName, fields) {
+      final Map<String, dynamic>? config = _configCaches[configName]?.config;
+      _animatedBase[configName] = config;
+      (fields as Map<String, dynamic>).forEach((key, value) {
+        from.putIfAbsent(configName, () => {}).putIfAbsent(
+            key,
+            () =>
+                (config?[key] as num?)?.toDouble() ??
+                _animatableDefaults[configName]?[key] ??
+                0.0);
+        to.putIfAbsent(configName, () => {})[key] = (value as num).toDouble();
+      });
+    });
+    _animatedFrom = from;
+    _animatedTo = to;
+    _animatedParsed.clear();
+    _animatedParsedOver.clear();
+    _configAnimationCurve = curve;
+    _configAnimation ??= AnimationController(vsync: this)
+      ..addListener(() => setState(() {}));
+    _configAnimation!
+      ..duration = duration
+      ..forward(from: 0);
+  }
+
+  /// Current animate_config overrides, per config.
+  Map<String, Map<String, double>> _animatedValues() {
+    final double t =
+        _configAnimationCurve.transform(_configAnimation?.value ?? 1.0);
+    return _animatedTo.map((configName, fields) => MapEntry(
+        configName,
+        fields.map((key, to) {
+          final double from = _animatedFrom[configName]![key]!;
+          return MapEntry(key, from + (to - from) * t);
+        })));
+  }
+
+  /// Parses a config with its animate_config overrides, or returns [parsed]
+  /// when it has none. Overrides of a config changed from Python are dropped.
+  T? _withAnimatedValues<T>(String configName, T? parsed,
+      Map<String, Map<String, double>> animated,
+      T Function(Map<String, dynamic> config) parse) {
+    final Map<String, double>? fields = animated[configName];
+    if (fields == null) return parsed;
+    final Map<String, dynamic>? config = _configCaches[configName]!.config;
+    if (!identical(config, _animatedBase[configName])) {
+      _animatedFrom.remove(configName);
+      _animatedTo.remove(configName);
+      _animatedBase.remove(configName);
+      _animatedParsed.remove(configName);
+      _animatedParsedOver.remove(configName);
+      return parsed;
+    }
+    // Only parsed on every frame while the animation runs
+    if (_configAnimation?.isAnimating ?? false) {
+      return parse({...?config, ...fields});
+    }
+    if (!_animatedParsed.containsKey(configName) ||
+        !identical(_animatedParsedOver[configName], parsed)) {
+      _animatedParsed[configName] = parse({...?config, ...fields});
+      _animatedParsedOver[configName] = parsed;
+    }
+    return _animatedParsed[configName] as T?;
+  }
+
+  /// Tilt update rate: the governed one with fps="auto", else the fps set.
+  int get _effectiveFps => _autoFpsEnabled
+      ? _autoFps
+      : int.tryParse(widget.control.attrString("fps") ?? "") ?? 60;
+
+  void _playTrajectory(List<double> keyframes, bool loop) {
+    _stopTrajectory("stopped", release: false);
+    if (keyframes.length < 3) return;
+    _trajectory = keyframes;
+    _trajectoryLoop = loop;
+    _trajectoryGestures = true;
+    _trajectoryLastStep = Duration.zero;
+    _trajectoryTicker ??= createTicker(_trajectoryTick);
+    _trajectoryTicker!.start();
+    _trajectoryStep(0);
+    _triggerFlaggedEvent("onTrajectoryStart", "trajectory_start", "");
+  }
+
+  void _trajectoryTick(Duration elapsed) {
+    // Frames come at the display rate: step at most at the effective fps
+    final int fps = _effectiveFps;
+    final int stepMicros = 1000000 ~/ (fps > 0 ? fps : 60);
+    if ((elapsed - _trajectoryLastStep).inMicroseconds < stepMicros) return;
+    _trajectoryLastStep = elapsed;
+    _trajectoryStep(elapsed.inMicroseconds / 1000.0);
+  }
+
+  void _trajectoryStep(double t) {
+    final List<double> k = _trajectory;
+    final double duration = k[k.length - 3];
+    if (t >= duration) {
+      if (!_trajectoryLoop || duration <= 0) {
+        _controllerPosition = Offset(k[k.length - 2], k[k.length - 1]);
+        _tiltStreamController
+            .add(TiltStreamModel(position: _controllerPosition));
+        _stopTrajectory("completed");
+        return;
+      }
+      t %= duration;
+    }
+    // Find the segment [i, i + 3] containing t and interpolate linearly
+    int i = 0;
+    while (i + 3 < k.length - 2 && k[i + 3] <= t) {
+      i += 3;
+    }
+    Offset position = Offset(k[i + 1], k[i + 2]);
+    if (i + 3 < k.length && t > k[i]) {
+      final double span = k[i + 3] - k[i];
+      final double f = span > 0 ? ((t - k[i]) / span).clamp(0.0, 1.0) : 1.0;
+      position = Offset.lerp(position, Offset(k[i + 4], k[i + 5]), f)!;
+    }
+    _controllerPosition = position;
+    _tiltStreamController.add(TiltStreamModel(position: position));
+  }
+
+  void _stopTrajectory(String reason, {bool release = true}) {
+    if (!(_trajectoryTicker?.isActive ?? false)) return;
+    _trajectoryTicker!.stop();
+    if (release) {
+      _tiltStreamController.add(TiltStreamModel(
+          position: _controllerPosition, gestureUse: false));
+    }
+    // Stream models are delivered in a microtask: clear the flag after them,
+    // unless a new trajectory started meanwhile
+    scheduleMicrotask(() {
+      if (!(_trajectoryTicker?.isActive ?? false)) _trajectoryGestures = false;
+    });
+    _triggerFlaggedEvent("onTrajectoryFinish", "trajectory_finish", reason);
+  }
+
+  void _triggerFlaggedEvent(String flag, String eventName, String data) {
+    if (mounted && widget.control.attrBool(flag, false)!) {
+      _sendEvent(eventName, data);
+    }
+  }
+
   @override
   Widget build(BuildContext context) {
-    debugPrint("FletTilt build: ${widget.control.id}");
+    _metrics.rebuilds++;
+    final bool pauseWhenOffscreen =
+        widget.control.attrBool("pauseWhenOffscreen", false)!;
+    if (!pauseWhenOffscreen) _offscreen = false;
 
-    // Parse configurations
-    TiltConfig? tiltConfig = _parseTiltConfig();
-    LightConfig? lightConfig = _parseLightConfig();
-    ShadowConfig? shadowConfig = _parseShadowConfig();
-    ChildLayout childLayout = _parseChildLayout();
+    // Configs are only parsed again when their JSON (or the theme) changes
+    final ThemeData theme = Theme.of(context);
+    TiltConfig? tiltConfig = _tiltConfig.resolve(
+        _configSource("tilt_config"),
+        _configPatch("tilt_config"),
+        _offscreen,
+        _parseTiltConfig,
+        _metrics);
+    LightConfig? lightConfig = _lightConfig.resolve(
+        _configSource("light_config"),
+        _configPatch("light_config"),
+        theme,
+        (config) => _parseLightConfig(config, theme),
+        _metrics);
+    ShadowConfig? shadowConfig = _shadowConfig.resolve(
+        _configSource("shadow_config"),
+        _configPatch("shadow_config"),
+        theme,
+        (config) => _parseShadowConfig(config, theme),
+        _metrics);
+    if (_animatedTo.isNotEmpty) {
+      final Map<String, Map<String, double>> animated = _animatedValues();
+      tiltConfig = _withAnimatedValues(
+          "tilt_config", tiltConfig, animated, _parseTiltConfig);
+      lightConfig = _withAnimatedValues("light_config", lightConfig, animated,
+          (config) => _parseLightConfig(config, theme));
+      shadowConfig = _withAnimatedValues("shadow_config", shadowConfig,
+          animated, (config) => _parseShadowConfig(config, theme));
+    }
+    final bool cacheChild = widget.control.attrBool("cacheChild", false)!;
+    ChildLayout childLayout = _parseChildLayout(cacheChild);
 
     // Parse other properties
     double? borderRadius = widget.control.attrDouble("borderRadius");
     bool disable = widget.control.attrBool("disable", false)!;
-    int fps = widget.control.attrInt("fps") ?? 60;
-    // LightShadowMode not available in current flutter_tilt version
+    int fps = _effectiveFps;
+    final LightShadowMode lightShadowMode =
+        _parseLightShadowMode(widget.control.attrString("lightShadowMode"));
 
-    // Get child widget
+    // Get child widget (the only child without a layer name; a control
+    // moved out of a layer has its name cleared to "")
     Widget? child;
-    if (widget.children.isNotEmpty) {
+    final Control? childControl =
+        widget.children.where((c) => c.name?.isNotEmpty != true).firstOrNull;
+    if (childControl != null) {
       child = createControl(
-          widget.control, widget.children.first.id, widget.control.isDisabled);
+          widget.control, childControl.id, widget.control.isDisabled);
+      // Own layer: tilt transforms move it without repainting its subtree
+      if (cacheChild) child = RepaintBoundary(child: child);
     }
 
     // Create Tilt widget
     Widget tiltWidget = Tilt(
       borderRadius:
           borderRadius != null ? BorderRadius.circular(borderRadius) : null,
-      tiltConfig: tiltConfig ?? const TiltConfig(),
-      lightConfig: lightConfig ?? const LightConfig(),
-      shadowConfig: shadowConfig ?? const ShadowConfig(),
+      // Without a config: flutter_tilt's defaults, with sensors off while
+      // the card is paused off-screen
+      tiltConfig: tiltConfig ??
+          (_offscreen
+              ? const TiltConfig(enableGestureSensors: false)
+              : const TiltConfig()),
+      lightConfig: _effectsReduced
+          ? const LightConfig(disable: true)
+          : lightConfig ?? const LightConfig(),
+      shadowConfig: _effectsReduced
+          ? const ShadowConfig(disable: true)
+          : shadowConfig ?? const ShadowConfig(),
       childLayout: childLayout,
-      // lightShadowMode: lightShadowMode, // Not available in current flutter_tilt version
-      disable: disable,
+      lightShadowMode: lightShadowMode,
+      disable: disable || _offscreen,
       fps: fps,
-      onGestureMove: (tiltDataModel, gesturesType) {
-        widget.backend.triggerControlEvent(
-          widget.control.id,
-          "gesture_move",
-          jsonEncode({
-            "x": tiltDataModel.position.dx,
-            "y": tiltDataModel.position.dy,
-            "angle": tiltDataModel.angle,
-            "gestures_type": gesturesType.name,
-          }),
-        );
-      },
-      onGestureLeave: (tiltDataModel, gesturesType) {
-        widget.backend.triggerControlEvent(
-          widget.control.id,
-          "gesture_leave",
-          jsonEncode({
-            "x": tiltDataModel.position.dx,
-            "y": tiltDataModel.position.dy,
-            "angle": tiltDataModel.angle,
-            "gestures_type": gesturesType.name,
-          }),
-        );
-      },
+      tiltStreamController: _tiltStreamController,
+      onGestureMove: _onGestureMove,
+      onGestureLeave: _onGestureLeave,
       child: child ??
           Container(
             width: 100,
@@ -106,10 +633,399 @@ class _FletTiltControlState extends State<FletTiltControl> {
           ),
     );
 
+    if (pauseWhenOffscreen) {
+      tiltWidget = VisibilityDetector(
+        key: ValueKey("flet_tilt_${widget.control.id}"),
+        onVisibilityChanged: _onVisibilityChanged,
+        child: tiltWidget,
+      );
+    }
+
     return constrainedControl(
         context, tiltWidget, widget.parent, widget.control);
   }
 
+  String _gestureEventData(
+      GestureSample sample, GesturesType gesturesType) {
+    // Positional: [x, y, angle, gestures_type]
+    return jsonEncode([
+      sample.position.dx,
+      sample.position.dy,
+      sample.angle,
+      gesturesType.name,
+    ]);
+  }
+
+  void _trackState(
+      GestureSample sample, GesturesType gesturesType, bool active) {
+    if (_offscreen || !widget.control.attrBool("trackState", false)!) return;
+    // Positional: [x, y, angle, gestures_type, active]
+    final String data = jsonEncode([
+      sample.position.dx,
+      sample.position.dy,
+      sample.angle,
+      gesturesType.name,
+      active ? 1 : 0,
+    ]);
+    final int interval = widget.control.attrInt("stateIntervalMs") ?? 100;
+    final int elapsed = _gestureClock.elapsedMilliseconds - _lastStateAt;
+    // The end of a gesture is always sent right away
+    if (!active || _lastStateAt < 0 || elapsed >= interval) {
+      _sendState(data);
+      return;
+    }
+    _pendingState = data;
+    _stateTimer ??= Timer(Duration(milliseconds: interval - elapsed), () {
+      _stateTimer = null;
+      if (_pendingState != null && mounted) _sendState(_pendingState!);
+    });
+  }
+
+  void _sendState(String data) {
+    _stateTimer?.cancel();
+    _stateTimer = null;
+    _pendingState = null;
+    _lastStateAt = _gestureClock.elapsedMilliseconds;
+    _sendEvent("state", data);
+  }
+
+  /// Grid cell of a move when gesture_precision is set, else null.
+  List<int>? _gestureCell(GestureSample sample) {
+    final double precision =
+        widget.control.attrDouble("gesturePrecision") ?? 0;
+    if (precision <= 0) return null;
+    final double anglePrecision =
+        widget.control.attrDouble("gestureAnglePrecision", 0.1)!;
+    return [
+      (sample.position.dx / precision).round(),
+      (sample.position.dy / precision).round(),
+      (sample.angle / anglePrecision).round(),
+    ];
+  }
+
+  bool _sameGestureGrid() =>
+      widget.control.attrDouble("gesturePrecision") == _lastGesturePrecision &&
+      widget.control.attrDouble("gestureAnglePrecision", 0.1) ==
+          _lastGestureAnglePrecision;
+
+  static bool _sameCell(List<int> a, List<int>? b) =>
+      b != null && a[0] == b[0] && a[1] == b[1] && a[2] == b[2];
+
+  void _onGestureMove(TiltDataModel tiltDataModel, GesturesType gesturesType) {
+    _metrics.addTiltUpdate();
+    // Python only sees a trajectory's start and finish events
+    if (_trajectoryGestures && gesturesType == GesturesType.controller) {
+      return;
+    }
+    _addSessionMove(tiltDataModel, gesturesType);
+    // Moves are only sent when Python has a handler for them; without a
+    // batch handler a batch window falls back to single moves
+    final int batchWindow =
+        widget.control.attrBool("onGestureMoveBatch", false)!
+            ? widget.control.attrInt("gestureBatchWindowMs") ?? 0
+            : 0;
+    final bool listened =
+        batchWindow > 0 || widget.control.attrBool("onGestureMove", false)!;
+    GestureSample sample =
+        GestureSample(tiltDataModel.position, tiltDataModel.angle.distance);
+    if (gesturesType == GesturesType.sensors) {
+      final GestureSample? filtered = _sampleSensor(sample);
+      if (filtered == null) {
+        // Sampled out by sensor_sampling_period
+        if (listened) _metrics.eventsDropped++;
+        return;
+      }
+      sample = filtered;
+    }
+    _trackState(sample, gesturesType, true);
+    if (!listened) return;
+    if (_offscreen) {
+      _metrics.eventsDropped++;
+      return;
+    }
+
+    // Sensor moves have their own limits, defaulting to the gesture ones
+    final bool sensors = gesturesType == GesturesType.sensors;
+    final int interval = (sensors
+            ? widget.control.attrInt("sensorEventIntervalMs")
+            : null) ??
+        widget.control.attrInt("gestureEventIntervalMs") ??
+        0;
+    final double minDelta = (sensors
+            ? widget.control.attrDouble("sensorEventMinDelta")
+            : null) ??
+        widget.control.attrDouble("gestureEventMinDelta") ??
+        0;
+    final Offset position = sample.position;
+
+    // Dead band: ignore moves too close to the last sent position
+    if (minDelta > 0 &&
+        _lastGestureMovePosition != null &&
+        (position - _lastGestureMovePosition!).distance < minDelta) {
+      _metrics.eventsDropped++;
+      return;
+    }
+
+    if (batchWindow > 0) {
+      _addGestureSample(sample, gesturesType, batchWindow);
+      return;
+    }
+
+    // Quantized: moves within the last sent grid cell are not sent
+    final List<int>? cell = _gestureCell(sample);
+    if (cell != null &&
+        _pendingGestureMove == null &&
+        gesturesType == _lastGestureCellType &&
+        _sameCell(cell, _lastGestureCell) &&
+        _sameGestureGrid()) {
+      _metrics.eventsDropped++;
+      return;
+    }
+
+    final int elapsed = _gestureClock.elapsedMilliseconds - _lastGestureMoveAt;
+    if (interval <= 0 || _lastGestureMoveAt < 0 || elapsed >= interval) {
+      _sendGestureMove(sample, gesturesType);
+      return;
+    }
+
+    // Within the interval: keep only the newest move and send it when the
+    // interval ends, so the final position is never lost.
+    if (_pendingGestureMove != null) _metrics.eventsDropped++;
+    _pendingGestureMove = sample;
+    _pendingGestureMoveType = gesturesType;
+    _gestureMoveTimer ??=
+        Timer(Duration(milliseconds: interval - elapsed), _flushGestureMove);
+  }
+
+  /// Applies the tilt config's sensor sampling period and filter to a sensor
+  /// move; null when the move falls within the sampling period.
+  GestureSample? _sampleSensor(GestureSample sample) {
+    final Map<String, dynamic>? config = _tiltConfig.config;
+    final int micros = _gestureClock.elapsedMicroseconds;
+    final Duration? period = _parseDuration(config?['sensor_sampling_period']);
+    if (period != null &&
+        _lastSensorSampleAt >= 0 &&
+        micros - _lastSensorSampleAt < period.inMicroseconds) {
+      return null;
+    }
+    _lastSensorSampleAt = micros;
+    _sensorFilter = SensorFilter.of(config, _sensorFilter);
+    return _sensorFilter?.filter(sample, micros) ?? sample;
+  }
+
+  void _resetSensorSampling() {
+    _lastSensorSampleAt = -1;
+    _sensorFilter = null;
+  }
+
+  void _flushGestureMove() {
+    _gestureMoveTimer = null;
+    final GestureSample? pending = _pendingGestureMove;
+    if (pending != null && mounted) {
+      _sendGestureMove(pending, _pendingGestureMoveType!);
+    }
+  }
+
+  void _sendGestureMove(
+      GestureSample sample, GesturesType gesturesType) {
+    _gestureMoveTimer?.cancel();
+    _gestureMoveTimer = null;
+    _pendingGestureMove = null;
+    _pendingGestureMoveType = null;
+
+    final List<int>? cell = _gestureCell(sample);
+    String data;
+    if (cell == null) {
+      data = _gestureEventData(sample, gesturesType);
+    } else if (gesturesType == _lastGestureCellType &&
+        _lastGestureCell != null &&
+        _sameGestureGrid()) {
+      if (_sameCell(cell, _lastGestureCell)) {
+        // Moved away and back within the interval
+        _metrics.eventsDropped++;
+        return;
+      }
+      // Positional delta in grid units: [dx, dy, dangle]
+      data = jsonEncode([
+        cell[0] - _lastGestureCell![0],
+        cell[1] - _lastGestureCell![1],
+        cell[2] - _lastGestureCell![2],
+      ]);
+    } else {
+      // First move of a gesture or on a new grid: absolute cell and steps
+      _lastGesturePrecision = widget.control.attrDouble("gesturePrecision")!;
+      _lastGestureAnglePrecision =
+          widget.control.attrDouble("gestureAnglePrecision", 0.1)!;
+      data = jsonEncode([
+        cell[0],
+        cell[1],
+        cell[2],
+        gesturesType.name,
+        _lastGesturePrecision,
+        _lastGestureAnglePrecision,
+      ]);
+    }
+    _lastGestureCell = cell;
+    _lastGestureCellType = cell != null ? gesturesType : null;
+
+    _lastGestureMoveAt = _gestureClock.elapsedMilliseconds;
+    _lastGestureMovePosition = sample.position;
+    _sendEvent("gesture_move", data);
+  }
+
+  void _addGestureSample(
+      GestureSample sample, GesturesType gesturesType, int window) {
+    if (_gestureBatchType != null && _gestureBatchType != gesturesType) {
+      _flushGestureBatch();
+    }
+    final int now = _gestureClock.elapsedMilliseconds;
+    if (_batchX.isEmpty) {
+      _gestureBatchStart = now;
+      _gestureBatchType = gesturesType;
+      _gestureBatchTimer =
+          Timer(Duration(milliseconds: window), _flushGestureBatch);
+    }
+    _batchTimestamps.add(now - _gestureBatchStart);
+    _batchX.add(sample.position.dx);
+    _batchY.add(sample.position.dy);
+    _batchAngle.add(sample.angle);
+    _lastGestureMovePosition = sample.position;
+  }
+
+  void _resetGestureThrottle() {
+    if (_pendingGestureMove != null) _metrics.eventsDropped++;
+    _gestureMoveTimer?.cancel();
+    _gestureMoveTimer = null;
+    _pendingGestureMove = null;
+    _pendingGestureMoveType = null;
+    _lastGestureCell = null;
+    _lastGestureCellType = null;
+    _lastGestureMoveAt = -1;
+    _lastGestureMovePosition = null;
+  }
+
+  void _flushGestureBatch() {
+    _gestureBatchTimer?.cancel();
+    _gestureBatchTimer = null;
+    if (_batchX.isNotEmpty && mounted) {
+      _sendEvent(
+        "gesture_move_batch",
+        jsonEncode({
+          "t": _gestureBatchType!.name,
+          "ts": _batchTimestamps,
+          "x": _batchX,
+          "y": _batchY,
+          "a": _batchAngle,
+        }),
+      );
+    }
+    _gestureBatchType = null;
+    _batchTimestamps.clear();
+    _batchX.clear();
+    _batchY.clear();
+    _batchAngle.clear();
+  }
+
+  void _onGestureLeave(TiltDataModel tiltDataModel, GesturesType gesturesType) {
+    if (_trajectoryGestures && gesturesType == GesturesType.controller) {
+      return;
+    }
+    final GestureSample sample =
+        GestureSample(tiltDataModel.position, tiltDataModel.angle.distance);
+    _resetSensorSampling();
+    _trackState(sample, gesturesType, false);
+    // Samples collected so far are sent before the leave event
+    _flushGestureBatch();
+    // The leave event carries the final position, pending moves are dropped
+    _resetGestureThrottle();
+    if (widget.control.attrBool("onGestureLeave", false)!) {
+      _sendEvent(
+          "gesture_leave", _gestureEventData(sample, gesturesType));
+    }
+    _endSession(tiltDataModel.position);
+  }
+
+  void _addSessionMove(
+      TiltDataModel tiltDataModel, GesturesType gesturesType) {
+    if (_offscreen || !widget.control.attrBool("onGestureSession", false)!) {
+      return;
+    }
+    final Offset position = tiltDataModel.position;
+    final double angle = tiltDataModel.angle.distance;
+    // A new gesture type (e.g. hover, then touch) starts a new session
+    if (_sessionType != null && _sessionType != gesturesType) {
+      _endSession(_sessionLast);
+    }
+    if (_sessionType == null) {
+      _sessionType = gesturesType;
+      _sessionStart = _gestureClock.elapsedMilliseconds;
+      _sessionMoves = 0;
+      _sessionEntry = position;
+      _sessionPath = 0;
+      _sessionMaxAngle = 0;
+      _sessionAngleSum = 0;
+    } else {
+      _sessionPath += (position - _sessionLast).distance;
+    }
+    _sessionLast = position;
+    _sessionMoves++;
+    _sessionAngleSum += angle;
+    if (angle > _sessionMaxAngle) _sessionMaxAngle = angle;
+  }
+
+  void _endSession(Offset exit) {
+    final GesturesType? type = _sessionType;
+    if (type == null) return;
+    _sessionType = null;
+    if (!mounted || !widget.control.attrBool("onGestureSession", false)!) {
+      return;
+    }
+    // Positional: [gestures_type, duration_ms, moves, path_length, max_angle,
+    // mean_angle, entry_x, entry_y, exit_x, exit_y]
+    _sendEvent(
+        "gesture_session",
+        jsonEncode([
+          type.name,
+          _gestureClock.elapsedMilliseconds - _sessionStart,
+          _sessionMoves,
+          _sessionPath + (exit - _sessionLast).distance,
+          _sessionMaxAngle,
+          _sessionAngleSum / _sessionMoves,
+          _sessionEntry.dx,
+          _sessionEntry.dy,
+          exit.dx,
+          exit.dy,
+        ]));
+  }
+
+  LightShadowMode _parseLightShadowMode(String? mode) {
+    switch (mode) {
+      case "projector":
+        return LightShadowMode.projector;
+      // "performance": the base mode skips the projector's blurred child copy
+      case "performance":
+      default:
+        return LightShadowMode.base;
+    }
+  }
+
+  Duration? _parseDuration(dynamic value) {
+    if (value == null) return null;
+    if (value is num) return Duration(milliseconds: value.toInt());
+    if (value is Map<String, dynamic>) {
+      int part(String key) => (value[key] as num?)?.toInt() ?? 0;
+      return Duration(
+        days: part('days'),
+        hours: part('hours'),
+        minutes: part('minutes'),
+        seconds: part('seconds'),
+        milliseconds: part('milliseconds'),
+        microseconds: part('microseconds'),
+      );
+    }
+    return null;
+  }
+
   Offset? _parseInitialOffset(dynamic initial) {
     if (initial == null) return null;
     
@@ -130,195 +1046,165 @@ class _FletTiltControlState extends State<FletTiltControl> {
     return null;
   }
 
-  TiltConfig? _parseTiltConfig() {
-    final String? configJson = widget.control.attrString("tilt_config");
-    if (configJson == null) return null;
-
-    try {
-      final Map<String, dynamic> config = jsonDecode(configJson);
-
-      // Detect if platform supports sensors (only mobile platforms)
-      bool isMobilePlatform = false;
-      if (!kIsWeb) {
-        isMobilePlatform = Platform.isAndroid || Platform.isIOS;
-      }
-      // Only enable sensors on mobile platforms
-      bool enableSensors = config['enable_gesture_sensors'] ?? false;
-      if (enableSensors && !isMobilePlatform) {
-        enableSensors = false;
-        debugPrint("Sensors disabled: Not a mobile platform");
-      }
-      return TiltConfig(
-        disable: config['disable'] ?? false,
-        initial: _parseInitialOffset(config['initial']),
-        angle: config['angle']?.toDouble() ?? 10.0,
-        direction: _parseTiltDirectionList(config['direction']),
-        enableReverse: config['enable_reverse'] ?? false,
-        filterQuality: parseFilterQuality(config['filter_quality']) ?? FilterQuality.low,
-        enableGestureSensors: config['enable_gesture_sensors'] ?? true,
-        sensorFactor: config['sensor_factor']?.toDouble() ?? 10.0,
-        enableSensorRevert: config['enable_sensor_revert'] ?? true,
-        sensorRevertFactor: config['sensor_revert_factor']?.toDouble() ?? 0.05,
-        sensorMoveDuration: parseDuration(widget.control, 'sensor_move_duration') ?? const Duration(milliseconds: 50),
-        enableGestureHover: config['enable_gesture_hover'] ?? true,
-        enableGestureTouch: config['enable_gesture_touch'] ?? true,
-        enableRevert: config['enable_revert'] ?? true,
-        enableOutsideAreaMove: config['enable_outside_area_move'] ?? true,
-        moveDuration: parseDuration(widget.control, 'move_duration') ?? const Duration(milliseconds: 100),
-        leaveDuration: parseDuration(widget.control, 'leave_duration') ?? const Duration(milliseconds: 300),
-        moveCurve: parseCurve(config['move_curve']) ?? Curves.linear,
-        leaveCurve: parseCurve(config['leave_curve']) ?? Curves.linear,
-        controllerMoveDuration: parseDuration(widget.control, 'controller_move_duration') ?? const Duration(milliseconds: 100),
-        controllerLeaveDuration: parseDuration(widget.control, 'controller_leave_duration') ?? const Duration(milliseconds: 300),
-      );
-    } catch (e) {
-      debugPrint("Error parsing tiltConfig: $e");
-      return null;
-    }
+  TiltConfig _parseTiltConfig(Map<String, dynamic> config) {
+    return TiltConfig(
+      disable: config['disable'] ?? false,
+      initial: _parseInitialOffset(config['initial']),
+      angle: config['angle']?.toDouble() ?? 10.0,
+      direction: _parseTiltDirectionList(config['direction']),
+      enableReverse: config['enable_reverse'] ?? false,
+      filterQuality: parseFilterQuality(config['filter_quality']) ?? FilterQuality.low,
+      // Sensors are only available on mobile platforms, and are not listened
+      // to while the card is paused off-screen
+      enableGestureSensors: (config['enable_gesture_sensors'] ?? true) &&
+          _isMobilePlatform &&
+          !_offscreen,
+      sensorFactor: config['sensor_factor']?.toDouble() ?? 10.0,
+      enableSensorRevert: config['enable_sensor_revert'] ?? true,
+      sensorRevertFactor: config['sensor_revert_factor']?.toDouble() ?? 0.05,
+      sensorMoveDuration: _parseDuration(config['sensor_move_duration']) ?? const Duration(milliseconds: 50),
+      enableGestureHover: config['enable_gesture_hover'] ?? true,
+      enableGestureTouch: config['enable_gesture_touch'] ?? true,
+      enableRevert: config['enable_revert'] ?? true,
+      enableOutsideAreaMove: config['enable_outside_area_move'] ?? true,
+      moveDuration: _parseDuration(config['move_duration']) ?? const Duration(milliseconds: 100),
+      leaveDuration: _parseDuration(config['leave_duration']) ?? const Duration(milliseconds: 300),
+      moveCurve: parseCurve(config['move_curve']) ?? Curves.linear,
+      leaveCurve: parseCurve(config['leave_curve']) ?? Curves.linear,
+      controllerMoveDuration: _parseDuration(config['controller_move_duration']) ?? const Duration(milliseconds: 100),
+      controllerLeaveDuration: _parseDuration(config['controller_leave_duration']) ?? const Duration(milliseconds: 300),
+    );
   }
 
-  LightConfig? _parseLightConfig() {
-    final String? configJson = widget.control.attrString("light_config");
-    if (configJson == null) return null;
-
-    try {
-      final Map<String, dynamic> config = jsonDecode(configJson);
-      return LightConfig(
-        color: parseColor(Theme.of(context), config['color']) ?? const Color(0xFFFFFFFF),
-        minIntensity: config['min_intensity']?.toDouble() ?? 0.0,
-        maxIntensity: config['max_intensity']?.toDouble() ?? 0.5,
-        spreadFactor: config['spread_factor']?.toDouble() ?? 4.0,
-        direction: _parseLightDirection(config['direction']),
-        enableReverse: config['enable_reverse'] ?? false,
-        disable: config['disable'] ?? false,
-      );
-    } catch (e) {
-      debugPrint("Error parsing light_config: $e");
-      return null;
-    }
+  LightConfig _parseLightConfig(Map<String, dynamic> config, ThemeData theme) {
+    return LightConfig(
+      color: parseColor(theme, config['color']) ?? const Color(0xFFFFFFFF),
+      minIntensity: config['min_intensity']?.toDouble() ?? 0.0,
+      maxIntensity: config['max_intensity']?.toDouble() ?? 0.5,
+      spreadFactor: config['spread_factor']?.toDouble() ?? 4.0,
+      direction: _parseLightDirection(config['direction']),
+      enableReverse: config['enable_reverse'] ?? false,
+      disable: config['disable'] ?? false,
+    );
   }
 
-  ShadowConfig? _parseShadowConfig() {
-    final String? configJson = widget.control.attrString("shadow_config");
-    if (configJson == null) return null;
-
-    try {
-      final Map<String, dynamic> config = jsonDecode(configJson);
-      return ShadowConfig(
-        color: parseColor(Theme.of(context), config['color']) ?? const Color(0xFF9E9E9E),
-        minIntensity: config['min_intensity']?.toDouble() ?? 0.0,
-        maxIntensity: config['max_intensity']?.toDouble() ?? 0.5,
-        offsetInitial: parseOffset(widget.control, 'offset_initial') ?? Offset.zero,
-        offsetFactor: config['offset_factor']?.toDouble() ?? 0.1,
-        spreadInitial: config['spread_initial']?.toDouble() ?? 0.0,
-        spreadFactor: config['spread_factor']?.toDouble() ?? 0.0,
-        minBlurRadius: config['min_blur_radius']?.toDouble() ?? 0.0,
-        maxBlurRadius: config['max_blur_radius']?.toDouble() ?? 10.0,
-        direction: _parseShadowDirection(config['direction']),
-        enableReverse: config['enable_reverse'] ?? false,
-        disable: config['disable'] ?? false,
-      );
-    } catch (e) {
-      debugPrint("Error parsing shadow_config: $e");
-      return null;
-    }
+  ShadowConfig _parseShadowConfig(
+      Map<String, dynamic> config, ThemeData theme) {
+    return ShadowConfig(
+      color: parseColor(theme, config['color']) ?? const Color(0xFF9E9E9E),
+      minIntensity: config['min_intensity']?.toDouble() ?? 0.0,
+      maxIntensity: config['max_intensity']?.toDouble() ?? 0.5,
+      offsetInitial: _parseInitialOffset(config['offset_initial']) ?? Offset.zero,
+      offsetFactor: config['offset_factor']?.toDouble() ?? 0.1,
+      spreadInitial: config['spread_initial']?.toDouble() ?? 0.0,
+      spreadFactor: config['spread_factor']?.toDouble() ?? 0.0,
+      minBlurRadius: config['min_blur_radius']?.toDouble() ?? 0.0,
+      maxBlurRadius: config['max_blur_radius']?.toDouble() ?? 10.0,
+      direction: _parseShadowDirection(config['direction']),
+      enableReverse: config['enable_reverse'] ?? false,
+      disable: config['disable'] ?? false,
+    );
   }
 
-  ChildLayout _parseChildLayout() {
+  ChildLayout _parseChildLayout(bool cacheChild) {
     List<Widget> outerWidgets = [];
     List<Widget> innerWidgets = [];
     List<Widget> behindWidgets = [];
+    final bool disabled = widget.control.isDisabled;
 
-    // Parse child_layout_outer widgets
-    var outerChildren = widget.children
-        .where((c) => c.name == "child_layout_outer" && c.isVisible);
-    for (final child in outerChildren) {
-      final childWidget =
-          createControl(widget.control, child.id, widget.control.isDisabled);
+    // Single pass over the children; layer widgets are reused while their
+    // layer, position and disabled state are unchanged, so Flutter skips
+    // rebuilding them.
+    final Map<String, _LayerWidget> layerWidgets = {};
+    for (final child in widget.children) {
+      if (!child.isVisible) continue;
+      final List<Widget> layer;
+      switch (child.name) {
+        case "child_layout_outer":
+          layer = outerWidgets;
+          break;
+        case "child_layout_inner":
+          layer = innerWidgets;
+          break;
+        case "child_layout_behind":
+          layer = behindWidgets;
+          break;
+        default:
+          continue;
+      }
+      final String signature =
+          "${child.name}:${layer.length}:$disabled:$cacheChild";
+      _LayerWidget? layerWidget = _layerWidgets[child.id];
+      if (layerWidget == null || layerWidget.signature != signature) {
+        layerWidget = _LayerWidget(signature,
+            _buildLayerWidget(child, layer.length, disabled, cacheChild));
+      }
+      layerWidgets[child.id] = layerWidget;
+      layer.add(layerWidget.widget);
+    }
+    _layerWidgets = layerWidgets;
 
+    return ChildLayout(
+      outer: outerWidgets,
+      inner: innerWidgets,
+      behind: behindWidgets,
+    );
+  }
+
+  Widget _buildLayerWidget(
+      Control child, int index, bool disabled, bool cacheChild) {
+    Widget childWidget = createControl(widget.control, child.id, disabled);
+    if (cacheChild) childWidget = RepaintBoundary(child: childWidget);
+
+    if (child.name == "child_layout_outer") {
       // Outer layer positioned left=0 with positive offset (like Flutter example)
-      outerWidgets.add(
-        Positioned(
-          left: 0,
-          child: TiltParallax(
-            size: const Offset(40, 40), // Positive values like Flutter example
-            child: childWidget,
-          ),
+      return Positioned(
+        left: 0,
+        child: TiltParallax(
+          size: const Offset(40, 40), // Positive values like Flutter example
+          child: childWidget,
         ),
       );
     }
 
-    // Parse child_layout_inner widgets
-    var innerChildren = widget.children
-        .where((c) => c.name == "child_layout_inner" && c.isVisible);
-    for (final child in innerChildren) {
-      final childWidget =
-          createControl(widget.control, child.id, widget.control.isDisabled);
-
+    if (child.name == "child_layout_inner") {
       // Inner layer positioned right=0 with negative offset (like Flutter example)
-      innerWidgets.add(
-        Positioned(
-          right: 0,
-          child: TiltParallax(
-            size:
-                const Offset(-40, -40), // Negative values like Flutter example
-            child: childWidget,
-          ),
+      return Positioned(
+        right: 0,
+        child: TiltParallax(
+          size: const Offset(-40, -40), // Negative values like Flutter example
+          child: childWidget,
         ),
       );
     }
 
-    // Parse child_layout_behind widgets
-    var behindChildren = widget.children
-        .where((c) => c.name == "child_layout_behind" && c.isVisible);
-    int behindIndex = 0;
-    for (final child in behindChildren) {
-      final childWidget =
-          createControl(widget.control, child.id, widget.control.isDisabled);
-
-      // Behind layers positioned like Flutter example
-      if (behindIndex == 0) {
-        // First behind layer: bottom=-10, offset=(-50, -50)
-        behindWidgets.add(
-          Positioned(
-            bottom: -10,
-            child: TiltParallax(
-              size: const Offset(-50, -50),
-              child: childWidget,
-            ),
-          ),
-        );
-      } else if (behindIndex == 1) {
-        // Second behind layer: bottom=-5, offset=(-25, -25)
-        behindWidgets.add(
-          Positioned(
-            bottom: -5,
-            child: TiltParallax(
-              size: const Offset(-25, -25),
-              child: childWidget,
-            ),
-          ),
-        );
-      } else {
-        // Additional behind layers with progressive offsets
-        behindWidgets.add(
-          Positioned(
-            bottom: -5.0 + (behindIndex * 2.0),
-            child: TiltParallax(
-              size: Offset(
-                  -25.0 + (behindIndex * 5.0), -25.0 + (behindIndex * 5.0)),
-              child: childWidget,
-            ),
-          ),
-        );
-      }
-      behindIndex++;
+    // Behind layers positioned like Flutter example
+    if (index == 0) {
+      // First behind layer: bottom=-10, offset=(-50, -50)
+      return Positioned(
+        bottom: -10,
+        child: TiltParallax(
+          size: const Offset(-50, -50),
+          child: childWidget,
+        ),
+      );
+    } else if (index == 1) {
+      // Second behind layer: bottom=-5, offset=(-25, -25)
+      return Positioned(
+        bottom: -5,
+        child: TiltParallax(
+          size: const Offset(-25, -25),
+          child: childWidget,
+        ),
+      );
     }
-
-    return ChildLayout(
-      outer: outerWidgets,
-      inner: innerWidgets,
-      behind: behindWidgets,
+    // Additional behind layers with progressive offsets
+    return Positioned(
+      bottom: -5.0 + (index * 2.0),
+      child: TiltParallax(
+        size: Offset(-25.0 + (index * 5.0), -25.0 + (index * 5.0)),
+        child: childWidget,
+      ),
     );
   }
 
@@ -430,13 +1316,8 @@ class _FletTiltControlState extends State<FletTiltControl> {
   }
 
   Map<String, dynamic> _parseParallaxConfig() {
-    final String? configJson = widget.control.attrString("parallax_config");
-    if (configJson == null) {
-      return {}; // Return empty map with default values
-    }
-
     try {
-      return jsonDecode(configJson);
+      return _configMap("parallax_config") ?? {};
     } catch (e) {
       debugPrint("Error parsing parallax_config: $e");
       return {};
@@ -0,0 +1,74 @@
+import 'dart:math';
+import 'dart:ui' show FrameTiming, PlatformDispatcher;
+
+import 'package:flutter/scheduler.dart';
+
+/// Frame pressure reported by [FpsGovernor]: frames miss their budget.
+const int framePressureHigh = 1;
+
+/// Frame pressure reported by [FpsGovernor]: frames have headroom.
+const int framePressureLow = -1;
+
+/// Watches frame build/raster timings for all `fps="auto"` tilt controls.
+///
+/// One timings callback is shared by every listener; it is only registered
+/// while at least one control listens. Every [sampleCount] frames the 90th
+/// percentile of the slower of build and raster time is compared with the
+/// display's frame budget and listeners are told about high or low pressure.
+class FpsGovernor {
+  static final FpsGovernor instance = FpsGovernor._();
+
+  static const int sampleCount = 60;
+
+  // Below this share of the budget there is room to raise fps again
+  static const double headroom = 0.7;
+
+  final Set<void Function(int pressure)> _listeners = {};
+  final List<int> _samples = [];
+
+  FpsGovernor._();
+
+  void addListener(void Function(int pressure) listener) {
+    if (_listeners.isEmpty) {
+      SchedulerBinding.instance.addTimingsCallback(_onTimings);
+    }
+    _listeners.add(listener);
+  }
+
+  void removeListener(void Function(int pressure) listener) {
+    if (!_listeners.remove(listener) || _listeners.isNotEmpty) return;
+    SchedulerBinding.instance.removeTimingsCallback(_onTimings);
+    _samples.clear();
+  }
+
+  static double get _frameBudgetMicros {
+    final views = PlatformDispatcher.instance.views;
+    final double refreshRate =
+        views.isNotEmpty ? views.first.display.refreshRate : 60;
+    return 1e6 / (refreshRate > 0 ? refreshRate : 60);
+  }
+
+  void _onTimings(List<FrameTiming> timings) {
+    for (final timing in timings) {
+      // Build and raster run pipelined: a frame is late if either is over
+      _samples.add(max(timing.buildDuration.inMicroseconds,
+          timing.rasterDuration.inMicroseconds));
+    }
+    if (_samples.length < sampleCount) return;
+
+    _samples.sort();
+    final int p90 = _samples[(_samples.length * 9) ~/ 10];
+    _samples.clear();
+
+    final double budget = _frameBudgetMicros;
+    final int pressure = p90 > budget
+        ? framePressureHigh
+        : p90 < budget * headroom
+            ? framePressureLow
+            : 0;
+    if (pressure == 0) return;
+    for (final listener in List.of(_listeners)) {
+      listener(pressure);
+    }
+  }
+}
@@ -0,0 +1,90 @@
+import 'dart:math';
+
+import 'package:flutter/widgets.dart';
+
+/// Position and tilt angle of one gesture move, as sent to Python.
+class GestureSample {
+  final Offset position;
+  final double angle;
+
+  const GestureSample(this.position, this.angle);
+}
+
+/// One smoothed value: a first-order low-pass filter whose cutoff is either
+/// fixed or, for the One Euro filter, raised with the speed of the signal.
+class _AxisFilter {
+  final bool adaptive;
+  final double minCutoff;
+  final double beta;
+  static const double _derivativeCutoff = 1.0;
+
+  double? _value;
+  double _derivative = 0;
+
+  _AxisFilter(this.adaptive, this.minCutoff, this.beta);
+
+  static double _alpha(double cutoff, double dt) {
+    final double tau = 1 / (2 * pi * cutoff);
+    return 1 / (1 + tau / dt);
+  }
+
+  double filter(double x, double dt) {
+    final double? previous = _value;
+    if (previous == null) return _value = x;
+    double cutoff = minCutoff;
+    if (adaptive) {
+      final double a = _alpha(_derivativeCutoff, dt);
+      _derivative += a * ((x - previous) / dt - _derivative);
+      cutoff += beta * _derivative.abs();
+    }
+    return _value = previous + _alpha(cutoff, dt) * (x - previous);
+  }
+}
+
+/// Smooths sensor gesture samples on the device, configured from the
+/// `sensor_filter*` fields of the tilt config ("lowPass" or "oneEuro").
+class SensorFilter {
+  final String mode;
+  final double cutoff;
+  final double beta;
+  late final _AxisFilter _x, _y, _angle;
+  int _lastMicros = -1;
+
+  SensorFilter(this.mode, this.cutoff, this.beta) {
+    final bool adaptive = mode == "oneEuro";
+    _x = _AxisFilter(adaptive, cutoff, beta);
+    _y = _AxisFilter(adaptive, cutoff, beta);
+    _angle = _AxisFilter(adaptive, cutoff, beta);
+  }
+
+  /// Returns a filter for [config], reusing [current] when its settings are
+  /// unchanged, or null when filtering is off.
+  static SensorFilter? of(Map<String, dynamic>? config, SensorFilter? current) {
+    final String mode = config?['sensor_filter'] ?? "none";
+    if (mode != "lowPass" && mode != "oneEuro") return null;
+    final double cutoff =
+        (config?['sensor_filter_cutoff'] as num?)?.toDouble() ?? 1.0;
+    final double beta =
+        (config?['sensor_filter_beta'] as num?)?.toDouble() ?? 0.007;
+    if (current != null &&
+        current.mode == mode &&
+        current.cutoff == cutoff &&
+        current.beta == beta) {
+      return current;
+    }
+    return SensorFilter(mode, cutoff, beta);
+  }
+
+  GestureSample filter(GestureSample sample, int micros) {
+    // The first step counts as one 60 Hz frame, pauses as one second at most
+    final double dt = _lastMicros < 0 || micros <= _lastMicros
+        ? 1 / 60
+        : min((micros - _lastMicros) / 1e6, 1.0);
+    _lastMicros = micros;
+    return GestureSample(
+      Offset(_x.filter(sample.position.dx, dt),
+          _y.filter(sample.position.dy, dt)),
+      _angle.filter(sample.angle, dt),
+    );
+  }
+}
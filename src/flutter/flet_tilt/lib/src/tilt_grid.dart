@@ -0,0 +1,147 @@
+import 'dart:math';
+
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+
+/// Grid of FletTilt cards materialized by Python for the visible range only.
+///
+/// Each card carries its position in the `gridIndex` attribute; cells whose
+/// card has not been built yet are left empty. The visible index range is
+/// sent as `range_change` ("first,last") whenever it changes.
+class FletTiltGridControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+  final List<Control> children;
+  final bool parentDisabled;
+  final FletControlBackend backend;
+
+  const FletTiltGridControl({
+    super.key,
+    required this.parent,
+    required this.control,
+    required this.children,
+    required this.parentDisabled,
+    required this.backend,
+  });
+
+  @override
+  State<FletTiltGridControl> createState() => _FletTiltGridControlState();
+}
+
+class _FletTiltGridControlState extends State<FletTiltGridControl> {
+  final ScrollController _scrollController = ScrollController();
+  Size _viewport = Size.zero;
+  int _first = 0;
+  int _last = -1;
+
+  @override
+  void initState() {
+    super.initState();
+    _scrollController.addListener(_reportRange);
+  }
+
+  @override
+  void dispose() {
+    _scrollController.removeListener(_reportRange);
+    _scrollController.dispose();
+    super.dispose();
+  }
+
+  bool get _horizontal => widget.control.attrBool("horizontal", false)!;
+  double get _spacing => widget.control.attrDouble("spacing", 10)!;
+  double get _runSpacing => widget.control.attrDouble("runSpacing", 10)!;
+  double get _childAspectRatio =>
+      widget.control.attrDouble("childAspectRatio", 1)!;
+
+  int _runsCount(double crossExtent) {
+    final double? maxExtent = widget.control.attrDouble("maxExtent");
+    if (maxExtent != null) {
+      // Same rule as SliverGridDelegateWithMaxCrossAxisExtent
+      return max(1, (crossExtent / (maxExtent + _spacing)).ceil());
+    }
+    return max(1, widget.control.attrInt("runsCount", 1)!);
+  }
+
+  void _reportRange() {
+    if (!mounted || !_scrollController.hasClients) return;
+    final int itemCount = widget.control.attrInt("itemCount", 0)!;
+    final EdgeInsets padding =
+        parseEdgeInsets(widget.control, "padding") ?? EdgeInsets.zero;
+    final double crossExtent = _horizontal
+        ? _viewport.height - padding.vertical
+        : _viewport.width - padding.horizontal;
+
+    int first = 0;
+    int last = -1;
+    if (itemCount > 0 && crossExtent > 0) {
+      final int runs = _runsCount(crossExtent);
+      final double childCrossExtent =
+          (crossExtent - _spacing * (runs - 1)) / runs;
+      final double rowExtent =
+          childCrossExtent / _childAspectRatio + _runSpacing;
+      final ScrollPosition position = _scrollController.position;
+      final double offset =
+          position.pixels - (_horizontal ? padding.left : padding.top);
+      final int firstRow = max(0, (offset / rowExtent).floor());
+      final int lastRow =
+          ((offset + position.viewportDimension) / rowExtent).floor();
+      first = min(firstRow * runs, itemCount - 1);
+      last = min((lastRow + 1) * runs - 1, itemCount - 1);
+    }
+
+    if (first == _first && last == _last) return;
+    _first = first;
+    _last = last;
+    widget.backend
+        .triggerControlEvent(widget.control.id, "range_change", "$first,$last");
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    final bool disabled = widget.control.isDisabled || widget.parentDisabled;
+    final bool horizontal = _horizontal;
+
+    final Map<int, Control> cards = {};
+    for (final child in widget.children) {
+      final int? index = child.attrInt("gridIndex");
+      if (index != null && child.isVisible) cards[index] = child;
+    }
+
+    final double? maxExtent = widget.control.attrDouble("maxExtent");
+    final SliverGridDelegate gridDelegate = maxExtent != null
+        ? SliverGridDelegateWithMaxCrossAxisExtent(
+            maxCrossAxisExtent: maxExtent,
+            mainAxisSpacing: _runSpacing,
+            crossAxisSpacing: _spacing,
+            childAspectRatio: _childAspectRatio,
+          )
+        : SliverGridDelegateWithFixedCrossAxisCount(
+            crossAxisCount: max(1, widget.control.attrInt("runsCount", 1)!),
+            mainAxisSpacing: _runSpacing,
+            crossAxisSpacing: _spacing,
+            childAspectRatio: _childAspectRatio,
+          );
+
+    Widget grid = LayoutBuilder(builder: (context, constraints) {
+      if (constraints.biggest != _viewport) {
+        _viewport = constraints.biggest;
+      }
+      // Layout or item count may have changed the range without scrolling
+      WidgetsBinding.instance.addPostFrameCallback((_) => _reportRange());
+      return GridView.builder(
+        controller: _scrollController,
+        scrollDirection: horizontal ? Axis.horizontal : Axis.vertical,
+        padding: parseEdgeInsets(widget.control, "padding"),
+        gridDelegate: gridDelegate,
+        itemCount: widget.control.attrInt("itemCount", 0)!,
+        itemBuilder: (context, index) {
+          final Control? card = cards[index];
+          if (card == null) return const SizedBox.shrink();
+          return createControl(widget.control, card.id, disabled);
+        },
+      );
+    });
+
+    return constrainedControl(context, grid, widget.parent, widget.control);
+  }
+}
@@ -0,0 +1,88 @@
+import 'dart:async';
+import 'dart:convert';
+
+/// Runtime counters of one FletTilt control.
+///
+/// Counters are cumulative since the control was mounted; `fps` is the tilt
+/// update rate over the last second (0 when the card is idle).
+class TiltMetrics {
+  final Stopwatch _clock = Stopwatch()..start();
+
+  int rebuilds = 0;
+  int configDecodes = 0;
+  int configDecodeMicros = 0;
+  int eventsEmitted = 0;
+  int eventsDropped = 0;
+  int bytesSent = 0;
+
+  int _tiltUpdates = 0;
+  int _fpsWindowStart = 0;
+  int _lastTiltUpdateAt = -1;
+  double _fps = 0;
+
+  Timer? _timer;
+  int _interval = 0;
+
+  void addEvent(String data) {
+    eventsEmitted++;
+    // Event payloads are ASCII JSON, so length is the wire size
+    bytesSent += data.length;
+  }
+
+  void addConfigDecode(int micros) {
+    configDecodes++;
+    configDecodeMicros += micros;
+  }
+
+  void addTiltUpdate() {
+    final int now = _clock.elapsedMilliseconds;
+    if (_lastTiltUpdateAt < 0 || now - _lastTiltUpdateAt > 1000) {
+      // Idle before this update: start a new window
+      _fpsWindowStart = now;
+      _tiltUpdates = 0;
+    }
+    _tiltUpdates++;
+    _lastTiltUpdateAt = now;
+    final int elapsed = now - _fpsWindowStart;
+    if (elapsed >= 1000) {
+      _fps = _tiltUpdates * 1000 / elapsed;
+      _fpsWindowStart = now;
+      _tiltUpdates = 0;
+    }
+  }
+
+  double get fps {
+    final int now = _clock.elapsedMilliseconds;
+    return _lastTiltUpdateAt < 0 || now - _lastTiltUpdateAt > 1000 ? 0 : _fps;
+  }
+
+  /// Sends a snapshot every [intervalMs] ms, or stops sending when it is 0.
+  void schedule(int intervalMs, void Function(String snapshot) send) {
+    if (intervalMs <= 0) {
+      _timer?.cancel();
+      _timer = null;
+      return;
+    }
+    if (_timer != null && _interval == intervalMs) return;
+    _timer?.cancel();
+    _interval = intervalMs;
+    _timer = Timer.periodic(
+        Duration(milliseconds: intervalMs), (_) => send(toJson()));
+  }
+
+  void dispose() {
+    _timer?.cancel();
+    _timer = null;
+  }
+
+  String toJson() => jsonEncode({
+        "rebuilds": rebuilds,
+        "config_decodes": configDecodes,
+        "config_decode_us": configDecodeMicros,
+        "events_emitted": eventsEmitted,
+        "events_dropped": eventsDropped,
+        "bytes_sent": bytesSent,
+        "fps": fps,
+        "uptime_ms": _clock.elapsedMilliseconds,
+      });
+}
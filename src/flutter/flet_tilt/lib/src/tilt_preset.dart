@@ -0,0 +1,149 @@
+import 'dart:convert';
+
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+import 'package:flutter/scheduler.dart';
+
+typedef TiltPresetConfigs = Map<String, Map<String, dynamic>>;
+
+/// Merges a `<config>_patch` attribute into a decoded config: patch fields
+/// replace the config's, null ones remove them. The config is not modified.
+Map<String, dynamic>? mergeConfigPatch(
+    Map<String, dynamic>? config, String? patch) {
+  if (config == null || patch == null) return config;
+  final Map<String, dynamic> merged = Map.of(config);
+  (jsonDecode(patch) as Map<String, dynamic>).forEach((key, value) {
+    if (value == null) {
+      merged.remove(key);
+    } else {
+      merged[key] = value;
+    }
+  });
+  return merged;
+}
+
+/// Configs shared by many FletTilt controls, keyed by preset name.
+///
+/// Each preset is decoded once by its FletTiltPresetControl; cards listen to
+/// the preset's notifier and rebuild when it changes.
+class TiltPresets {
+  static final Map<String, ValueNotifier<TiltPresetConfigs>> _presets = {};
+  static final Map<String, String> _owners = {};
+
+  static ValueNotifier<TiltPresetConfigs> notifier(String name) =>
+      _presets.putIfAbsent(name, () => ValueNotifier(const {}));
+
+  static void _publish(String name, String owner, TiltPresetConfigs configs) {
+    _owners[name] = owner;
+    // Listeners call setState, which is not allowed while building
+    SchedulerBinding.instance.addPostFrameCallback((_) {
+      if (_owners[name] == owner) {
+        notifier(name).value = configs;
+      }
+    });
+  }
+
+  static void _remove(String name, String owner) {
+    if (_owners[name] != owner) return;
+    _owners.remove(name);
+    SchedulerBinding.instance.addPostFrameCallback((_) {
+      if (!_owners.containsKey(name)) {
+        notifier(name).value = const {};
+      }
+    });
+  }
+}
+
+class FletTiltPresetControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+
+  const FletTiltPresetControl({
+    super.key,
+    required this.parent,
+    required this.control,
+  });
+
+  @override
+  State<FletTiltPresetControl> createState() => _FletTiltPresetControlState();
+}
+
+class _FletTiltPresetControlState extends State<FletTiltPresetControl> {
+  static const List<String> _configNames = [
+    "tilt_config",
+    "light_config",
+    "shadow_config",
+    "parallax_config",
+  ];
+
+  String? _name;
+  final Map<String, String?> _raw = {};
+  final Map<String, Map<String, dynamic>?> _decoded = {};
+  TiltPresetConfigs _configs = const {};
+
+  @override
+  void initState() {
+    super.initState();
+    _register();
+  }
+
+  @override
+  void didUpdateWidget(FletTiltPresetControl oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    _register();
+  }
+
+  @override
+  void dispose() {
+    if (_name != null) {
+      TiltPresets._remove(_name!, widget.control.id);
+    }
+    super.dispose();
+  }
+
+  void _register() {
+    final String? name = widget.control.attrString("presetName");
+    if (_name != null && name != _name) {
+      TiltPresets._remove(_name!, widget.control.id);
+    }
+
+    bool changed = name != _name;
+    final TiltPresetConfigs configs = {};
+    for (final configName in _configNames) {
+      final String? raw = widget.control.attrString(configName);
+      final String? patch = widget.control.attrString("${configName}_patch");
+      final String patchKey = "${configName}_patch";
+      final Map<String, dynamic>? previous = _configs[configName];
+      if (raw == _raw[configName] && patch == _raw[patchKey]) {
+        // Unchanged JSON: reuse the decoded map
+        if (previous != null) configs[configName] = previous;
+        continue;
+      }
+      changed = true;
+      try {
+        // Only a new patch: merge it into the already decoded config
+        if (raw != _raw[configName]) {
+          _decoded[configName] =
+              raw != null ? jsonDecode(raw) as Map<String, dynamic> : null;
+        }
+        final Map<String, dynamic>? config =
+            mergeConfigPatch(_decoded[configName], patch);
+        if (config != null) configs[configName] = config;
+      } catch (e) {
+        debugPrint("Error parsing preset $name $configName: $e");
+      }
+      _raw[configName] = raw;
+      _raw[patchKey] = patch;
+    }
+    _name = name;
+    _configs = configs;
+    if (name != null && changed) {
+      TiltPresets._publish(name, widget.control.id, configs);
+    }
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    return const SizedBox.shrink();
+  }
+}
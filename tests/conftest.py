@@ -0,0 +1,24 @@
+import flet as ft
+import pytest
+from harness import HeadlessPage
+
+from flet_tilt import FletTilt
+
+
+@pytest.fixture
+def headless():
+    hp = HeadlessPage()
+    yield hp
+    hp.close()
+
+
+@pytest.fixture
+def add_card(headless):
+    """Add a `FletTilt` with the given arguments to the headless page."""
+
+    def add(**kwargs) -> FletTilt:
+        card = FletTilt(child=ft.Text("card"), **kwargs)
+        headless.page.add(card)
+        return card
+
+    return add
@@ -0,0 +1,181 @@
+import copy
+import json
+import pickle
+
+import flet as ft
+import pytest
+
+from flet_tilt import FletTilt, LightConfig, TiltConfig, TiltDirection, TiltPreset
+
+
+def test_configs_are_interned():
+    a = TiltConfig(angle=10, direction=[TiltDirection.TOP])
+    b = TiltConfig(angle=10, direction=[TiltDirection.TOP])
+    assert a is b
+    assert a.replace(angle=20) is TiltConfig(angle=20, direction=[TiltDirection.TOP])
+    assert hash(a) == hash(b)
+    assert a != a.replace(angle=11)
+
+
+def test_interning_keeps_python_types():
+    enum = TiltConfig(direction=[TiltDirection.TOP])
+    string = TiltConfig(direction=["top"])
+    assert enum is not string
+    assert enum == string
+    assert enum.direction == (TiltDirection.TOP,)
+    assert string.direction == ("top",)
+
+    offset = TiltConfig(initial=ft.Offset(1, 2))
+    mapping = TiltConfig(initial={"dx": 1, "dy": 2})
+    assert offset is not mapping
+    assert isinstance(offset.initial, ft.Offset)
+
+
+def test_interning_keeps_number_types():
+    assert TiltConfig(angle=1) is not TiltConfig(angle=1.0)
+    assert TiltConfig(angle=1) is not TiltConfig(angle=True)
+    assert isinstance(TiltConfig(angle=1.0).angle, float)
+
+
+def test_unset_fields_are_none():
+    config = TiltConfig(angle=10)
+    assert config.direction is None
+    with pytest.raises(AttributeError):
+        config.unknown
+
+
+def test_json_is_encoded_once():
+    config = TiltConfig(angle=10, direction=[TiltDirection.TOP])
+    assert config.to_json() is config.to_json()
+
+
+def test_configs_are_immutable():
+    config = TiltConfig(direction=[TiltDirection.TOP], initial={"dx": 1, "dy": 2})
+    with pytest.raises(AttributeError):
+        config.angle = 5
+    with pytest.raises(TypeError):
+        config.initial["dx"] = 3
+    assert isinstance(config.direction, tuple)
+
+
+def test_to_dict_returns_a_copy():
+    config = TiltConfig(angle=10, direction=[TiltDirection.TOP])
+    d = config.to_dict()
+    assert d == {"angle": 10, "direction": ["top"]}
+    d["direction"].append("bottom")
+    assert config.to_dict() == {"angle": 10, "direction": ["top"]}
+    assert json.loads(config.to_json()) == {"angle": 10, "direction": ["top"]}
+
+
+def test_copy_and_pickle():
+    config = TiltConfig(angle=10, direction=[TiltDirection.TOP], initial={"dx": 1})
+    assert copy.copy(config) is config
+    assert copy.deepcopy(config) is config
+    assert pickle.loads(pickle.dumps(config)) is config
+
+
+def test_changed_config_is_sent_as_patch():
+    config = TiltConfig(
+        angle=10,
+        direction=[TiltDirection.TOP, TiltDirection.BOTTOM],
+        move_duration=100,
+        leave_duration=300,
+    )
+    card = FletTilt(tilt_config=config)
+    card.before_update()
+    assert json.loads(card._get_attr("tilt_config")) == config.to_dict()
+    assert not card._get_attr("tilt_config_patch")
+
+    card.tilt_config = config.replace(angle=20)
+    card.before_update()
+    assert json.loads(card._get_attr("tilt_config_patch")) == {"angle": 20}
+    assert json.loads(card._get_attr("tilt_config")) == config.to_dict()
+
+
+def test_reverted_config_clears_patch():
+    config = TiltConfig(angle=10, move_duration=100, leave_duration=300)
+    card = FletTilt(tilt_config=config)
+    card.before_update()
+    card.tilt_config = config.replace(angle=20)
+    card.before_update()
+    assert card._get_attr("tilt_config_patch")
+
+    card.tilt_config = config
+    card.before_update()
+    assert not card._get_attr("tilt_config_patch")
+    assert json.loads(card._get_attr("tilt_config")) == config.to_dict()
+
+
+def test_unchanged_patched_config_is_not_diffed_again(monkeypatch):
+    import flet_tilt.flet_tilt as module
+
+    config = TiltConfig(angle=10, move_duration=100, leave_duration=300)
+    card = FletTilt(tilt_config=config)
+    card.before_update()
+    card.tilt_config = config.replace(angle=20)
+    card.before_update()
+
+    def fail(base, config):
+        raise AssertionError("patch computed again")
+
+    monkeypatch.setattr(module, "_config_patch", fail)
+    card.before_update()
+
+
+def test_large_change_is_sent_in_full():
+    config = TiltConfig(angle=10)
+    card = FletTilt(tilt_config=config)
+    card.before_update()
+    other = TiltConfig(angle=10, move_duration=100, leave_duration=300, disable=True)
+    card.tilt_config = other
+    card.before_update()
+    assert json.loads(card._get_attr("tilt_config")) == other.to_dict()
+    assert not card._get_attr("tilt_config_patch")
+
+
+def test_dict_config_is_sent_as_json():
+    card = FletTilt(light_config=LightConfig(color="#ffffff"))
+    card.before_update()
+    card.light_config = {"color": "#000000"}
+    card.before_update()
+    assert json.loads(card._get_attr("light_config")) == {"color": "#000000"}
+    assert not card._get_attr("light_config_patch")
+
+
+def test_preset_is_referenced_by_name():
+    preset = TiltPreset("glass")
+    assert FletTilt(preset=preset).preset == "glass"
+    assert FletTilt(preset="glass").preset == "glass"
+    assert preset._get_attr("presetName") == "glass"
+
+
+def test_preset_sends_configs_and_patches():
+    config = TiltConfig(angle=10, move_duration=100, leave_duration=300)
+    preset = TiltPreset("glass", tilt_config=config, light_config={"color": "#fff"})
+    preset.before_update()
+    assert json.loads(preset._get_attr("tilt_config")) == config.to_dict()
+    assert json.loads(preset._get_attr("light_config")) == {"color": "#fff"}
+
+    preset.tilt_config = config.replace(angle=20)
+    preset.before_update()
+    assert json.loads(preset._get_attr("tilt_config_patch")) == {"angle": 20}
+
+
+def test_preset_update_only_sends_the_preset(headless, add_card, monkeypatch):
+    preset = TiltPreset("glass", tilt_config=TiltConfig(angle=10))
+    headless.page.overlay.append(preset)
+    cards = [add_card(preset=preset) for _ in range(3)]
+
+    updated = []
+    process = headless.conn._process_command
+
+    def record(command):
+        if command.name == "set":
+            updated.append(command.values[0])
+        return process(command)
+
+    monkeypatch.setattr(headless.conn, "_process_command", record)
+    preset.tilt_config = TiltConfig(angle=20)
+    headless.page.update()
+    assert updated == [preset.uid]
+    assert all(card.preset == "glass" for card in cards)
@@ -0,0 +1,122 @@
+import json
+from array import array
+
+import pytest
+
+from flet_tilt import FletTilt, TiltController
+from flet_tilt.flet_tilt import _flatten_keyframes
+
+
+def record_invokes(monkeypatch, card: FletTilt):
+    calls = []
+    monkeypatch.setattr(
+        card,
+        "invoke_method",
+        lambda name, arguments=None, **kwargs: calls.append((name, arguments)),
+    )
+    return calls
+
+
+def test_commands_are_invoked_on_the_control(monkeypatch):
+    controller = TiltController()
+    card = FletTilt(controller=controller)
+    calls = record_invokes(monkeypatch, card)
+
+    controller.move(10, 20)
+    controller.leave()
+    controller.stop()
+    assert calls == [
+        ("controller_move", {"x": 10, "y": 20}),
+        ("controller_leave", None),
+        ("trajectory_stop", None),
+    ]
+
+
+def test_play_uploads_flat_keyframes(monkeypatch):
+    controller = TiltController()
+    card = FletTilt(controller=controller)
+    calls = record_invokes(monkeypatch, card)
+
+    controller.play([(0, 1, 2), (100, 3, 4)], loop=True)
+    assert calls == [
+        ("trajectory_play", {"keyframes": "[0,1,2,100,3,4]", "loop": "true"})
+    ]
+
+
+def test_unattached_controller_fails():
+    with pytest.raises(AssertionError):
+        TiltController().move(1, 2)
+
+
+def test_replaced_controller_is_detached():
+    first = TiltController()
+    card = FletTilt(controller=first)
+    second = TiltController()
+    card.controller = second
+    assert first._control is None
+    assert second._control is card
+
+    card.controller = None
+    assert second._control is None
+    with pytest.raises(AssertionError):
+        second.leave()
+
+
+def test_controller_moved_to_another_control_stays_attached():
+    controller = TiltController()
+    card = FletTilt(controller=controller)
+    other = FletTilt(controller=controller)
+    card.controller = None
+    assert controller._control is other
+
+
+@pytest.mark.parametrize(
+    "keyframes, flat",
+    [
+        ([(0, 1, 2), (50, 3, 4), (50, 5, 6)], [0, 1, 2, 50, 3, 4, 50, 5, 6]),
+        ([0.0, 1.0, 2.0, 10.0, 3.0, 4.0], [0, 1, 2, 10, 3, 4]),
+        (array("d", [5, 1, 2]), [5, 1, 2]),
+    ],
+)
+def test_keyframes_are_flattened(keyframes, flat):
+    assert _flatten_keyframes(keyframes) == flat
+
+
+@pytest.mark.parametrize(
+    "keyframes",
+    [
+        [],
+        [(0, 1)],
+        [0, 1, 2, 3],
+        [(100, 1, 2), (50, 3, 4)],
+        [(-1, 1, 2), (50, 3, 4)],
+        [(0, 1, 2), (float("inf"), 3, 4)],
+        [(0, 1, 2), (float("nan"), 3, 4)],
+    ],
+)
+def test_invalid_keyframes_are_rejected(keyframes):
+    with pytest.raises(ValueError):
+        _flatten_keyframes(keyframes)
+
+
+def test_animate_config_sends_targets(monkeypatch):
+    card = FletTilt()
+    calls = record_invokes(monkeypatch, card)
+    card.animate_config(duration=500, angle=25, light_max_intensity=0.8)
+    ((name, arguments),) = calls
+    assert name == "animate_config"
+    assert json.loads(arguments["targets"]) == {
+        "tilt_config": {"angle": 25},
+        "light_config": {"max_intensity": 0.8},
+    }
+
+
+def test_animate_config_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        FletTilt().animate_config(color=1)
+
+
+@pytest.mark.parametrize("value", [None, "25", True, float("nan"), [1]])
+def test_animate_config_rejects_non_numeric_targets(value):
+    with pytest.raises(ValueError):
+        FletTilt().animate_config(angle=value)
@@ -0,0 +1,96 @@
+import asyncio
+
+import flet as ft
+import pytest
+
+from flet_tilt import GestureDispatch
+
+
+def moves(headless, card, count):
+    return [
+        headless.event(card, "gesture_move", f'[{i},0,0,"touch"]')
+        for i in range(count)
+    ]
+
+
+def test_latest_dispatch_collapses_pending_moves(headless, add_card):
+    received = {}
+
+    async def on_move(e):
+        received.setdefault(e.control, []).append(e.x)
+        await asyncio.sleep(0)
+
+    all_card = add_card(on_gesture_move=on_move)
+    latest_card = add_card(
+        on_gesture_move=on_move, gesture_dispatch=GestureDispatch.LATEST
+    )
+    headless.dispatch(moves(headless, all_card, 50))
+    headless.dispatch(moves(headless, latest_card, 50))
+
+    assert sorted(received[all_card]) == list(range(50))
+    latest = received[latest_card]
+    assert len(latest) < 50
+    assert latest[0] == 0 and latest[-1] == 49
+    assert latest == sorted(latest)
+
+
+def test_latest_dispatch_keeps_leave_events(headless, add_card):
+    received = []
+
+    async def on_event(e):
+        received.append(e.name)
+        await asyncio.sleep(0)
+
+    card = add_card(
+        on_gesture_move=on_event,
+        on_gesture_leave=on_event,
+        gesture_dispatch=GestureDispatch.LATEST,
+    )
+    events = moves(headless, card, 10)
+    events.append(headless.event(card, "gesture_leave", '[9,0,0,"touch"]'))
+    headless.dispatch(events)
+    assert received[-1] == "gesture_leave"
+    assert received.count("gesture_leave") == 1
+
+
+def finish_threads(headless):
+    # Page.run_thread starts the handler from a loop callback
+    headless.loop.run_until_complete(asyncio.sleep(0))
+    headless.executor.shutdown(wait=True)
+
+
+@pytest.mark.parametrize("dispatch", list(GestureDispatch))
+def test_sync_handlers_see_the_session_page(headless, add_card, dispatch):
+    pages = []
+    card = add_card(
+        on_gesture_move=lambda e: pages.append(ft.context.page),
+        gesture_dispatch=dispatch,
+    )
+    headless.dispatch(moves(headless, card, 1))
+    finish_threads(headless)
+    assert pages == [headless.page]
+
+
+@pytest.mark.parametrize("dispatch", list(GestureDispatch))
+@pytest.mark.parametrize("is_async", [False, True])
+def test_handler_errors_are_logged(headless, add_card, caplog, dispatch, is_async):
+    received = []
+
+    def on_move(e):
+        received.append(e.x)
+        raise RuntimeError("boom")
+
+    async def on_move_async(e):
+        on_move(e)
+
+    card = add_card(
+        on_gesture_move=on_move_async if is_async else on_move,
+        gesture_dispatch=dispatch,
+    )
+    for event in moves(headless, card, 2):
+        headless.dispatch([event])
+    finish_threads(headless)
+
+    assert sorted(received) == [0, 1]
+    errors = [r for r in caplog.records if r.message == "Error in gesture_move handler"]
+    assert len(errors) == 2
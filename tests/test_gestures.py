@@ -0,0 +1,145 @@
+import json
+
+from flet_tilt import GesturesType
+
+
+def send(headless, card, name, *data):
+    headless.dispatch([headless.event(card, name, d) for d in data])
+
+
+def test_classic_move_is_decoded(headless, add_card):
+    received = []
+
+    async def on_move(e):
+        received.append(e)
+
+    card = add_card(on_gesture_move=on_move)
+    send(headless, card, "gesture_move", '[10.5,20,3.5,"touch"]')
+
+    (e,) = received
+    assert (e.x, e.y, e.angle, e.gestures_type) == (10.5, 20, 3.5, GesturesType.TOUCH)
+
+
+def test_batch_event_is_decoded(headless, add_card):
+    received = []
+
+    async def on_batch(e):
+        received.append(e)
+
+    card = add_card(on_gesture_move_batch=on_batch, gesture_batch_window_ms=50)
+    data = json.dumps(
+        {"t": "touch", "ts": [0, 8, 16], "x": [1, 2, 3], "y": [4, 5, 6], "a": [0, 1, 2]}
+    )
+    send(headless, card, "gesture_move_batch", data)
+
+    (e,) = received
+    assert len(e) == 3
+    assert list(e.timestamps) == [0, 8, 16]
+    assert (list(e.x), list(e.y), list(e.angle)) == ([1, 2, 3], [4, 5, 6], [0, 1, 2])
+    assert e.gestures_type is GesturesType.TOUCH
+
+
+def test_state_mirrors_moves_and_leave(headless, add_card):
+    card = add_card()
+    assert card.state.updated_at is None
+
+    send(headless, card, "gesture_move", '[10.5,20,3.5,"touch"]')
+    state = card.state
+    assert (state.x, state.y, state.angle) == (10.5, 20, 3.5)
+    assert state.gestures_type is GesturesType.TOUCH
+    assert state.active
+
+    send(headless, card, "gesture_leave", '[10.5,20,0,"touch"]')
+    assert not card.state.active
+    assert state.active
+
+
+def test_state_mirrors_tracked_state(headless, add_card):
+    card = add_card(track_state=True)
+    send(headless, card, "state", '[1,2,3,"hover",1]')
+    assert (card.state.x, card.state.y, card.state.angle) == (1, 2, 3)
+    assert card.state.active
+
+
+def test_quantized_moves_apply_deltas(headless, add_card):
+    received = []
+
+    async def on_move(e):
+        received.append((e.x, e.y, e.angle, e.gestures_type))
+
+    card = add_card(on_gesture_move=on_move, gesture_precision=2)
+    send(
+        headless, card, "gesture_move", '[5,10,20,"hover",2,0.5]', "[1,-1,2]", "[0,3,-1]"
+    )
+    assert received == [
+        (10, 20, 10.0, GesturesType.HOVER),
+        (12, 18, 11.0, GesturesType.HOVER),
+        (12, 24, 10.5, GesturesType.HOVER),
+    ]
+
+
+def test_quantized_delta_without_previous_cell_is_dropped(headless, add_card):
+    received = []
+
+    async def on_move(e):
+        received.append(e)
+
+    card = add_card(on_gesture_move=on_move, gesture_precision=2)
+    send(headless, card, "gesture_move", "[1,1,1]")
+    assert received == []
+
+
+def test_leave_resets_the_quantized_cell(headless, add_card):
+    received = []
+
+    async def on_event(e):
+        received.append(e.name)
+
+    card = add_card(
+        on_gesture_move=on_event, on_gesture_leave=on_event, gesture_precision=2
+    )
+    send(headless, card, "gesture_move", '[5,10,20,"hover",2,0.5]')
+    send(headless, card, "gesture_leave", '[0,0,0,"hover"]')
+    send(headless, card, "gesture_move", "[1,1,1]")
+    assert received == ["gesture_move", "gesture_leave"]
+
+
+def test_visibility_change_is_decoded(headless, add_card):
+    received = []
+
+    async def on_visibility_change(e):
+        received.append((e.visible_fraction, e.visible))
+
+    card = add_card(pause_when_offscreen=True, on_visibility_change=on_visibility_change)
+    assert card._get_attr("onVisibilityChange")
+    send(headless, card, "visibility_change", "0.25", "0")
+    assert received == [(0.25, True), (0.0, False)]
+
+
+def test_fps_change_is_decoded(headless, add_card):
+    received = []
+
+    async def on_fps_change(e):
+        received.append((e.fps, e.effects_reduced))
+
+    card = add_card(fps="auto", on_fps_change=on_fps_change)
+    assert card._get_attr("onFpsChange")
+    send(headless, card, "fps_change", "[30,1]", "[60,0]")
+    assert received == [(30, True), (60, False)]
+
+
+def test_gesture_session_is_decoded(headless, add_card):
+    received = []
+
+    async def on_session(e):
+        received.append(e)
+
+    card = add_card(on_gesture_session=on_session)
+    assert card._get_attr("onGestureSession")
+    send(headless, card, "gesture_session", '["touch",1200,30,250.5,12,6.5,1,2,3,4]')
+
+    (e,) = received
+    assert e.gestures_type is GesturesType.TOUCH
+    assert (e.duration_ms, e.moves, e.path_length) == (1200, 30, 250.5)
+    assert (e.max_angle, e.mean_angle) == (12, 6.5)
+    assert (e.entry_x, e.entry_y, e.exit_x, e.exit_y) == (1, 2, 3, 4)
@@ -0,0 +1,86 @@
+import pytest
+
+from flet_tilt import FletTilt, TiltHeatmap
+
+
+def test_moves_are_binned():
+    heatmap = TiltHeatmap(width=100, height=50, bins=(4, 2), use_numpy=False)
+    heatmap.add(10, 10, angle=2)
+    heatmap.add(99, 49, angle=4)
+    heatmap.add(-5, 500)
+    assert heatmap.histogram() == [
+        [1.0, 0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0, 1.0],
+    ]
+    stats = heatmap.stats
+    assert stats.events == 3
+    assert stats.max_angle == 4
+    assert stats.mean_angle == 2
+
+
+def test_normalized_histogram_sums_to_one():
+    heatmap = TiltHeatmap(width=10, height=10, bins=2, use_numpy=False)
+    heatmap.add(1, 1)
+    heatmap.add(1, 1)
+    heatmap.add(9, 9)
+    rows = heatmap.histogram(normalize=True)
+    assert sum(map(sum, rows)) == pytest.approx(1.0)
+    assert rows[0][0] == pytest.approx(2 / 3)
+
+
+def test_old_moves_decay():
+    heatmap = TiltHeatmap(width=10, height=10, bins=2, half_life=1, use_numpy=False)
+    heatmap.add(1, 1, t=0)
+    heatmap.add(9, 9, t=1)
+    rows = heatmap.histogram(t=1)
+    assert rows[0][0] == pytest.approx(0.5)
+    assert rows[1][1] == pytest.approx(1.0)
+    assert heatmap.histogram(t=3)[1][1] == pytest.approx(0.25)
+
+
+def test_weights_are_rescaled_before_overflow():
+    heatmap = TiltHeatmap(width=10, height=10, bins=2, half_life=1, use_numpy=False)
+    heatmap.add(1, 1, t=0)
+    heatmap.add(1, 1, t=1)
+    heatmap.add(9, 9, t=1000)
+    rows = heatmap.histogram(t=1000)
+    assert rows[1][1] == pytest.approx(1.0)
+    assert rows[0][0] == pytest.approx(0.0)
+    assert sum(map(sum, heatmap.histogram(normalize=True, t=1000))) == pytest.approx(1)
+
+
+def test_sessions_and_dwell():
+    heatmap = TiltHeatmap(width=10, height=10, use_numpy=False)
+    heatmap.add(1, 1, t=10)
+    heatmap.add(2, 2, t=11)
+    heatmap.end_session(t=12.5)
+    heatmap.add(3, 3, t=20)
+    heatmap.end_session(t=21)
+    assert heatmap.stats.sessions == 2
+    assert heatmap.stats.dwell_seconds == pytest.approx(3.5)
+
+
+def test_attach_uses_control_size():
+    heatmap = TiltHeatmap(use_numpy=False)
+    heatmap.attach(FletTilt(width=300, height=200))
+    assert (heatmap.width, heatmap.height) == (300, 200)
+    heatmap.attach(FletTilt(width=300, height=200))
+    with pytest.raises(ValueError):
+        heatmap.attach(FletTilt(width=100, height=100))
+
+
+def test_attach_needs_a_size():
+    with pytest.raises(ValueError):
+        TiltHeatmap(use_numpy=False).attach(FletTilt())
+
+
+def test_attached_control_is_observed(headless, add_card):
+    card = add_card(width=100, height=100)
+    heatmap = TiltHeatmap(bins=2, use_numpy=False)
+    heatmap.attach(card)
+    headless.dispatch([headless.event(card, "gesture_move", '[80,20,5,"touch"]')])
+    assert heatmap.histogram() == [[0.0, 1.0], [0.0, 0.0]]
+
+    heatmap.detach(card)
+    headless.dispatch([headless.event(card, "gesture_move", '[80,20,5,"touch"]')])
+    assert heatmap.stats.events == 1
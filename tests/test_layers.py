@@ -0,0 +1,43 @@
+import flet as ft
+
+from flet_tilt import FletTilt
+
+
+def layer(control: ft.Control):
+    return control._get_attr("n")
+
+
+def test_layer_controls_are_tagged():
+    outer, inner, behind = ft.Text("o"), ft.Text("i"), ft.Text("b")
+    child = ft.Text("child")
+    card = FletTilt(
+        child=child,
+        child_layout_outer=[outer],
+        child_layout_inner=[inner],
+        child_layout_behind=[behind],
+    )
+    assert card._get_children() == [child, outer, inner, behind]
+    assert layer(outer) == "child_layout_outer"
+    assert layer(inner) == "child_layout_inner"
+    assert layer(behind) == "child_layout_behind"
+    assert not layer(child)
+
+
+def test_moved_control_is_tagged_again():
+    text = ft.Text("t")
+    card = FletTilt(child_layout_outer=[text])
+    card._get_children()
+    card.child_layout_outer = None
+    card.child_layout_behind = [text]
+    card._get_children()
+    assert layer(text) == "child_layout_behind"
+
+
+def test_control_moved_to_child_loses_its_tag():
+    text = ft.Text("t")
+    card = FletTilt(child_layout_inner=[text])
+    card._get_children()
+    card.child_layout_inner = None
+    card.child = text
+    assert card._get_children() == [text]
+    assert not layer(text)
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from flet_tilt import TiltMetrics, TiltMetricsAggregator
+
+
+def payload(**overrides) -> str:
+    d = {
+        "rebuilds": 3,
+        "config_decodes": 2,
+        "config_decode_us": 1500,
+        "events_emitted": 40,
+        "events_dropped": 10,
+        "bytes_sent": 800,
+        "fps": 60,
+        "uptime_ms": 5000,
+    }
+    d.update(overrides)
+    return json.dumps(d)
+
+
+def test_metrics_are_decoded():
+    metrics = TiltMetrics.from_json(payload())
+    assert metrics.rebuilds == 3
+    assert metrics.config_decode_ms == pytest.approx(1.5)
+    assert metrics.events_dropped == 10
+    assert isinstance(metrics.fps, float)
+
+
+def test_metrics_add_up():
+    total = TiltMetrics.from_json(payload()) + TiltMetrics.from_json(
+        payload(bytes_sent=200, uptime_ms=9000)
+    )
+    assert total.bytes_sent == 1000
+    assert total.fps == 120
+    assert total.uptime_ms == 9000
+
+
+def test_metrics_event_feeds_the_aggregator(headless, add_card):
+    aggregator = TiltMetricsAggregator()
+
+    async def on_metrics(e):
+        aggregator.update(e)
+
+    cards = [
+        add_card(metrics_interval_ms=1000, on_metrics=on_metrics)
+        for _ in range(3)
+    ]
+    assert cards[0]._get_attr("onMetrics")
+    for i, card in enumerate(cards):
+        headless.dispatch(
+            [headless.event(card, "metrics", payload(bytes_sent=100 * (i + 1)))]
+        )
+
+    assert len(aggregator) == 3
+    assert aggregator.total().bytes_sent == 600
+    assert aggregator.total(cards[:2]).bytes_sent == 300
+    assert [c for c, _ in aggregator.top(2)] == [cards[2], cards[1]]
+    assert aggregator.by_page()[headless.page].events_emitted == 120
+
+    aggregator.remove(cards[0])
+    assert len(aggregator) == 2
@@ -0,0 +1,106 @@
+import asyncio
+import io
+
+import pytest
+
+from flet_tilt import (
+    GestureRecord,
+    GestureRecorder,
+    GestureReplayer,
+    GesturesType,
+    read_recording,
+)
+
+
+def test_record_and_replay(headless, add_card):
+    card = add_card()
+    buffer = io.BytesIO()
+    with GestureRecorder(buffer) as recorder:
+        recorder.attach(card, "card")
+        headless.dispatch(
+            [headless.event(card, "gesture_move", '[1.5,2,3,"touch"]')]
+        )
+        headless.dispatch(
+            [headless.event(card, "gesture_move", '[4,5,6.25,"hover"]')]
+        )
+        headless.dispatch(
+            [headless.event(card, "gesture_leave", '[4,5,0,"hover"]')]
+        )
+    assert recorder.count == 3
+
+    records = read_recording(io.BytesIO(buffer.getvalue()))
+    assert [(r.control, r.name, r.x, r.y, r.angle, r.gestures_type) for r in records] == [
+        ("card", "gesture_move", 1.5, 2, 3, GesturesType.TOUCH),
+        ("card", "gesture_move", 4, 5, 6.25, GesturesType.HOVER),
+        ("card", "gesture_leave", 4, 5, 0, GesturesType.HOVER),
+    ]
+    assert records == sorted(records, key=lambda r: r.timestamp_ms)
+
+    received = []
+
+    async def on_event(e):
+        received.append((e.name, e.x, e.y, e.angle, e.gestures_type))
+
+    target = add_card(on_gesture_move=on_event, on_gesture_leave=on_event)
+    replayer = GestureReplayer(records)
+    assert replayer.names == ["card"]
+    stats = replayer.replay(headless.page, [target], speed=None)
+    assert stats.events == 3
+    assert received == [(r.name, r.x, r.y, r.angle, r.gestures_type) for r in records]
+
+
+def test_replay_skips_unmapped_controls(headless, add_card):
+    records = [
+        GestureRecord(0, "a", "gesture_move", 1, 2, 3, GesturesType.TOUCH),
+        GestureRecord(5, "b", "gesture_move", 4, 5, 6, GesturesType.TOUCH),
+    ]
+    received = []
+
+    async def on_move(e):
+        received.append(e.x)
+
+    card = add_card(on_gesture_move=on_move)
+    stats = GestureReplayer(records).replay(headless.page, {"b": card}, speed=None)
+    assert stats.events == 1
+    assert received == [4]
+
+
+def test_replay_overlaps_handlers(headless, add_card):
+    records = [
+        GestureRecord(0, "a", "gesture_move", i, 0, 0, GesturesType.TOUCH)
+        for i in range(3)
+    ]
+    running = []
+    peak = []
+
+    async def on_move(e):
+        running.append(e)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(e)
+
+    card = add_card(on_gesture_move=on_move)
+    GestureReplayer(records).replay(headless.page, [card], speed=None)
+    assert max(peak) == 3
+
+
+def test_observers_see_every_move(headless, add_card):
+    seen = []
+    card = add_card()
+    card._add_gesture_observer(seen.append)
+    headless.dispatch(
+        [
+            headless.event(card, "gesture_move", f'[{i},0,0,"touch"]')
+            for i in range(5)
+        ]
+    )
+    assert sorted(e.x for e in seen) == list(range(5))
+
+    card._remove_gesture_observer(seen.append)
+    headless.dispatch([headless.event(card, "gesture_move", '[9,0,0,"touch"]')])
+    assert len(seen) == 5
+
+
+def test_invalid_recording_is_rejected():
+    with pytest.raises(ValueError):
+        read_recording(io.BytesIO(b"NOPE\x01"))
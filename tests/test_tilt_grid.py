@@ -0,0 +1,80 @@
+import flet as ft
+from flet.core.control_event import ControlEvent
+
+from flet_tilt import TiltConfig, TiltGrid
+
+
+def scroll(headless, grid: TiltGrid, first: int, last: int):
+    handler = grid.event_handlers["range_change"]
+    handler(
+        ControlEvent(grid.uid, "range_change", f"{first},{last}", grid, headless.page)
+    )
+
+
+def cards(grid: TiltGrid):
+    return {
+        c._get_attr("gridIndex", data_type="int"): c
+        for c in grid._get_children()
+    }
+
+
+def test_only_visible_range_is_materialized(headless):
+    built = []
+
+    def build(index):
+        built.append(index)
+        return ft.Text(str(index))
+
+    grid = TiltGrid(item_count=1000, item_builder=build, overscan=2)
+    headless.page.add(grid)
+    built.clear()
+
+    scroll(headless, grid, 100, 105)
+    assert sorted(cards(grid)) == list(range(98, 108))
+    assert sorted(built) == list(range(98, 108))
+
+
+def test_cards_are_recycled(headless):
+    grid = TiltGrid(
+        item_count=1000,
+        item_builder=lambda i: ft.Text(str(i)),
+        overscan=0,
+        tilt_config=TiltConfig(angle=5),
+    )
+    headless.page.add(grid)
+    scroll(headless, grid, 0, 9)
+    before = set(map(id, grid._get_children()))
+
+    scroll(headless, grid, 500, 509)
+    after = cards(grid)
+    assert sorted(after) == list(range(500, 510))
+    assert set(map(id, after.values())) == before
+    assert [c.child.value for _, c in sorted(after.items())] == [
+        str(i) for i in range(500, 510)
+    ]
+    assert all(c.tilt_config is TiltConfig(angle=5) for c in after.values())
+
+
+def test_same_range_is_not_rebuilt(headless):
+    built = []
+    grid = TiltGrid(
+        item_count=100, item_builder=lambda i: built.append(i) or ft.Text(""), overscan=0
+    )
+    headless.page.add(grid)
+    built.clear()
+    scroll(headless, grid, 50, 54)
+    scroll(headless, grid, 50, 54)
+    scroll(headless, grid, 51, 55)
+    assert built == [50, 51, 52, 53, 54, 55]
+
+
+def test_initial_window_is_built_before_the_first_range(headless):
+    grid = TiltGrid(
+        item_count=100, item_builder=lambda i: ft.Text(str(i)), initial_count=6
+    )
+    headless.page.add(grid)
+    assert sorted(cards(grid)) == list(range(6))
+
+    short = TiltGrid(item_count=3, item_builder=lambda i: ft.Text(str(i)))
+    headless.page.add(short)
+    assert sorted(cards(short)) == [0, 1, 2]